@@ -1,7 +1,13 @@
 """Utilities for working with EVM data in polars"""
 
 from . import namespaces
+from ._helpers.address_dictionary import AddressDictionary
 from ._helpers.formatting import set_column_display_width
+from ._helpers.hashes import (
+    clear_keccak_cache,
+    keccak_cache_info,
+    set_keccak_cache_size,
+)
 from ._helpers import serialize_expr_dict, deserialize_expr_dict
 
 
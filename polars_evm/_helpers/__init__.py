@@ -1,6 +1,16 @@
+from .abi_hashes import *
+from .address_dictionary import *
+from .amounts import *
+from .contract_addresses import *
 from .conversions import *
 from .decoding import *
+from .eip712 import *
+from .ens import *
 from .filtering import *
+from .fingerprints import *
 from .formatting import *
 from .hashes import *
+from .limbs import *
+from .merkle import *
 from .serde import *
+from .storage_slots import *
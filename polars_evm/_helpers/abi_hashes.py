@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import functools
+import operator
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    from .hashes import KeccakOutput
+
+    _NDArray = np.ndarray[typing.Any, typing.Any]
+
+
+def keccak_packed_series(
+    columns: typing.Sequence[pl.Series],
+    types: typing.Sequence[str],
+    output: KeccakOutput = 'hex',
+) -> pl.Series:
+    """
+    keccak(abi.encodePacked(...)) of each row of several columns
+
+    values use their minimal width: uintN and intN take N / 8 bytes, address
+    20 bytes, bool 1 byte, and string and bytes are unpadded. elements of
+    arrays are padded to 32 bytes. rows with null or invalid values are null
+    """
+    from .conversions.binary_numpy_conversions import _numpy_to_binary_series
+    from .storage_slots import _key_words
+
+    _check_columns(columns, types)
+    parts = []
+    for column, abi_type in zip(columns, types):
+        if abi_type in ('string', 'bytes'):
+            part = _dynamic_bytes(column, abi_type)
+        elif abi_type.endswith(']'):
+            part = _array_bytes(column, abi_type)
+        else:
+            words, valid = _key_words(column, abi_type)
+            width = _packed_width(abi_type)
+            if abi_type.startswith('bytes'):
+                words = words[:, :width]
+            else:
+                words = words[:, 32 - width :]
+            part = _numpy_to_binary_series('', words, valid)
+        parts.append(part)
+    return _hash_parts(columns[0].name, parts, output)
+
+
+def keccak_packed_expr(
+    exprs: typing.Sequence[pl.Expr],
+    types: typing.Sequence[str],
+    output: KeccakOutput = 'hex',
+) -> pl.Expr:
+    """keccak(abi.encodePacked(...)) of each row of several columns"""
+    return _map_columns(keccak_packed_series, exprs, types, output)
+
+
+def keccak_encoded_series(
+    columns: typing.Sequence[pl.Series],
+    types: typing.Sequence[str],
+    output: KeccakOutput = 'hex',
+) -> pl.Series:
+    """
+    keccak(abi.encode(...)) of each row of several columns
+
+    static values are 32 byte words, and fixed size arrays are inlined.
+    string, bytes, and dynamic arrays of static types are encoded as offsets
+    into the tail. rows with null or invalid values are null
+    """
+    import polars as pl
+
+    from .conversions.binary_numpy_conversions import _numpy_to_binary_series
+    from .storage_slots import _key_words
+
+    _check_columns(columns, types)
+    heads: list[pl.Series | None] = []
+    tails: list[pl.Series] = []
+    for column, abi_type in zip(columns, types):
+        if abi_type in ('string', 'bytes'):
+            data = _dynamic_bytes(column, abi_type)
+            n_elements = data.bin.size()
+            data = _pad_right(data)
+        elif abi_type.endswith('[]'):
+            data = _array_bytes(column, abi_type)
+            n_elements = data.bin.size() // 32
+        elif abi_type.endswith(']'):
+            heads.append(_array_bytes(column, abi_type))
+            continue
+        else:
+            words, valid = _key_words(column, abi_type)
+            heads.append(_numpy_to_binary_series('', words, valid))
+            continue
+
+        # dynamic values are a length word and the padded data in the tail
+        heads.append(None)
+        tails.append(_int_word_series(n_elements) + data)
+
+    # head offsets of dynamic values point into the tail of each row
+    head_size = sum(_head_size(abi_type) for abi_type in types)
+    offset = pl.Series([head_size], dtype=pl.Int64)
+    remaining_tails = iter(tails)
+    parts = []
+    for head in heads:
+        if head is None:
+            parts.append(_int_word_series(offset))
+            offset = offset + next(remaining_tails).bin.size()
+        else:
+            parts.append(head)
+    return _hash_parts(columns[0].name, parts + tails, output)
+
+
+def keccak_encoded_expr(
+    exprs: typing.Sequence[pl.Expr],
+    types: typing.Sequence[str],
+    output: KeccakOutput = 'hex',
+) -> pl.Expr:
+    """keccak(abi.encode(...)) of each row of several columns"""
+    return _map_columns(keccak_encoded_series, exprs, types, output)
+
+
+#
+# # helpers
+#
+
+
+def _map_columns(
+    function: typing.Callable[..., pl.Series],
+    exprs: typing.Sequence[pl.Expr],
+    types: typing.Sequence[str],
+    output: KeccakOutput,
+) -> pl.Expr:
+    import polars as pl
+
+    if len(exprs) != len(types):
+        raise Exception('must specify one abi type per column')
+    for abi_type in types:
+        _check_abi_type(abi_type)
+    return pl.map_batches(
+        exprs,
+        lambda columns: function(columns, types, output),
+        return_dtype=pl.Binary if output == 'binary' else pl.String,
+        is_elementwise=True,
+    )
+
+
+def _check_abi_type(abi_type: str) -> None:
+    from .storage_slots import _check_key_type
+
+    if abi_type.endswith(']'):
+        element_type = abi_type.rsplit('[', maxsplit=1)[0]
+        if element_type in ('string', 'bytes') or element_type.endswith(']'):
+            raise Exception('arrays must have static elements: ' + abi_type)
+        abi_type = element_type
+    _check_key_type(abi_type)
+
+
+def _check_columns(
+    columns: typing.Sequence[pl.Series], types: typing.Sequence[str]
+) -> None:
+    """check types, columns must be single values or have equal lengths"""
+    if len(columns) == 0:
+        raise Exception('must specify at least one column')
+    if len(columns) != len(types):
+        raise Exception('must specify one abi type per column')
+    for abi_type in types:
+        _check_abi_type(abi_type)
+    lengths = {len(column) for column in columns} - {1}
+    if len(lengths) > 1:
+        raise Exception('columns must be single values or have equal lengths')
+
+
+def _head_size(abi_type: str) -> int:
+    """bytes taken by a value in the head of an abi encoding"""
+    if abi_type.endswith(']') and not abi_type.endswith('[]'):
+        return 32 * int(abi_type[:-1].rsplit('[', maxsplit=1)[1])
+    else:
+        return 32
+
+
+def _packed_width(abi_type: str) -> int:
+    from .storage_slots import _parse_static_key_type
+
+    if abi_type == 'address':
+        return 20
+    elif abi_type == 'bool':
+        return 1
+    parsed = _parse_static_key_type(abi_type)
+    if parsed is None:
+        raise Exception('invalid abi type: ' + abi_type)
+    return parsed[1] // 8
+
+
+def _dynamic_bytes(column: pl.Series, abi_type: str) -> pl.Series:
+    """binary values of string and bytes columns"""
+    import polars as pl
+
+    from .conversions import hex_series_to_binary
+
+    if column.dtype == pl.String:
+        if abi_type == 'string':
+            return column.cast(pl.Binary)
+        else:
+            return hex_series_to_binary(column)
+    elif column.dtype != pl.Binary:
+        raise Exception(
+            'invalid dtype for ' + abi_type + ': ' + str(column.dtype)
+        )
+    return column
+
+
+def _array_bytes(column: pl.Series, abi_type: str) -> pl.Series:
+    """32 byte words of the elements of each array, concatenated"""
+    import numpy as np
+    import polars as pl
+
+    from .conversions.binary_numpy_conversions import _buffers_to_binary_series
+    from .storage_slots import _key_words
+
+    element_type, size = abi_type[:-1].rsplit('[', maxsplit=1)
+    if isinstance(column.dtype, pl.Array):
+        column = column.arr.to_list()
+    if not isinstance(column.dtype, pl.List):
+        raise Exception(
+            'invalid dtype for ' + abi_type + ': ' + str(column.dtype)
+        )
+
+    lengths = column.list.len().fill_null(0).to_numpy().astype(np.int64)
+    elements = column.explode(empty_as_null=False, keep_nulls=False)
+    words, element_valid = _key_words(elements, element_type)
+    valid = column.is_not_null().to_numpy()
+    valid[np.repeat(np.arange(len(column)), lengths)[~element_valid]] = False
+    if size != '':
+        valid &= lengths == int(size)
+
+    offsets = np.concatenate([[0], np.cumsum(lengths * 32)])
+    return _buffers_to_binary_series('', words.reshape(-1), offsets, valid)
+
+
+def _pad_right(series: pl.Series) -> pl.Series:
+    """right pad binary values with zeros to a multiple of 32 bytes"""
+    import polars as pl
+
+    padding = (32 - pl.col.value.bin.size() % 32) % 32
+    return series.to_frame('value').select(
+        pl.col.value + pl.lit(bytes(32)).bin.slice(0, padding)
+    )['value']
+
+
+def _int_word_series(values: pl.Series) -> pl.Series:
+    """32 byte big-endian words of non-negative integers"""
+    import numpy as np
+
+    from .conversions.binary_numpy_conversions import _numpy_to_binary_series
+
+    valid = values.is_not_null().to_numpy()
+    ints = values.fill_null(0).to_numpy().astype('>u8')
+    words = np.zeros((len(values), 32), dtype=np.uint8)
+    words[:, 24:] = ints.reshape(-1, 1).view(np.uint8)
+    return _numpy_to_binary_series('', words, valid)
+
+
+def _hash_parts(
+    name: str, parts: list[pl.Series], output: KeccakOutput
+) -> pl.Series:
+    """
+    concatenate the binary parts of each row and hash all rows in one batch
+
+    parts are single values or one value per row, null parts give null rows
+    """
+    import polars as pl
+
+    from .conversions import binary_series_to_hex
+    from .hashes import _keccak_deduplicated
+
+    if output not in ('hex', 'binary', 'prefix_hex', 'raw_hex'):
+        raise Exception('unknown output format: ' + str(output))
+
+    preimages = pl.select(
+        functools.reduce(operator.add, [pl.lit(part) for part in parts])
+    ).to_series()
+    hashes = _keccak_deduplicated(preimages).alias(name)
+    if output == 'binary':
+        return hashes
+    else:
+        return binary_series_to_hex(hashes, prefix=output != 'raw_hex')
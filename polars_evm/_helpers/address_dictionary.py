@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+
+class AddressDictionary:
+    """
+    stable UInt32 ids for 20 byte addresses
+
+    ids are assigned in order of first appearance and never change, so
+    dictionaries can be extended incrementally and persisted across runs
+    """
+
+    def __init__(self, addresses: pl.Series | None = None) -> None:
+        import polars as pl
+
+        self._table = pl.DataFrame(
+            schema={'address': pl.Binary, 'id': pl.UInt32}
+        )
+        if addresses is not None:
+            self.extend(addresses)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    @property
+    def table(self) -> pl.DataFrame:
+        """dataframe of address and id columns, sorted by id"""
+        return self._table
+
+    @classmethod
+    def read(cls, path: str) -> AddressDictionary:
+        """read dictionary from a parquet or arrow ipc file"""
+        import polars as pl
+
+        file_format = _get_file_format(path)
+        if file_format == 'parquet':
+            table = pl.read_parquet(path)
+        else:
+            table = pl.read_ipc(path)
+        table = table.select(
+            pl.col.address.cast(pl.Binary), pl.col.id.cast(pl.UInt32)
+        ).sort('id')
+        if not table['id'].equals(
+            pl.int_range(len(table), dtype=pl.UInt32, eager=True).alias('id')
+        ):
+            raise Exception('ids must be consecutive integers starting at 0')
+        if table['address'].n_unique() != len(table):
+            raise Exception('addresses must be unique')
+
+        dictionary = cls()
+        dictionary._table = table
+        return dictionary
+
+    def write(self, path: str) -> None:
+        """write dictionary to a parquet or arrow ipc file"""
+        file_format = _get_file_format(path)
+        if file_format == 'parquet':
+            self._table.write_parquet(path)
+        else:
+            self._table.write_ipc(path)
+
+    def extend(self, addresses: pl.Series) -> None:
+        """assign ids to addresses that are not yet in the dictionary"""
+        import polars as pl
+
+        if addresses.dtype == pl.String:
+            addresses = addresses.str.strip_prefix('0x').str.decode('hex')
+        elif addresses.dtype != pl.Binary:
+            raise Exception(
+                'invalid dtype for addresses: ' + str(addresses.dtype)
+            )
+        new = (
+            addresses.drop_nulls()
+            .unique(maintain_order=True)
+            .to_frame('address')
+            .join(self._table, on='address', how='anti')
+        )
+        if len(new) == 0:
+            return
+        if not (new['address'].bin.size() == 20).all():
+            raise Exception('addresses must be 20 bytes')
+        if len(self._table) + len(new) > 2**32:
+            raise Exception('too many addresses for UInt32 ids')
+
+        ids = pl.int_range(len(new), dtype=pl.UInt32) + len(self._table)
+        new = new.with_columns(id=ids)
+        self._table = pl.concat([self._table, new], rechunk=True)
+
+    def intern_expr(self, expr: pl.Expr) -> pl.Expr:
+        """
+        map pl.Binary addresses to ids, unknown addresses are null
+
+        the dictionary is read when the expression runs, so addresses added
+        by extend() after building the expression are mapped too
+        """
+        import polars as pl
+
+        return expr.map_batches(
+            self._intern_series, return_dtype=pl.UInt32, is_elementwise=True
+        )
+
+    def resolve_expr(self, expr: pl.Expr) -> pl.Expr:
+        """
+        map ids to pl.Binary addresses, unknown ids are null
+
+        like intern_expr, the dictionary is read when the expression runs
+        """
+        import polars as pl
+
+        return expr.map_batches(
+            self._resolve_series, return_dtype=pl.Binary, is_elementwise=True
+        )
+
+    def _intern_series(self, series: pl.Series) -> pl.Series:
+        import polars as pl
+
+        table = self._table
+        return series.replace_strict(
+            table['address'],
+            table['id'],
+            default=None,
+            return_dtype=pl.UInt32,
+        )
+
+    def _resolve_series(self, series: pl.Series) -> pl.Series:
+        import polars as pl
+
+        # ids are row numbers of the table, so lookup is a gather
+        addresses = self._table['address']
+        ids = pl.lit(series)
+        valid_ids = pl.when(ids < len(addresses)).then(ids)
+        return (
+            pl.select(pl.lit(addresses).gather(valid_ids))
+            .to_series()
+            .alias(series.name)
+        )
+
+
+def intern_addresses_series(
+    series: pl.Series, dictionary: AddressDictionary, *, extend: bool = False
+) -> pl.Series:
+    import polars as pl
+
+    if series.dtype == pl.String:
+        series = series.str.strip_prefix('0x').str.decode('hex')
+    if extend:
+        dictionary.extend(series)
+    return (
+        series.to_frame('address')
+        .select(dictionary.intern_expr(pl.col.address))
+        .to_series()
+        .alias(series.name)
+    )
+
+
+def resolve_ids_series(
+    series: pl.Series, dictionary: AddressDictionary
+) -> pl.Series:
+    import polars as pl
+
+    return (
+        series.to_frame('id')
+        .select(dictionary.resolve_expr(pl.col.id))
+        .to_series()
+        .alias(series.name)
+    )
+
+
+def _get_file_format(path: str) -> typing.Literal['parquet', 'ipc']:
+    if path.endswith('.parquet'):
+        return 'parquet'
+    elif path.endswith(('.arrow', '.ipc', '.feather')):
+        return 'ipc'
+    else:
+        raise Exception('path must end with .parquet, .arrow, or .ipc')
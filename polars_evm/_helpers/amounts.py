@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+    _T = typing.TypeVar('_T', pl.DataFrame, pl.LazyFrame)
+
+    AmountOutput = typing.Literal['decimal', 'float']
+
+
+# pl.Decimal is backed by 128 bit integers, which hold 38 full digits
+_max_precision = 38
+
+
+def scale_amount(
+    expr: pl.Expr,
+    decimals: pl.Expr | int,
+    *,
+    signed: bool = False,
+    scale: int = 18,
+    output: AmountOutput = 'decimal',
+) -> pl.Expr:
+    """
+    divide raw token amounts by 10**decimals, where decimals can vary by row
+
+    see scale_amount_series() for accepted dtypes
+    """
+    import polars as pl
+
+    _check_output(output, scale)
+    if isinstance(decimals, int):
+        decimals = pl.lit(decimals)
+    scaled = pl.struct(
+        expr.alias('amount'), decimals.alias('decimals')
+    ).map_batches(
+        functools.partial(
+            _scale_amount_struct, signed=signed, scale=scale, output=output
+        ),
+        return_dtype=_get_output_dtype(output, scale),
+        is_elementwise=True,
+    )
+    name = expr.meta.output_name(raise_if_undetermined=False)
+    if name is not None:
+        scaled = scaled.alias(name)
+    return scaled
+
+
+def scale_amount_series(
+    amounts: pl.Series,
+    decimals: pl.Series | int,
+    *,
+    signed: bool = False,
+    scale: int = 18,
+    output: AmountOutput = 'decimal',
+) -> pl.Series:
+    """
+    divide raw token amounts by 10**decimals, where decimals can vary by row
+
+    amounts can be integers, decimal strings, or 32 byte words. with
+    output='decimal' the result is an exact pl.Decimal(38, scale), and amounts
+    that do not fit in 38 digits become null. output='float' gives f64
+    """
+    import polars as pl
+
+    _check_output(output, scale)
+    df = amounts.to_frame('amount').with_columns(
+        decimals=decimals
+        if isinstance(decimals, pl.Series)
+        else pl.lit(decimals)
+    )
+    amount = pl.col.amount
+    n_decimals = pl.col.decimals.cast(pl.Int64)
+
+    if output == 'float':
+        float_amount = _amount_to_float(amount, amounts.dtype, signed)
+        return df.select(
+            (float_amount / pl.lit(10.0).pow(n_decimals)).alias(amounts.name)
+        )[amounts.name]
+
+    if df.select((n_decimals > scale).any()).item():
+        raise Exception('decimals larger than scale, use a larger scale')
+
+    # shift to the units of the output scale, nulling values over 38 digits
+    raw = _amount_to_int128(amount, amounts.dtype, signed)
+    shift = scale - n_decimals
+    ten = pl.lit(10, dtype=pl.Int128)
+    limit = ten.pow(_max_precision - shift)
+    in_range = (raw < limit) & (raw > pl.lit(0, dtype=pl.Int128) - limit)
+    units = pl.when(in_range).then(raw * ten.pow(shift))
+    units_series = df.select(units.cast(pl.Decimal(_max_precision, 0)))
+    return _decimal_units_to_series(amounts.name, units_series, scale)
+
+
+def normalize_amounts(
+    df: _T,
+    column_tokens: dict[str, str],
+    decimals_table: pl.DataFrame,
+    *,
+    table_token: str = 'address',
+    table_decimals: str = 'decimals',
+    signed: bool = False,
+    scale: int = 18,
+    output: AmountOutput = 'decimal',
+    replace: bool = False,
+) -> _T:
+    """
+    column_tokens in format {'amount_column': 'token_column', ...}
+
+    decimals of each token are looked up in decimals_table, then amounts are
+    scaled with scale_amount()
+    """
+    import polars as pl
+
+    table: typing.Any = decimals_table.select(table_token, table_decimals)
+    if isinstance(df, pl.LazyFrame):
+        table = table.lazy()
+
+    # join decimals once per token column
+    decimals_columns = {}
+    for token_column in set(column_tokens.values()):
+        decimals_column = '__decimals_' + token_column
+        decimals_columns[token_column] = decimals_column
+        right = table.select(
+            pl.col(table_token).alias(token_column),
+            pl.col(table_decimals).alias(decimals_column),
+        )
+        df = df.join(
+            right,
+            on=token_column,
+            how='left',
+            validate='m:1',
+            maintain_order='left',
+        )
+
+    scaled_columns = {}
+    for column, token_column in column_tokens.items():
+        if replace:
+            scaled_name = column
+        else:
+            scaled_name = column + '_normalized'
+        scaled_columns[scaled_name] = scale_amount(
+            pl.col(column),
+            pl.col(decimals_columns[token_column]),
+            signed=signed,
+            scale=scale,
+            output=output,
+        )
+
+    return df.with_columns(**scaled_columns).drop(
+        list(decimals_columns.values())
+    )
+
+
+def _scale_amount_struct(
+    series: pl.Series, *, signed: bool, scale: int, output: AmountOutput
+) -> pl.Series:
+    fields = series.struct.unnest()
+    return scale_amount_series(
+        fields['amount'].alias(series.name),
+        fields['decimals'],
+        signed=signed,
+        scale=scale,
+        output=output,
+    )
+
+
+def _check_output(output: AmountOutput, scale: int) -> None:
+    if output not in ('decimal', 'float'):
+        raise Exception('invalid output: ' + str(output))
+    if output == 'decimal' and not 0 <= scale <= _max_precision:
+        raise Exception('scale must be between 0 and 38')
+
+
+def _get_output_dtype(output: AmountOutput, scale: int) -> pl.DataType:
+    import polars as pl
+
+    if output == 'decimal':
+        return pl.Decimal(_max_precision, scale)
+    else:
+        return pl.Float64()
+
+
+def _amount_to_int128(
+    amount: pl.Expr, dtype: pl.DataType, signed: bool
+) -> pl.Expr:
+    """exact Int128 amounts, null for values outside of the Int128 range"""
+    import polars as pl
+
+    if dtype.is_integer() or dtype == pl.String:
+        return amount.cast(pl.Int128, strict=False)
+    elif dtype == pl.Binary:
+        high = amount.bin.slice(0, 16).bin.reinterpret(
+            dtype=pl.UInt128, endianness='big'
+        )
+        is_word = amount.bin.size() == 32
+        if signed:
+            low = amount.bin.slice(16, 16).bin.reinterpret(
+                dtype=pl.Int128, endianness='big'
+            )
+            is_extended = ((high == 0) & (low >= 0)) | (
+                (high == pl.lit(2**128 - 1, dtype=pl.UInt128)) & (low < 0)
+            )
+            return pl.when(is_word & is_extended).then(low)
+        else:
+            low = amount.bin.slice(16, 16).bin.reinterpret(
+                dtype=pl.UInt128, endianness='big'
+            )
+            return pl.when(is_word & (high == 0)).then(
+                low.cast(pl.Int128, strict=False)
+            )
+    else:
+        raise Exception('invalid amount dtype: ' + str(dtype))
+
+
+def _amount_to_float(
+    amount: pl.Expr, dtype: pl.DataType, signed: bool
+) -> pl.Expr:
+    import polars as pl
+
+    from .conversions import binary_expr_to_float
+
+    if dtype.is_numeric() or dtype == pl.String:
+        return amount.cast(pl.Float64, strict=False)
+    elif dtype == pl.Binary:
+        raw_type = 'i256' if signed else 'u256'
+        return pl.when(amount.bin.size() == 32).then(
+            binary_expr_to_float(amount, raw_type)
+        )
+    else:
+        raise Exception('invalid amount dtype: ' + str(dtype))
+
+
+def _decimal_units_to_series(
+    name: str, units: pl.DataFrame, scale: int
+) -> pl.Series:
+    """reinterpret Decimal(38, 0) units of 10**-scale as Decimal(38, scale)"""
+    import polars as pl
+    import pyarrow as pa  # type: ignore
+
+    array = units.to_series().to_arrow()
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    array = array.view(pa.decimal128(_max_precision, scale))
+    return pl.Series(name, array, dtype=pl.Decimal(_max_precision, scale))
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    _NDArray = np.ndarray[typing.Any, typing.Any]
+
+    Word = typing.Union[bytes, str, pl.Expr]
+    WordSeries = typing.Union[bytes, str, pl.Series]
+
+
+def create_address_series(
+    deployer: pl.Series, nonce: int | pl.Series
+) -> pl.Series:
+    """
+    addresses of contracts deployed with CREATE, keccak(rlp([deployer, nonce]))
+
+    nonces are integers below 2**64. negative nonces and deployers that are
+    not 20 bytes become null
+    """
+    import numpy as np
+    import polars as pl
+
+    from .conversions.binary_numpy_conversions import _numpy_to_binary_series
+    from .hashes import _keccak_numpy_variable
+
+    if isinstance(nonce, int):
+        if nonce < 0 or nonce >= 2**64:
+            raise Exception('nonce must be between 0 and 2**64 - 1')
+        nonce = pl.Series([nonce], dtype=pl.UInt64)
+    n_rows = _get_n_rows(deployer, nonce)
+    deployers, valid = _input_words(deployer, 20, n_rows)
+    if not nonce.dtype.is_integer():
+        raise Exception('invalid dtype for nonce: ' + str(nonce.dtype))
+    nonce = nonce.cast(pl.UInt64, strict=False)
+    nonces = nonce.fill_null(0).to_numpy()
+    valid = valid & _broadcast(nonce.is_not_null().to_numpy(), n_rows)
+    nonces = _broadcast(nonces, n_rows)
+
+    # nonces are rlp encoded as one byte below 0x80, and otherwise as
+    # 0x80 + length followed by the big-endian bytes without leading zeros
+    nonce_bytes = nonces.astype('>u8').reshape(-1, 1).view(np.uint8)
+    n_bytes = np.ones(n_rows, dtype=np.int64)
+    for i in range(1, 8):
+        n_bytes += nonces >= np.uint64(2 ** (8 * i))
+    is_short = nonces < 0x80
+    nonce_length = np.where(is_short, 1, 1 + n_bytes)
+
+    # rlp list of a 20 byte string and the nonce, at most 31 bytes. polars
+    # has no cast of ints to minimal big-endian bytes, so this is assembled
+    # in numpy rather than with binary concatenation of words
+    messages = np.zeros((n_rows, _max_create_length), dtype=np.uint8)
+    messages[:, 0] = 0xC0 + 21 + nonce_length
+    messages[:, 1] = 0x80 + 20
+    messages[:, 2:22] = deployers
+    messages[:, 22] = np.where(
+        is_short, np.where(nonces == 0, 0x80, nonces), 0x80 + n_bytes
+    )
+    for i in range(8):
+        column = 23 + i - (8 - n_bytes)
+        rows = np.flatnonzero(~is_short & (column >= 23))
+        messages[rows, column[rows]] = nonce_bytes[rows, i]
+
+    starts = np.arange(n_rows, dtype=np.int64) * _max_create_length
+    digests = _keccak_numpy_variable(
+        messages.reshape(-1), starts, 22 + nonce_length
+    )
+    return _numpy_to_binary_series(deployer.name, digests[:, 12:], valid)
+
+
+def create_address_expr(deployer: pl.Expr, nonce: int | pl.Expr) -> pl.Expr:
+    """addresses of contracts deployed with CREATE, as 20 byte pl.Binary"""
+    import polars as pl
+
+    if isinstance(nonce, int):
+        if nonce < 0 or nonce >= 2**64:
+            raise Exception('nonce must be between 0 and 2**64 - 1')
+        nonce = pl.lit(nonce, dtype=pl.UInt64)
+    return pl.map_batches(
+        [deployer, nonce],
+        lambda series: create_address_series(series[0], series[1]),
+        return_dtype=pl.Binary,
+        is_elementwise=True,
+    )
+
+
+def create2_address_series(
+    deployer: pl.Series, salt: WordSeries, init_code_hash: WordSeries
+) -> pl.Series:
+    """
+    addresses of contracts deployed with CREATE2
+
+    address is keccak(0xff ++ deployer ++ salt ++ init_code_hash)[12:]. salt
+    and init_code_hash are 32 byte words, given as columns or single values.
+    rows with inputs of the wrong width become null
+    """
+    import polars as pl
+
+    from .hashes import _keccak_binary_series
+
+    n_rows = _get_n_rows(deployer, salt, init_code_hash)
+    inputs = [
+        _input_expr(value, n_rows).alias(name)
+        for name, value in [
+            ('deployer', deployer),
+            ('salt', salt),
+            ('init_code_hash', init_code_hash),
+        ]
+    ]
+    preimages = (
+        pl.select(inputs)
+        .select(
+            pl.when(
+                (pl.col.deployer.bin.size() == 20)
+                & (pl.col.salt.bin.size() == 32)
+                & (pl.col.init_code_hash.bin.size() == 32)
+            ).then(
+                pl.lit(b'\xff')
+                + pl.col.deployer
+                + pl.col.salt
+                + pl.col.init_code_hash
+            )
+        )
+        .to_series()
+    )
+    digests = _keccak_binary_series(preimages)
+    return digests.bin.slice(12).alias(deployer.name)
+
+
+def create2_address_expr(
+    deployer: pl.Expr, salt: Word, init_code_hash: Word
+) -> pl.Expr:
+    """addresses of contracts deployed with CREATE2, as 20 byte pl.Binary"""
+    import polars as pl
+
+    return pl.map_batches(
+        [deployer, _word_lit(salt), _word_lit(init_code_hash)],
+        lambda series: create2_address_series(series[0], series[1], series[2]),
+        return_dtype=pl.Binary,
+        is_elementwise=True,
+    )
+
+
+#
+# # helpers
+#
+
+
+# rlp list prefix, 20 byte string, and a nonce of up to 1 + 8 bytes
+_max_create_length = 1 + 21 + 9
+
+
+def _word_lit(value: Word) -> pl.Expr:
+    import polars as pl
+
+    if isinstance(value, str):
+        value = bytes.fromhex(value.removeprefix('0x'))
+    if isinstance(value, bytes):
+        return pl.lit(value, dtype=pl.Binary)
+    else:
+        return value
+
+
+def _input_words(
+    value: WordSeries, n_bytes: int, n_rows: int
+) -> tuple[_NDArray, _NDArray]:
+    """(n_rows, n_bytes) words of binary or hex input, broadcasting scalars"""
+    import polars as pl
+
+    from .conversions import hex_series_to_binary
+    from .conversions.binary_numpy_conversions import _binary_words
+
+    if isinstance(value, str):
+        value = bytes.fromhex(value.removeprefix('0x'))
+    if isinstance(value, bytes):
+        value = pl.Series([value], dtype=pl.Binary)
+    if value.dtype == pl.String:
+        value = hex_series_to_binary(value)
+    words, valid = _binary_words(value, n_bytes)
+    return _broadcast(words, n_rows), _broadcast(valid, n_rows)
+
+
+def _input_expr(value: WordSeries, n_rows: int) -> pl.Expr:
+    """binary values of hex or binary input, scalars as literals"""
+    import polars as pl
+
+    from .conversions import hex_series_to_binary
+
+    if isinstance(value, str):
+        value = bytes.fromhex(value.removeprefix('0x'))
+    if isinstance(value, pl.Series):
+        if value.dtype == pl.String:
+            value = hex_series_to_binary(value)
+        elif value.dtype != pl.Binary:
+            raise Exception('invalid dtype for words: ' + str(value.dtype))
+        if len(value) != n_rows:
+            value = value[0]
+    return pl.lit(value, dtype=pl.Binary)
+
+
+def _get_n_rows(*values: typing.Any) -> int:
+    """number of output rows, single values are broadcast to the others"""
+    import polars as pl
+
+    lengths = {len(value) for value in values if isinstance(value, pl.Series)}
+    lengths = (lengths - {1}) or {1}
+    if len(lengths) > 1:
+        raise Exception('inputs must be single values or one value per row')
+    return lengths.pop()
+
+
+def _broadcast(values: _NDArray, n_rows: int) -> _NDArray:
+    import numpy as np
+
+    if len(values) == 1 and n_rows != 1:
+        return np.broadcast_to(values, (n_rows, *values.shape[1:]))
+    elif len(values) != n_rows:
+        raise Exception('inputs must be single values or one value per row')
+    return values
@@ -1,2 +1,8 @@
 from .binary_float_conversions import *
 from .binary_hex_conversions import *
+from .binary_fixed_conversions import *
+from .binary_int_conversions import *
+from .binary_numpy_conversions import *
+from .binary_decimal_conversions import *
+from .word_conversions import *
+from .binary_q_conversions import *
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+from .binary_float_conversions import _parse_raw_type
+from .binary_int_conversions import binary_expr_to_int
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+
+# digits produced by each division pass, 10**19 is the largest power of 10
+# below 2**64 so that remainder * 2**64 + limb fits in UInt128
+_chunk_digits = 19
+_n_chunks = 5
+
+
+def binary_series_to_decimal_str(
+    series: pl.Series, signed: bool = False
+) -> pl.Series:
+    """
+    format 32 byte big-endian words as exact base-10 strings
+
+    magnitudes below 2**128 are cast to strings directly as UInt128. the
+    remaining rows are divided by 10**19 across all rows at once, and the
+    19 digit remainders are joined with string ops. values that are null or
+    not 32 bytes become null
+    """
+    import polars as pl
+
+    # split magnitudes into high and low 128 bits
+    word = pl.col.word
+    high = word.bin.slice(0, 16).bin.reinterpret(
+        dtype=pl.UInt128, endianness='big'
+    )
+    low = word.bin.slice(16, 16).bin.reinterpret(
+        dtype=pl.UInt128, endianness='big'
+    )
+    if signed:
+        # negate two's complement values as ~x + 1
+        negative = word >= pl.lit(b'\x80')
+        carry = (low == 0).cast(pl.UInt128)
+        high = pl.when(negative).then(~high + carry).otherwise(high)
+        low = pl.when(negative).then(~low + 1).otherwise(low)
+    else:
+        negative = pl.lit(False)
+    df = pl.DataFrame({'word': series}).select(
+        valid=word.bin.size() == 32,
+        negative=negative,
+        high=high,
+        low=low,
+    )
+
+    # format small magnitudes directly, then fill in large magnitudes
+    digits = df['low'].cast(pl.String)
+    is_large = df.select(pl.col.valid & (pl.col.high != 0)).to_series()
+    if is_large.any():
+        large_digits = _divide_into_decimal_str(df.filter(is_large))
+        digits = digits.scatter(is_large.arg_true(), large_digits)
+
+    # add sign
+    digits_expr = pl.col.digits
+    if signed:
+        digits_expr = (
+            pl.when(pl.col.negative)
+            .then('-' + digits_expr)
+            .otherwise(digits_expr)
+        )
+    return df.with_columns(digits=digits).select(
+        pl.when(pl.col.valid).then(digits_expr).alias(series.name)
+    )[series.name]
+
+
+def binary_expr_to_decimal_str(expr: pl.Expr, signed: bool = False) -> pl.Expr:
+    """format 32 byte big-endian words as exact base-10 strings"""
+    import polars as pl
+
+    return expr.map_batches(
+        functools.partial(binary_series_to_decimal_str, signed=signed),
+        return_dtype=pl.String,
+        is_elementwise=True,
+    )
+
+
+def raw_binary_expr_to_decimal_str(expr: pl.Expr, raw_type: str) -> pl.Expr:
+    """format n_bits / 8 big-endian bytes as exact base-10 strings"""
+    import polars as pl
+
+    signed, n_bits = _parse_raw_type(raw_type)
+    if n_bits <= 128:
+        return binary_expr_to_int(expr, raw_type).cast(pl.String)
+    else:
+        words = binary_expr_to_int(expr, raw_type)
+        return binary_expr_to_decimal_str(words, signed=signed)
+
+
+def scale_decimal_str_expr(expr: pl.Expr, decimals: int) -> pl.Expr:
+    """
+    divide base-10 integer strings by 10**decimals, exactly
+
+    the decimal point is inserted with string operations, so there is no
+    limit on the number of digits. output has exactly decimals fractional
+    digits, as in pl.Decimal formatting
+    """
+    import polars as pl
+
+    if decimals < 0:
+        raise Exception('decimals must be non-negative')
+    if decimals == 0:
+        return expr
+    digits = expr.str.strip_prefix('-').str.zfill(decimals + 1)
+    n_integer = digits.str.len_chars() - decimals
+    sign = (
+        pl.when(expr.str.starts_with('-'))
+        .then(pl.lit('-'))
+        .otherwise(pl.lit(''))
+    )
+    return (
+        sign
+        + digits.str.slice(0, n_integer)
+        + pl.lit('.')
+        + digits.str.slice(n_integer)
+    )
+
+
+def _divide_into_decimal_str(df: pl.DataFrame) -> pl.Series:
+    """long division of 256 bit magnitudes by 10**19, one limb at a time"""
+    import polars as pl
+
+    limb_size = pl.lit(2**64, dtype=pl.UInt128)
+    divisor = pl.lit(10**_chunk_digits, dtype=pl.UInt128)
+
+    # 64 bit limbs, most significant first
+    df = df.select(
+        limb0=pl.col.high // limb_size,
+        limb1=pl.col.high % limb_size,
+        limb2=pl.col.low // limb_size,
+        limb3=pl.col.low % limb_size,
+    )
+    limbs = df.columns
+
+    # each pass divides the whole number, keeping the remainder as a chunk
+    chunks: list[pl.Series] = []
+    for _ in range(_n_chunks):
+        for i, limb in enumerate(limbs):
+            if i == 0:
+                current = pl.col(limb)
+            else:
+                current = pl.col.remainder * limb_size + pl.col(limb)
+            df = df.with_columns(current=current).with_columns(
+                (pl.col.current // divisor).alias(limb),
+                remainder=pl.col.current % divisor,
+            )
+        chunks.append(df['remainder'].alias('chunk' + str(len(chunks))))
+
+    # pair chunks into values below 10**38, which cast directly to strings
+    chunk_size = pl.lit(10**_chunk_digits, dtype=pl.UInt128)
+    top = pl.col.chunk4 * chunk_size + pl.col.chunk3
+    middle = pl.col.chunk2 * chunk_size + pl.col.chunk1
+    bottom = pl.col.chunk0.cast(pl.String).str.zfill(_chunk_digits)
+    return (
+        pl.DataFrame(chunks)
+        .select(
+            pl.when(top == 0)
+            .then(pl.concat_str(middle.cast(pl.String), bottom))
+            .otherwise(
+                pl.concat_str(
+                    top.cast(pl.String),
+                    middle.cast(pl.String).str.zfill(2 * _chunk_digits),
+                    bottom,
+                )
+            )
+        )
+        .to_series()
+    )
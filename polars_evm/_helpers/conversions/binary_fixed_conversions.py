@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+
+def binary_series_to_fixed(series: pl.Series, width: int = 32) -> pl.Series:
+    import polars as pl
+
+    return (
+        series.to_frame()
+        .select(binary_expr_to_fixed(pl.col(series.name), width))
+        .to_series()
+    )
+
+
+def binary_expr_to_fixed(expr: pl.Expr, width: int = 32) -> pl.Expr:
+    """
+    convert pl.Binary values to pl.Array(pl.UInt8, width)
+
+    fixed-width arrays store bytes contiguously without per-row views, and
+    series.to_numpy() returns them as an (n, width) uint8 array. values that
+    are not width bytes become null
+    """
+    import polars as pl
+
+    _check_fixed_width(width)
+    return expr.bin.reinterpret(dtype=pl.Array(pl.UInt8, width))
+
+
+def fixed_series_to_binary(series: pl.Series) -> pl.Series:
+    import polars as pl
+
+    return (
+        series.to_frame()
+        .select(fixed_expr_to_binary(pl.col(series.name)))
+        .to_series()
+    )
+
+
+def fixed_expr_to_binary(expr: pl.Expr) -> pl.Expr:
+    """convert pl.Array(pl.UInt8, width) values back to pl.Binary"""
+    import polars as pl
+
+    return expr.arr.to_list().cast(pl.Binary)
+
+
+def _check_fixed_width(width: int) -> None:
+    if not 1 <= width <= 32:
+        raise Exception('width must be between 1 and 32 bytes')
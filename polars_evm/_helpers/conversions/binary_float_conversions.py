@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import typing
 
 if typing.TYPE_CHECKING:
@@ -12,24 +13,23 @@ def binary_df_to_float(
     df: T,
     column_types: dict[str, str],
     replace: bool = False,
+    method: typing.Literal['expr', 'numpy'] = 'expr',
 ) -> T:
-    """column_types in format {'col1': 'u256', 'col2': 'i128', ...}"""
+    """
+    column_types in format {'col1': 'u256', 'col2': 'i128', ...}
+
+    method='numpy' converts binary columns with a numpy kernel over the arrow
+    buffers of each column instead of a chain of polars expressions
+    """
     import polars as pl
 
-    hex_columns = {}
+    from .binary_numpy_conversions import binary_series_to_float_numpy
+
+    if method not in ('expr', 'numpy'):
+        raise Exception('invalid method: ' + str(method))
+
     float_columns = {}
     for column, raw_type in column_types.items():
-        # decide hex column
-        column_dtype = df.collect_schema().get(column)
-        if column_dtype == pl.Binary:
-            hex_name = column + '_hex_tmp'
-            hex_columns[hex_name] = pl.col(column).bin.encode('hex')
-            hex_expr = pl.col(hex_name)
-        elif column_dtype == pl.String:
-            hex_expr = pl.col(column).str.strip_prefix('0x')
-        else:
-            raise Exception('invalid column dtype:' + str(column_dtype))
-
         # rename
         if replace:
             float_name = column
@@ -37,18 +37,34 @@ def binary_df_to_float(
             float_name = column + '_f64'
 
         # create float column
-        float_columns[float_name] = hex_expr_to_float(
-            hex_expr, raw_type=raw_type
-        )
+        column_dtype = df.collect_schema().get(column)
+        if column_dtype == pl.Binary and method == 'numpy':
+            float_columns[float_name] = pl.col(column).map_batches(
+                functools.partial(
+                    binary_series_to_float_numpy, raw_type=raw_type
+                ),
+                return_dtype=pl.Float64,
+            )
+        elif column_dtype == pl.Binary and method == 'expr':
+            float_columns[float_name] = binary_expr_to_float(
+                pl.col(column), raw_type=raw_type
+            )
+        elif column_dtype == pl.String:
+            hex_expr = pl.col(column).str.strip_prefix('0x')
+            float_columns[float_name] = hex_expr_to_float(
+                hex_expr, raw_type=raw_type
+            )
+        else:
+            raise Exception('invalid column dtype:' + str(column_dtype))
 
-    return (
-        df.with_columns(**hex_columns)
-        .with_columns(**float_columns)
-        .drop(*hex_columns.keys())
-    )
+    return df.with_columns(**float_columns)
 
 
-def binary_series_to_float(hex_series: pl.Series, raw_type: str) -> pl.Series:
+def binary_series_to_float(
+    hex_series: pl.Series,
+    raw_type: str,
+    method: typing.Literal['expr', 'numpy'] = 'expr',
+) -> pl.Series:
     import polars as pl
 
     name = hex_series.name
@@ -56,14 +72,43 @@ def binary_series_to_float(hex_series: pl.Series, raw_type: str) -> pl.Series:
         name = 'series'
 
     df = pl.DataFrame({name: hex_series})
-    df = binary_df_to_float(df, {name: raw_type}, replace=True)
+    df = binary_df_to_float(df, {name: raw_type}, replace=True, method=method)
     return df[name]
 
 
 def hex_expr_to_float(hex_expr: pl.Expr, raw_type: str) -> pl.Expr:
     import polars as pl
 
-    # parse raw type
+    signed, n_bits = _parse_raw_type(raw_type)
+
+    # build expression based on whether type is signed
+    if signed:
+        is_negative = hex_expr.str.slice(0, 2).str.to_lowercase() > '7f'
+        negative = _raw_hex_to_float(hex_expr, n_bits=n_bits, invert=True)
+        positive = _raw_hex_to_float(hex_expr, n_bits=n_bits, invert=False)
+        return pl.when(is_negative).then(negative).otherwise(positive)
+    else:
+        return _raw_hex_to_float(hex_expr, n_bits=n_bits, invert=False)
+
+
+def binary_expr_to_float(binary_expr: pl.Expr, raw_type: str) -> pl.Expr:
+    import polars as pl
+
+    signed, n_bits = _parse_raw_type(raw_type)
+
+    # build expression based on whether type is signed
+    if signed:
+        is_negative = binary_expr.bin.slice(0, 1) > pl.lit(b'\x7f')
+        negative = _raw_binary_to_float(binary_expr, n_bits=n_bits, invert=True)
+        positive = _raw_binary_to_float(
+            binary_expr, n_bits=n_bits, invert=False
+        )
+        return pl.when(is_negative).then(negative).otherwise(positive)
+    else:
+        return _raw_binary_to_float(binary_expr, n_bits=n_bits, invert=False)
+
+
+def _parse_raw_type(raw_type: str) -> tuple[bool, int]:
     raw_type = raw_type.lower()
     if raw_type.startswith('uint'):
         signed = False
@@ -78,16 +123,8 @@ def hex_expr_to_float(hex_expr: pl.Expr, raw_type: str) -> pl.Expr:
         signed = True
         n_bits = int(raw_type[1:])
     else:
-        raise Exception()
-
-    # build expression based on whether type is signed
-    if signed:
-        is_negative = hex_expr.str.slice(0, 2).str.to_lowercase() > '7f'
-        negative = _raw_hex_to_float(hex_expr, n_bits=n_bits, invert=True)
-        positive = _raw_hex_to_float(hex_expr, n_bits=n_bits, invert=False)
-        return pl.when(is_negative).then(negative).otherwise(positive)
-    else:
-        return _raw_hex_to_float(hex_expr, n_bits=n_bits, invert=False)
+        raise Exception('invalid raw type: ' + str(raw_type))
+    return signed, n_bits
 
 
 def _raw_hex_to_float(
@@ -144,3 +181,57 @@ def _float_chunk(
     expr = expr.cast(pl.Float64) * (2**factor)
 
     return expr
+
+
+def _raw_binary_to_float(
+    binary_expr: pl.Expr, *, n_bits: int, invert: bool
+) -> pl.Expr:
+    if n_bits % 8 != 0:
+        raise Exception('n_bits must be divisible by 8')
+    n_remaining = n_bits
+    exprs = []
+    while n_remaining > 0:
+        chunk_start = (n_bits - n_remaining) // 8
+        chunk_size = min(8, n_remaining // 8)
+        expr = _binary_float_chunk(
+            chunk_start,
+            chunk_size,
+            n_bits,
+            invert=invert,
+            binary_expr=binary_expr,
+        )
+        exprs.append(expr)
+        n_remaining -= 8 * chunk_size
+    expr = sum(exprs)  # type: ignore
+    expr = expr.alias(exprs[0].meta.output_name())
+    if invert:
+        expr = -expr - 1
+    return expr
+
+
+def _binary_float_chunk(
+    start_byte: int,
+    n_chunk_bytes: int,
+    total_bits: int,
+    *,
+    binary_expr: pl.Expr,
+    invert: bool = False,
+) -> pl.Expr:
+    import polars as pl
+
+    if n_chunk_bytes > 8:
+        raise Exception('n_chunk_bytes must be <= 8')
+
+    expr = binary_expr.bin.slice(start_byte, n_chunk_bytes)
+    if n_chunk_bytes < 8:
+        expr = b'\x00' * (8 - n_chunk_bytes) + expr
+    expr = expr.bin.reinterpret(dtype=pl.UInt64, endianness='big')
+
+    if invert:
+        max_value = 2 ** int(8 * n_chunk_bytes) - 1
+        expr = pl.lit(max_value, dtype=pl.UInt64) - expr
+
+    factor = total_bits - 8.0 * (start_byte + n_chunk_bytes)
+    expr = expr.cast(pl.Float64) * (2**factor)
+
+    return expr
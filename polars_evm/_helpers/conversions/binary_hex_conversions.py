@@ -18,6 +18,7 @@ def binary_df_to_hex(
     columns: typing.Sequence[str] | None = None,
     *,
     prefix: bool = True,
+    checksum: bool = False,
 ) -> _T:
     import polars as pl
 
@@ -29,20 +30,35 @@ def binary_df_to_hex(
         ]
 
     exprs = [
-        binary_expr_to_hex(pl.col(column), prefix=prefix) for column in columns
+        binary_expr_to_hex(pl.col(column), prefix=prefix, checksum=checksum)
+        for column in columns
     ]
     return df.with_columns(exprs)
 
 
-def binary_series_to_hex(series: pl.Series, prefix: bool = True) -> pl.Series:
-    series = series.bin.encode('hex')
+def binary_series_to_hex(
+    series: pl.Series, prefix: bool = True, checksum: bool = False
+) -> pl.Series:
+    if checksum:
+        series = _binary_series_to_checksum_hex(series)
+    else:
+        series = series.bin.encode('hex')
     if prefix:
         series = ('0x' + series).rename(series.name)
     return series
 
 
-def binary_expr_to_hex(expr: pl.Expr, prefix: bool = True) -> pl.Expr:
-    expr = expr.bin.encode('hex')
+def binary_expr_to_hex(
+    expr: pl.Expr, prefix: bool = True, checksum: bool = False
+) -> pl.Expr:
+    if checksum:
+        expr = expr.map_batches(
+            _binary_series_to_checksum_hex,
+            return_dtype=pl.String,
+            is_elementwise=True,
+        )
+    else:
+        expr = expr.bin.encode('hex')
     if prefix:
         old_name = expr.meta.output_name()
         expr = '0x' + expr
@@ -51,6 +67,49 @@ def binary_expr_to_hex(expr: pl.Expr, prefix: bool = True) -> pl.Expr:
     return expr
 
 
+def _binary_series_to_checksum_hex(series: pl.Series) -> pl.Series:
+    """
+    encode 20 byte addresses as EIP-55 mixed case hex, without prefix
+
+    the lowercase hex of all addresses is hashed in one batched keccak pass.
+    values that are not 20 bytes are encoded as lowercase hex
+    """
+    import numpy as np
+    import pyarrow as pa  # type: ignore
+
+    from ..hashes import _keccak_numpy
+    from .binary_numpy_conversions import _get_binary_view_words
+    from .binary_numpy_conversions import _numpy_to_binary_series
+
+    array = series.to_arrow(compat_level=pl.CompatLevel.newest())
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if not pa.types.is_binary_view(array.type):
+        array = array.cast(pa.binary_view())
+    words, valid = _get_binary_view_words(array, 20)
+
+    # lowercase hex as ascii, two characters per byte
+    digits = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+    text = np.zeros((len(array), 40), dtype=np.uint8)
+    for rows, row_words in words:
+        text[rows, 0::2] = digits[row_words >> 4]
+        text[rows, 1::2] = digits[row_words & 15]
+
+    # uppercase letters where the matching hash nibble is at least 8
+    if valid.any():
+        hashed = text[valid]
+        digests = _keccak_numpy(hashed)
+        nibbles = np.empty((len(hashed), 40), dtype=np.uint8)
+        nibbles[:, 0::2] = digests[:, :20] >> 4
+        nibbles[:, 1::2] = digests[:, :20] & 15
+        hashed[(nibbles >= 8) & (hashed >= ord('a'))] -= 32
+        text[valid] = hashed
+
+    checksummed = _numpy_to_binary_series(series.name, text, valid)
+    lowercase = series.bin.encode('hex')
+    return checksummed.cast(pl.String).fill_null(lowercase)
+
+
 #
 # # hex to binary
 #
@@ -89,3 +148,61 @@ def hex_expr_to_binary(expr: pl.Expr, prefix: bool | None = None) -> pl.Expr:
     if prefix is None or (isinstance(prefix, bool) and prefix):
         expr = expr.str.strip_prefix('0x')
     return expr.str.decode('hex')
+
+
+#
+# # hex quantities
+#
+
+
+def hex_quantity_series_to_int(
+    series: pl.Series, dtype: pl.DataType | type[pl.DataType] = pl.UInt64
+) -> pl.Series:
+    return (
+        series.to_frame()
+        .select(hex_quantity_expr_to_int(pl.col(series.name), dtype=dtype))
+        .to_series()
+    )
+
+
+def hex_quantity_expr_to_int(
+    expr: pl.Expr, dtype: pl.DataType | type[pl.DataType] = pl.UInt64
+) -> pl.Expr:
+    """
+    parse unpadded JSON-RPC hex quantities like '0x1a4' into integers
+
+    dtype can be any integer type up to 128 bits. values that overflow dtype
+    or are not valid 0x-prefixed, unsigned quantities become null
+    """
+    if not dtype.is_integer():
+        raise Exception('dtype must be an integer type: ' + str(dtype))
+    int_dtype = typing.cast(pl.datatypes.IntegerType, dtype)
+    valid = expr.str.contains('^0x[0-9a-fA-F]+$')
+    digits = expr.str.strip_prefix('0x')
+    return pl.when(valid).then(
+        digits.str.to_integer(base=16, dtype=int_dtype, strict=False)
+    )
+
+
+def hex_quantity_series_to_word(series: pl.Series) -> pl.Series:
+    return (
+        series.to_frame()
+        .select(hex_quantity_expr_to_word(pl.col(series.name)))
+        .to_series()
+    )
+
+
+def hex_quantity_expr_to_word(expr: pl.Expr) -> pl.Expr:
+    """
+    parse unpadded JSON-RPC hex quantities into 32 byte big-endian words
+
+    quantities of any width up to 256 bits are left padded with zeros, so
+    odd-length quantities decode correctly. values over 256 bits or that are
+    not valid quantities become null
+    """
+    import polars as pl
+
+    valid = expr.str.contains('^0x[0-9a-fA-F]+$')
+    digits = expr.str.strip_prefix('0x')
+    word = digits.str.zfill(64).str.decode('hex', strict=False)
+    return pl.when(valid & (word.bin.size() == 32)).then(word)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import typing
+
+from .binary_float_conversions import _parse_raw_type
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+    _T = typing.TypeVar('_T', pl.DataFrame, pl.LazyFrame)
+
+
+def binary_df_to_int(
+    df: _T,
+    column_types: dict[str, str],
+    replace: bool = False,
+) -> _T:
+    """
+    column_types in format {'col1': 'u256', 'col2': 'i128', ...}
+
+    types up to 128 bits become native integers, wider types are returned as
+    sign-extended 32 byte big-endian words because polars has no wider dtype
+    """
+    import polars as pl
+
+    int_columns = {}
+    for column, raw_type in column_types.items():
+        # rename
+        if replace:
+            int_name = column
+        else:
+            int_name = column + '_int'
+
+        # create int column
+        column_dtype = df.collect_schema().get(column)
+        if column_dtype == pl.Binary:
+            int_columns[int_name] = binary_expr_to_int(
+                pl.col(column), raw_type=raw_type
+            )
+        elif column_dtype == pl.String:
+            hex_expr = pl.col(column).str.strip_prefix('0x')
+            int_columns[int_name] = hex_expr_to_int(hex_expr, raw_type=raw_type)
+        else:
+            raise Exception('invalid column dtype:' + str(column_dtype))
+
+    return df.with_columns(**int_columns)
+
+
+def binary_series_to_int(series: pl.Series, raw_type: str) -> pl.Series:
+    import polars as pl
+
+    name = series.name
+    if name is None:
+        name = 'series'
+
+    df = pl.DataFrame({name: series})
+    df = binary_df_to_int(df, {name: raw_type}, replace=True)
+    return df[name]
+
+
+def hex_expr_to_int(hex_expr: pl.Expr, raw_type: str) -> pl.Expr:
+    return binary_expr_to_int(hex_expr.str.decode('hex'), raw_type=raw_type)
+
+
+def binary_expr_to_int(binary_expr: pl.Expr, raw_type: str) -> pl.Expr:
+    """convert n_bits / 8 big-endian bytes into exact integers"""
+    import polars as pl
+
+    signed, n_bits = _parse_raw_type(raw_type)
+    if n_bits % 8 != 0:
+        raise Exception('n_bits must be divisible by 8')
+    elif n_bits <= 0 or n_bits > 256:
+        raise Exception('n_bits must be between 8 and 256')
+
+    # decide output width
+    dtype: type[pl.DataType] | None
+    if n_bits <= 8:
+        width, dtype = 8, pl.Int8 if signed else pl.UInt8
+    elif n_bits <= 16:
+        width, dtype = 16, pl.Int16 if signed else pl.UInt16
+    elif n_bits <= 32:
+        width, dtype = 32, pl.Int32 if signed else pl.UInt32
+    elif n_bits <= 64:
+        width, dtype = 64, pl.Int64 if signed else pl.UInt64
+    elif n_bits <= 128:
+        width, dtype = 128, pl.Int128 if signed else pl.UInt128
+    else:
+        width, dtype = 256, None
+
+    # pad to output width
+    expr = _extend_binary(binary_expr, (width - n_bits) // 8, signed=signed)
+
+    if dtype is None:
+        return expr
+    else:
+        return expr.bin.reinterpret(dtype=dtype, endianness='big')
+
+
+def _extend_binary(expr: pl.Expr, n_bytes: int, *, signed: bool) -> pl.Expr:
+    import polars as pl
+
+    if n_bytes == 0:
+        return expr
+    elif signed:
+        is_negative = expr.bin.slice(0, 1) > pl.lit(b'\x7f')
+        return (
+            pl.when(is_negative)
+            .then(b'\xff' * n_bytes + expr)
+            .otherwise(b'\x00' * n_bytes + expr)
+            .name.keep()
+        )
+    else:
+        return (b'\x00' * n_bytes + expr).name.keep()
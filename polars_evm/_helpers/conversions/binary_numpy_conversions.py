@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import typing
+
+from .binary_float_conversions import _parse_raw_type
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    _NDArray = np.ndarray[typing.Any, typing.Any]
+
+
+def binary_series_to_float_numpy(series: pl.Series, raw_type: str) -> pl.Series:
+    """
+    convert fixed-width big-endian binary values to f64 in a single numpy pass
+
+    reads the arrow view and data buffers of the series directly, so words
+    stored contiguously are viewed as an (n, n_bytes) uint8 array without
+    copying. values that are null or have the wrong width become null
+    """
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa  # type: ignore
+
+    signed, n_bits = _parse_raw_type(raw_type)
+    if n_bits % 8 != 0:
+        raise Exception('n_bits must be divisible by 8')
+    n_bytes = n_bits // 8
+
+    array = series.to_arrow(compat_level=pl.CompatLevel.newest())
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if not pa.types.is_binary_view(array.type):
+        array = array.cast(pa.binary_view())
+
+    words, valid = _get_binary_view_words(array, n_bytes)
+    output = np.full(len(array), np.nan)
+    for rows, row_words in words:
+        output[rows] = _words_to_float(row_words, signed=signed)
+
+    if valid.all():
+        return pl.Series(series.name, output)
+    else:
+        return pl.Series(series.name, pa.array(output, mask=~valid))
+
+
+def binary_series_to_numpy_words(series: pl.Series, width: int) -> _NDArray:
+    """
+    convert fixed-width binary values to an (n, width) uint8 array
+
+    when all words are stored contiguously in one arrow data buffer, the
+    output is a read-only view of that buffer without copying. raises if any
+    value is null or not width bytes
+    """
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa
+
+    if width < 1:
+        raise Exception('width must be positive')
+    if series.dtype == pl.Array(pl.UInt8, width):
+        if series.null_count() > 0:
+            raise Exception('cannot convert null values to numpy words')
+        return series.to_numpy()
+    if series.dtype != pl.Binary:
+        raise Exception('invalid dtype for numpy words: ' + str(series.dtype))
+
+    array = series.to_arrow(compat_level=pl.CompatLevel.newest())
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if not pa.types.is_binary_view(array.type):
+        array = array.cast(pa.binary_view())
+    words, valid = _get_binary_view_words(array, width)
+    if not valid.all():
+        n_invalid = int((~valid).sum())
+        raise Exception(
+            str(n_invalid) + ' values are null or not ' + str(width) + ' bytes'
+        )
+
+    # a single run covering all rows is a view of the data buffer
+    if len(words) == 1 and isinstance(words[0][0], slice):
+        return words[0][1]
+    output = np.empty((len(array), width), dtype=np.uint8)
+    for rows, row_words in words:
+        output[rows] = row_words
+    return output
+
+
+def numpy_words_to_binary_series(words: _NDArray, name: str = '') -> pl.Series:
+    """
+    convert an (n, width) uint8 array to pl.Binary values
+
+    the array is wrapped as an arrow fixed size binary buffer without copying,
+    then cast once into polars binary views
+    """
+    import numpy as np
+
+    if words.ndim != 2 or words.dtype != np.uint8:
+        raise Exception('words must be a 2d uint8 array')
+    if words.shape[1] < 1:
+        raise Exception('width must be positive')
+    valid = np.ones(len(words), dtype=bool)
+    return _numpy_to_binary_series(name, words, valid)
+
+
+def _binary_words(series: pl.Series, n_bytes: int) -> tuple[_NDArray, _NDArray]:
+    """(n, n_bytes) uint8 words, rows that are null or not n_bytes are zero"""
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa
+
+    if series.dtype != pl.Binary:
+        raise Exception('invalid dtype for words: ' + str(series.dtype))
+    array = series.to_arrow(compat_level=pl.CompatLevel.newest())
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if not pa.types.is_binary_view(array.type):
+        array = array.cast(pa.binary_view())
+    runs, valid = _get_binary_view_words(array, n_bytes)
+    words = np.zeros((len(array), n_bytes), dtype=np.uint8)
+    for rows, row_words in runs:
+        words[rows] = row_words
+    return words, valid
+
+
+def _get_binary_view_words(
+    array: typing.Any, n_bytes: int
+) -> tuple[list[tuple[_NDArray | slice, _NDArray]], _NDArray]:
+    """
+    gather (rows, words) pairs covering the valid rows of a binary view array
+
+    views are 16 bytes: (length, prefix, buffer_index, offset) as int32
+    """
+    import numpy as np
+
+    buffers = array.buffers()
+    views = np.frombuffer(buffers[1], dtype=np.int32).reshape(-1, 4)
+    views = views[array.offset : array.offset + len(array)]
+
+    valid = views[:, 0] == n_bytes
+    if array.null_count > 0:
+        valid &= array.is_valid().to_numpy(zero_copy_only=False)
+    rows: _NDArray | slice
+    if valid.all():
+        rows = slice(None)
+    else:
+        rows = np.flatnonzero(valid)
+        views = views[rows]
+    if len(views) == 0:
+        return [], valid
+
+    # values up to 12 bytes are stored inline in the view
+    if n_bytes <= 12:
+        inline = np.ascontiguousarray(views).view(np.uint8)
+        return [(rows, inline[:, 4 : 4 + n_bytes])], valid
+
+    # split rows into runs of words stored contiguously in one data buffer
+    buffer_indices = views[:, 2]
+    offsets = views[:, 3]
+    breaks = np.flatnonzero(
+        (np.diff(buffer_indices) != 0) | (np.diff(offsets) != n_bytes)
+    )
+    run_starts = np.concatenate([[0], breaks + 1])
+    run_ends = np.concatenate([breaks + 1, [len(views)]])
+    row_numbers = np.arange(len(valid))[rows]
+
+    words = []
+    if len(run_starts) <= _max_runs:
+        # zero copy views of contiguous words
+        for run_start, run_end in zip(run_starts, run_ends):
+            buffer = buffers[2 + buffer_indices[run_start]]
+            data = np.frombuffer(buffer, dtype=np.uint8)
+            start = offsets[run_start]
+            end = start + n_bytes * (run_end - run_start)
+            row_words = data[start:end].reshape(-1, n_bytes)
+            if isinstance(rows, slice):
+                run_rows: _NDArray | slice = slice(run_start, run_end)
+            else:
+                run_rows = rows[run_start:run_end]
+            words.append((run_rows, row_words))
+    else:
+        # fragmented storage, gather words from each data buffer
+        for buffer_index in np.unique(buffer_indices):
+            mask = buffer_indices == buffer_index
+            data = np.frombuffer(buffers[2 + buffer_index], dtype=np.uint8)
+            row_words = data[offsets[mask][:, None] + np.arange(n_bytes)]
+            words.append((row_numbers[mask], row_words))
+
+    return words, valid
+
+
+_max_runs = 1024
+
+
+def _numpy_to_binary_series(
+    name: str, words: _NDArray, valid: _NDArray
+) -> pl.Series:
+    """convert (n, n_bytes) uint8 words into fixed width binary values"""
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa
+
+    n_rows, n_bytes = words.shape
+    validity = None
+    if not valid.all():
+        validity = pa.py_buffer(np.packbits(valid, bitorder='little'))
+    buffer = pa.py_buffer(np.ascontiguousarray(words, dtype=np.uint8))
+    array = pa.Array.from_buffers(
+        pa.binary(n_bytes), n_rows, [validity, buffer]
+    )
+    return pl.Series(name, array).cast(pl.Binary)
+
+
+def _buffers_to_binary_series(
+    name: str, data: _NDArray, offsets: _NDArray, valid: _NDArray
+) -> pl.Series:
+    """convert a uint8 buffer and n + 1 int64 offsets into binary values"""
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa
+
+    validity = None
+    if not valid.all():
+        validity = pa.py_buffer(np.packbits(valid, bitorder='little'))
+    array = pa.LargeBinaryArray.from_buffers(
+        pa.large_binary(),
+        len(offsets) - 1,
+        [
+            validity,
+            pa.py_buffer(np.ascontiguousarray(offsets, dtype=np.int64)),
+            pa.py_buffer(np.ascontiguousarray(data, dtype=np.uint8)),
+        ],
+    )
+    return pl.Series(name, array, dtype=pl.Binary)
+
+
+def _words_to_float(words: _NDArray, *, signed: bool) -> _NDArray:
+    import numpy as np
+
+    n_rows, n_bytes = words.shape
+
+    # left pad to a whole number of 64 bit limbs
+    if n_bytes % 8 != 0 or not words.flags['C_CONTIGUOUS']:
+        n_padding = -n_bytes % 8
+        padded = np.zeros((n_rows, n_bytes + n_padding), dtype=np.uint8)
+        if signed and n_padding > 0:
+            padded[words[:, 0] >= 128, :n_padding] = 255
+        padded[:, n_padding:] = words
+        words = padded
+    limbs = words.view('>u8')
+
+    # negative values are computed as -(~x) - 1
+    if signed:
+        is_negative = words[:, 0] >= 128
+        limbs = np.where(is_negative[:, None], ~limbs, limbs)
+
+    output = limbs[:, 0].astype(np.float64)
+    for i in range(1, limbs.shape[1]):
+        output *= 2.0**64
+        output += limbs[:, i]
+
+    if signed:
+        output = np.where(is_negative, -output - 1, output)
+
+    return output
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    _NDArray = np.ndarray[typing.Any, typing.Any]
+
+
+def q_series_to_float(
+    series: pl.Series,
+    int_bits: int,
+    frac_bits: int,
+    *,
+    squared: bool = False,
+    signed: bool = False,
+) -> pl.Series:
+    """
+    convert Q fixed point words to f64, e.g. int_bits=64, frac_bits=96
+
+    values are read as 32 bit pieces into a double-double sum, so each output
+    is rounded once, including for squared=True which gives value**2 as used
+    for sqrtPriceX96. input is (int_bits + frac_bits) / 8 bytes, or 32 byte
+    words with left padding. other widths become null
+    """
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa  # type: ignore
+
+    pieces, negative, valid = _read_q_pieces(
+        series, int_bits, frac_bits, signed
+    )
+
+    # sum pieces as hi + lo, most significant first, each piece is exact
+    n_pieces = pieces.shape[1]
+    hi = np.ldexp(pieces[:, 0].astype(np.float64), 32 * (n_pieces - 1))
+    lo = np.zeros(len(pieces))
+    for i in range(1, n_pieces):
+        piece = np.ldexp(
+            pieces[:, i].astype(np.float64), 32 * (n_pieces - i - 1)
+        )
+        hi, error = _two_sum(hi, piece)
+        lo += error
+    hi, lo = _two_sum(hi, lo)
+
+    if squared:
+        square, error = _two_product(hi, hi)
+        output = square + (error + 2 * hi * lo)
+        output = np.ldexp(output, -2 * frac_bits)
+    else:
+        output = np.ldexp(hi, -frac_bits)
+        output = np.where(negative, -output, output)
+
+    if valid.all():
+        return pl.Series(series.name, output)
+    else:
+        return pl.Series(series.name, pa.array(output, mask=~valid))
+
+
+def q_expr_to_float(
+    expr: pl.Expr,
+    int_bits: int,
+    frac_bits: int,
+    *,
+    squared: bool = False,
+    signed: bool = False,
+) -> pl.Expr:
+    """convert Q fixed point words to f64 in a single numpy pass"""
+    import polars as pl
+
+    _check_q_type(int_bits, frac_bits)
+    return expr.map_batches(
+        functools.partial(
+            q_series_to_float,
+            int_bits=int_bits,
+            frac_bits=frac_bits,
+            squared=squared,
+            signed=signed,
+        ),
+        return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def q_series_to_fraction(
+    series: pl.Series,
+    int_bits: int,
+    frac_bits: int,
+    *,
+    squared: bool = False,
+    signed: bool = False,
+) -> pl.Series:
+    """
+    convert Q fixed point words to exact fractions
+
+    output is a struct of a big-endian numerator and denominator_bits, where
+    value = numerator / 2**denominator_bits. numerators are 32 byte two's
+    complement words, or 64 byte unsigned words when squared=True
+    """
+    import numpy as np
+    import polars as pl
+
+    from .binary_numpy_conversions import _numpy_to_binary_series
+
+    pieces, negative, valid = _read_q_pieces(
+        series, int_bits, frac_bits, signed
+    )
+
+    if squared:
+        numerators = _square_pieces(pieces)
+        words = numerators.astype('>u4').view(np.uint8)
+        words = _left_pad(words, 64, fill=None)
+        denominator_bits = 2 * frac_bits
+    else:
+        # restore two's complement after reading magnitudes
+        if negative.any():
+            pieces[negative] = _negate_pieces(pieces[negative])
+        words = pieces.astype('>u4').view(np.uint8)
+        words = _left_pad(words, 32, fill=negative)
+        denominator_bits = frac_bits
+
+    numerator = _numpy_to_binary_series('numerator', words, valid)
+    fraction = pl.struct(
+        'numerator',
+        denominator_bits=pl.lit(denominator_bits, dtype=pl.UInt16),
+    )
+    return pl.DataFrame({'numerator': numerator}).select(
+        pl.when(pl.col.numerator.is_not_null())
+        .then(fraction)
+        .alias(series.name)
+    )[series.name]
+
+
+def q_expr_to_fraction(
+    expr: pl.Expr,
+    int_bits: int,
+    frac_bits: int,
+    *,
+    squared: bool = False,
+    signed: bool = False,
+) -> pl.Expr:
+    """convert Q fixed point words to exact fractions"""
+    import polars as pl
+
+    _check_q_type(int_bits, frac_bits)
+    return expr.map_batches(
+        functools.partial(
+            q_series_to_fraction,
+            int_bits=int_bits,
+            frac_bits=frac_bits,
+            squared=squared,
+            signed=signed,
+        ),
+        return_dtype=pl.Struct(
+            {'numerator': pl.Binary, 'denominator_bits': pl.UInt16}
+        ),
+        is_elementwise=True,
+    )
+
+
+def _check_q_type(int_bits: int, frac_bits: int) -> None:
+    n_bits = int_bits + frac_bits
+    if int_bits < 0 or frac_bits < 0:
+        raise Exception('int_bits and frac_bits must be non-negative')
+    if n_bits % 8 != 0 or not 8 <= n_bits <= 256:
+        raise Exception('int_bits + frac_bits must be 8 to 256 bytes')
+
+
+def _read_q_pieces(
+    series: pl.Series, int_bits: int, frac_bits: int, signed: bool
+) -> tuple[_NDArray, _NDArray, _NDArray]:
+    """
+    read magnitudes as (n, n_pieces) 32 bit pieces, most significant first
+
+    returns (pieces, negative, valid)
+    """
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa
+
+    from .binary_numpy_conversions import _get_binary_view_words
+
+    _check_q_type(int_bits, frac_bits)
+    n_bytes = (int_bits + frac_bits) // 8
+
+    # drop left padding of 32 byte words
+    if n_bytes < 32:
+        word = pl.col.word
+        series = (
+            pl.DataFrame({'word': series})
+            .select(
+                pl.when(word.bin.size() == 32)
+                .then(word.bin.slice(32 - n_bytes))
+                .otherwise(word)
+            )
+            .to_series()
+        )
+
+    array = series.to_arrow(compat_level=pl.CompatLevel.newest())
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if not pa.types.is_binary_view(array.type):
+        array = array.cast(pa.binary_view())
+    words, valid = _get_binary_view_words(array, n_bytes)
+
+    # left pad to whole 32 bit pieces
+    n_padding = -n_bytes % 4
+    padded = np.zeros((len(array), n_bytes + n_padding), dtype=np.uint8)
+    for rows, row_words in words:
+        padded[rows, n_padding:] = row_words
+    if signed:
+        negative = valid & (padded[:, n_padding] >= 128)
+        padded[negative, :n_padding] = 255
+    else:
+        negative = np.zeros(len(padded), dtype=bool)
+
+    pieces = padded.view('>u4').astype(np.uint64)
+    if negative.any():
+        pieces[negative] = _negate_pieces(pieces[negative])
+    return pieces, negative, valid
+
+
+def _negate_pieces(pieces: _NDArray) -> _NDArray:
+    """two's complement negation as ~x + 1, most significant piece first"""
+    import numpy as np
+
+    mask = np.uint64(2**32 - 1)
+    negated = ~pieces & mask
+    carry = np.ones(len(pieces), dtype=np.uint64)
+    for i in range(pieces.shape[1] - 1, -1, -1):
+        total = negated[:, i] + carry
+        negated[:, i] = total & mask
+        carry = total >> np.uint64(32)
+    return negated
+
+
+def _square_pieces(pieces: _NDArray) -> _NDArray:
+    """exact squares of 32 bit pieces, most significant piece first"""
+    import numpy as np
+
+    mask = np.uint64(2**32 - 1)
+    n_pieces = pieces.shape[1]
+    reverse = pieces[:, ::-1]
+
+    # column sums stay below 2 * n_pieces * 2**32, well within 64 bits
+    columns = np.zeros((len(pieces), 2 * n_pieces), dtype=np.uint64)
+    for i in range(n_pieces):
+        for j in range(n_pieces):
+            product = reverse[:, i] * reverse[:, j]
+            columns[:, i + j] += product & mask
+            columns[:, i + j + 1] += product >> np.uint64(32)
+    for i in range(2 * n_pieces - 1):
+        columns[:, i + 1] += columns[:, i] >> np.uint64(32)
+        columns[:, i] &= mask
+    return columns[:, ::-1]
+
+
+def _left_pad(words: _NDArray, n_bytes: int, fill: _NDArray | None) -> _NDArray:
+    import numpy as np
+
+    n_padding = n_bytes - words.shape[1]
+    if n_padding == 0:
+        return words
+    padded = np.zeros((len(words), n_bytes), dtype=np.uint8)
+    padded[:, n_padding:] = words
+    if fill is not None:
+        padded[fill, :n_padding] = 255
+    return padded
+
+
+def _two_sum(a: _NDArray, b: _NDArray) -> tuple[_NDArray, _NDArray]:
+    """a + b as a rounded sum and its exact rounding error"""
+    total = a + b
+    b_virtual = total - a
+    a_virtual = total - b_virtual
+    return total, (a - a_virtual) + (b - b_virtual)
+
+
+def _two_product(a: _NDArray, b: _NDArray) -> tuple[_NDArray, _NDArray]:
+    """a * b as a rounded product and its exact rounding error"""
+    product = a * b
+    a_high, a_low = _split(a)
+    b_high, b_low = _split(b)
+    error = (
+        (a_high * b_high - product) + a_high * b_low + a_low * b_high
+    ) + a_low * b_low
+    return product, error
+
+
+def _split(a: _NDArray) -> tuple[_NDArray, _NDArray]:
+    """split a float into two halves of 26 significant bits"""
+    scaled = a * (2.0**27 + 1)
+    high = scaled - (scaled - a)
+    return high, a - high
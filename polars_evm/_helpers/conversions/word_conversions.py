@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    _NDArray = np.ndarray[typing.Any, typing.Any]
+
+
+# long decimal strings are parsed in chunks of 19 digits, 10**19 is the
+# largest power of 10 below 2**64 so that limb * 10**19 + chunk fits in UInt128
+_chunk_digits = 19
+_n_chunks = 5
+_max_digits = 78
+
+
+def int_series_to_word(
+    series: pl.Series,
+    n_bits: int = 256,
+    signed: bool = False,
+    *,
+    hex_output: bool = False,
+) -> pl.Series:
+    """
+    encode integers as 32 byte big-endian words
+
+    negative values use sign-extended two's complement. values outside the
+    range of the n_bits type become null
+    """
+    import polars as pl
+
+    _check_int_type(n_bits, signed)
+    if not series.dtype.is_integer():
+        raise Exception('invalid dtype for int words: ' + str(series.dtype))
+
+    # magnitudes as 128 bit integers, the widest integers in polars
+    value = pl.col.value
+    if series.dtype.is_signed_integer():
+        value = value.cast(pl.Int128)
+        negative = value < 0
+        # negate two's complement values as ~x + 1
+        wrapped = value.cast(pl.UInt128, wrap_numerical=True)
+        magnitude = pl.when(negative).then(~wrapped + 1).otherwise(wrapped)
+    else:
+        negative = pl.lit(False)
+        magnitude = value.cast(pl.UInt128)
+    df = pl.DataFrame({'value': series}).select(
+        valid=value.is_not_null(),
+        negative=negative.fill_null(False),
+        magnitude=magnitude,
+    )
+
+    limbs = _u128_to_numpy_limbs(df['magnitude'])
+    output = _magnitudes_to_word_series(
+        series.name,
+        limbs,
+        negative=df['negative'].to_numpy(),
+        valid=df['valid'].to_numpy(),
+        n_bits=n_bits,
+        signed=signed,
+    )
+    return _format_words(output, hex_output)
+
+
+def int_expr_to_word(
+    expr: pl.Expr,
+    n_bits: int = 256,
+    signed: bool = False,
+    *,
+    hex_output: bool = False,
+) -> pl.Expr:
+    """encode integers as 32 byte big-endian words"""
+    return _map_words(
+        expr, int_series_to_word, n_bits, signed, hex_output=hex_output
+    )
+
+
+def decimal_str_series_to_word(
+    series: pl.Series,
+    n_bits: int = 256,
+    signed: bool = False,
+    *,
+    hex_output: bool = False,
+) -> pl.Series:
+    """
+    encode base-10 strings as 32 byte big-endian words
+
+    strings are an optional '-' followed by digits. magnitudes below 10**38
+    are cast directly as UInt128, longer strings are parsed in 19 digit
+    chunks. malformed strings and values outside the range of the n_bits type
+    become null
+    """
+    import numpy as np
+    import polars as pl
+
+    _check_int_type(n_bits, signed)
+    if series.dtype != pl.String:
+        raise Exception('invalid dtype for decimal str: ' + str(series.dtype))
+
+    string = pl.col.string
+    digits = pl.col.digits
+    n_digits = pl.col.n_digits
+    df = (
+        pl.DataFrame({'string': series})
+        .select(
+            negative=string.str.starts_with('-').fill_null(False),
+            digits=string.str.strip_prefix('-'),
+        )
+        .with_columns(
+            digits=pl.when(digits.str.contains('^[0-9]+$')).then(
+                digits.str.strip_chars_start('0')
+            )
+        )
+        .with_columns(n_digits=digits.str.len_bytes())
+        .with_columns(
+            valid=n_digits <= _max_digits,
+            is_long=n_digits > 38,
+            magnitude=pl.when(n_digits <= 38).then(
+                digits.cast(pl.UInt128, strict=False).fill_null(0)
+            ),
+        )
+    )
+
+    # short strings cast directly, then fill in long strings
+    limbs = _u128_to_numpy_limbs(df['magnitude'])
+    valid = df['valid'].fill_null(False).to_numpy().astype(np.bool_)
+    is_long = df.select(pl.col.valid & pl.col.is_long).to_series()
+    if is_long.any():
+        long_digits = df['digits'].filter(is_long)
+        rows = is_long.arg_true().to_numpy()
+        limbs[rows], overflow = _parse_decimal_limbs(long_digits)
+        valid[rows[overflow]] = False
+
+    output = _magnitudes_to_word_series(
+        series.name,
+        limbs,
+        negative=df['negative'].to_numpy(),
+        valid=valid,
+        n_bits=n_bits,
+        signed=signed,
+    )
+    return _format_words(output, hex_output)
+
+
+def decimal_str_expr_to_word(
+    expr: pl.Expr,
+    n_bits: int = 256,
+    signed: bool = False,
+    *,
+    hex_output: bool = False,
+) -> pl.Expr:
+    """encode base-10 strings as 32 byte big-endian words"""
+    return _map_words(
+        expr, decimal_str_series_to_word, n_bits, signed, hex_output=hex_output
+    )
+
+
+def float_series_to_word(
+    series: pl.Series,
+    n_bits: int = 256,
+    signed: bool = False,
+    *,
+    hex_output: bool = False,
+) -> pl.Series:
+    """
+    encode floats as 32 byte big-endian words, truncating toward zero
+
+    each float is split into its 53 bit mantissa and exponent, so the words
+    are exact images of the float values. nan, inf, and values outside the
+    range of the n_bits type become null
+    """
+    import numpy as np
+    import polars as pl
+
+    _check_int_type(n_bits, signed)
+    if not series.dtype.is_float():
+        raise Exception('invalid dtype for float words: ' + str(series.dtype))
+
+    values = series.cast(pl.Float64).to_numpy()
+    valid = np.isfinite(values)
+    negative = valid & (values < 0)
+    magnitudes = np.trunc(np.abs(np.where(valid, values, 0.0)))
+
+    # magnitude = mantissa * 2**shift with an integer 53 bit mantissa
+    fractions, exponents = np.frexp(magnitudes)
+    mantissas = (fractions * 2.0**53).astype(np.uint64)
+    shifts = exponents.astype(np.int64) - 53
+    valid &= shifts <= 256 - 53
+
+    limbs = np.zeros((len(values), 4), dtype=np.uint64)
+    for i in range(4):
+        offset = shifts - 64 * i
+        left = np.clip(offset, 0, 63).astype(np.uint64)
+        right = np.clip(-offset, 0, 63).astype(np.uint64)
+        limbs[:, i] = np.where(
+            (offset >= 0) & (offset < 64), mantissas << left, 0
+        ) | np.where((offset < 0) & (offset > -64), mantissas >> right, 0)
+
+    output = _magnitudes_to_word_series(
+        series.name,
+        limbs,
+        negative=negative,
+        valid=valid,
+        n_bits=n_bits,
+        signed=signed,
+    )
+    return _format_words(output, hex_output)
+
+
+def float_expr_to_word(
+    expr: pl.Expr,
+    n_bits: int = 256,
+    signed: bool = False,
+    *,
+    hex_output: bool = False,
+) -> pl.Expr:
+    """encode floats as 32 byte big-endian words, truncating toward zero"""
+    return _map_words(
+        expr, float_series_to_word, n_bits, signed, hex_output=hex_output
+    )
+
+
+#
+# # helpers
+#
+
+
+def _check_int_type(n_bits: int, signed: bool) -> None:
+    from ..decoding.decoding_types import parse_abi_type
+
+    abi_type = ('int' if signed else 'uint') + str(n_bits)
+    if n_bits % 8 != 0 or not 8 <= n_bits <= 256:
+        raise Exception('invalid abi type: ' + abi_type)
+    parse_abi_type(abi_type)
+
+
+def _map_words(
+    expr: pl.Expr,
+    function: typing.Callable[..., pl.Series],
+    n_bits: int,
+    signed: bool,
+    *,
+    hex_output: bool,
+) -> pl.Expr:
+    import polars as pl
+
+    _check_int_type(n_bits, signed)
+    return expr.map_batches(
+        functools.partial(
+            function, n_bits=n_bits, signed=signed, hex_output=hex_output
+        ),
+        return_dtype=pl.String if hex_output else pl.Binary,
+        is_elementwise=True,
+    )
+
+
+def _format_words(series: pl.Series, hex_output: bool) -> pl.Series:
+    from .binary_hex_conversions import binary_series_to_hex
+
+    if hex_output:
+        return binary_series_to_hex(series, prefix=True)
+    else:
+        return series
+
+
+def _u128_to_numpy_limbs(series: pl.Series) -> _NDArray:
+    """split UInt128 values into (n, 4) uint64 limbs, nulls become zero"""
+    import numpy as np
+    import polars as pl
+
+    limb_size = pl.lit(2**64, dtype=pl.UInt128)
+    value = pl.col.value.fill_null(0)
+    halves = pl.DataFrame({'value': series}).select(
+        low=(value % limb_size).cast(pl.UInt64),
+        high=(value // limb_size).cast(pl.UInt64),
+    )
+    limbs = np.zeros((len(series), 4), dtype=np.uint64)
+    limbs[:, 0] = halves['low'].to_numpy()
+    limbs[:, 1] = halves['high'].to_numpy()
+    return limbs
+
+
+def _parse_decimal_limbs(digits: pl.Series) -> tuple[_NDArray, _NDArray]:
+    """parse digit strings into (n, 4) uint64 limbs and an overflow mask"""
+    import numpy as np
+    import polars as pl
+
+    limb_size = pl.lit(2**64, dtype=pl.UInt128)
+    base = pl.lit(10**_chunk_digits, dtype=pl.UInt128)
+
+    # chunks of 19 digits, most significant first
+    padded = pl.DataFrame({'digits': digits}).select(
+        pl.col.digits.str.zfill(_chunk_digits * _n_chunks)
+    )
+    df = padded.select(
+        pl.col.digits.str.slice(_chunk_digits * i, _chunk_digits)
+        .cast(pl.UInt128)
+        .alias('chunk' + str(i))
+        for i in range(_n_chunks)
+    )
+
+    # multiply-add each chunk into the limbs. after i chunks the value is
+    # below 10**(19 * i) < 2**(64 * i), so only the lowest i limbs are nonzero
+    limbs = ['limb' + str(i) for i in range(4)]
+    for i in range(_n_chunks):
+        df = df.with_columns(carry=pl.col('chunk' + str(i)))
+        for limb in limbs[:i]:
+            df = df.with_columns(current=pl.col(limb) * base + pl.col.carry)
+            df = df.with_columns(
+                (pl.col.current % limb_size).alias(limb),
+                carry=pl.col.current // limb_size,
+            )
+        if i < len(limbs):
+            df = df.with_columns(pl.col.carry.alias(limbs[i]))
+
+    output = df.select(pl.col(limbs).cast(pl.UInt64)).to_numpy()
+    overflow = (df['carry'] != 0).to_numpy()
+    return output.astype(np.uint64), overflow
+
+
+def _magnitudes_to_word_series(
+    name: str,
+    limbs: _NDArray,
+    *,
+    negative: _NDArray,
+    valid: _NDArray,
+    n_bits: int,
+    signed: bool,
+) -> pl.Series:
+    """range check magnitudes, apply signs, and pack into 32 byte words"""
+    import numpy as np
+
+    from ..limbs import _numpy_limbs_to_binary
+
+    # magnitude must be below 2**max_bits, or equal to it for negative values
+    max_bits = n_bits - 1 if signed else n_bits
+    limb_index, bit = divmod(max_bits, 64)
+    if limb_index < 4:
+        high = limbs[:, limb_index + 1 :].any(axis=1)
+        top = limbs[:, limb_index]
+        rest = limbs[:, :limb_index].any(axis=1)
+        below = ~high & (top < np.uint64(2**bit))
+        at_bound = ~high & (top == np.uint64(2**bit)) & ~rest
+        if signed:
+            valid = valid & (below | (negative & at_bound))
+        else:
+            valid = valid & below
+    is_zero = ~limbs.any(axis=1)
+    if not signed:
+        valid = valid & (~negative | is_zero)
+
+    # two's complement negation as ~x + 1
+    if negative.any():
+        negated = ~limbs
+        carry = np.ones(len(limbs), dtype=np.uint64)
+        for i in range(4):
+            negated[:, i] += carry
+            carry = carry & (negated[:, i] == 0)
+        limbs = np.where(negative[:, None], negated, limbs)
+
+    return _numpy_limbs_to_binary(name, limbs, valid)
@@ -1,6 +1,7 @@
+from .decoding_binary import *
 from .decoding_columns import *
 from .decoding_events import decode_events, decode_contract_events
 from .decoding_transactions import decode_transactions
 
 if typing.TYPE_CHECKING:
-    from .decoding_types import AbiType
+    from .decoding_types import AbiType, IntOutput
@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+from .. import conversions
+from . import decoding_types
+
+
+def decode_binary_series(
+    series: pl.Series,
+    abi_type: str | decoding_types.AbiType,
+    *,
+    padded: bool = True,
+    hex_output: bool = False,
+    fixed_output: bool = False,
+    checksum: bool = False,
+    int_output: decoding_types.IntOutput = 'float',
+) -> pl.Series:
+    import polars as pl
+
+    expr = decode_binary_expr(
+        pl.col.as_binary,
+        abi_type=abi_type,
+        padded=padded,
+        hex_output=hex_output,
+        fixed_output=fixed_output,
+        checksum=checksum,
+        int_output=int_output,
+    )
+    return pl.DataFrame({'as_binary': series}).select(decoded=expr)['decoded']
+
+
+def decode_binary_expr(
+    expr: pl.Expr,
+    abi_type: str | decoding_types.AbiType,
+    *,
+    padded: bool = True,
+    hex_output: bool = False,
+    fixed_output: bool = False,
+    checksum: bool = False,
+    int_output: decoding_types.IntOutput = 'float',
+    max_array_length: int = 32,
+) -> pl.Expr:
+    """
+    decode pl.Binary data using byte offsets, without converting to hex
+
+    output matches decode_hex_expr() for the same data
+
+    - padded: True if there might be leftside padding
+    - fixed_output: output address and bytesN as pl.Array(pl.UInt8, n_bytes)
+    - checksum: with hex_output, output addresses as EIP-55 checksummed hex
+    """
+    import polars as pl
+
+    if hex_output and fixed_output:
+        raise Exception('cannot use both hex_output and fixed_output')
+    if isinstance(abi_type, str):
+        abi_type = decoding_types.parse_abi_type(abi_type)
+    type_name = abi_type['name']
+
+    # preprocess expr
+    if (
+        padded
+        and abi_type['n_bits'] is not None
+        and abi_type['n_bits'] < 256
+        and not abi_type['has_tail']
+        and abi_type['name'] != 'bytes'
+        and not abi_type['name'].endswith(']')
+    ):
+        n_bytes = abi_type['n_bits'] // 8
+        if type_name.startswith('bytes'):
+            expr = expr.bin.slice(0, n_bytes)
+        else:
+            expr = expr.bin.slice(-n_bytes)
+
+    # decode type
+    if type_name.endswith(']'):
+        return _decode_array(
+            expr,
+            abi_type,
+            hex_output,
+            fixed_output,
+            checksum,
+            int_output,
+            max_array_length,
+        )
+    elif type_name.endswith(')'):
+        return _decode_tuple(
+            expr, abi_type, hex_output, fixed_output, checksum, int_output
+        )
+    elif type_name == 'bytes':
+        if padded:
+            length = _binary_to_int(expr.bin.slice(24, 8), pl.UInt64)
+            return _format_binary(expr.bin.slice(32, length), hex_output)
+        else:
+            return _format_binary(expr, hex_output)
+    elif type_name == 'string':
+        return expr.cast(pl.String)
+    elif type_name == 'address':
+        if hex_output and checksum:
+            return _format_checksum(expr)
+        return _format_fixed(expr, 20, hex_output, fixed_output)
+    elif type_name == 'bool':
+        return _binary_to_int(expr.bin.slice(-1), pl.UInt8) != 0
+    elif type_name.startswith('int'):
+        return _decode_binary_signed_int(expr, abi_type, int_output)
+    elif type_name.startswith('uint'):
+        return _decode_binary_unsigned_int(expr, abi_type, int_output)
+    elif type_name.startswith('bytes'):
+        n_bytes = abi_type['n_bits'] // 8  # type: ignore
+        return _format_fixed(expr, n_bytes, hex_output, fixed_output)
+    elif type_name.startswith('fixed'):
+        return _decode_binary_fixed(expr, abi_type, int_output, signed=True)
+    elif type_name.startswith('ufixed'):
+        return _decode_binary_fixed(expr, abi_type, int_output, signed=False)
+    elif type_name == 'function':
+        return pl.struct(
+            address=_format_binary(expr.bin.slice(-24, 20), hex_output),
+            selector=_format_binary(expr.bin.slice(-4, 4), hex_output),
+        )
+    else:
+        raise Exception()
+
+
+def _format_binary(expr: pl.Expr, hex_output: bool) -> pl.Expr:
+    if hex_output:
+        return conversions.binary_expr_to_hex(expr, prefix=True)
+    else:
+        return expr
+
+
+def _format_fixed(
+    expr: pl.Expr, n_bytes: int, hex_output: bool, fixed_output: bool
+) -> pl.Expr:
+    if fixed_output:
+        return conversions.binary_expr_to_fixed(expr, n_bytes)
+    else:
+        return _format_binary(expr, hex_output)
+
+
+def _format_checksum(expr: pl.Expr) -> pl.Expr:
+    return conversions.binary_expr_to_hex(expr, prefix=True, checksum=True)
+
+
+def _decode_array(
+    expr: pl.Expr,
+    abi_type: decoding_types.AbiType,
+    hex_output: bool,
+    fixed_output: bool,
+    checksum: bool,
+    int_output: decoding_types.IntOutput,
+    max_array_length: int,
+) -> pl.Expr:
+    import polars as pl
+
+    subtype = abi_type['array_type']
+    if subtype is None:
+        raise Exception('must specify array type')
+
+    exprs = []
+    length: pl.Expr | None
+    if abi_type['array_length'] is not None:
+        array_length = abi_type['array_length']
+        pre_offset = 0
+        length = None
+    else:
+        array_length = max_array_length
+        pre_offset = 32
+        length = _binary_to_int(expr.bin.slice(24, 8), pl.UInt64)
+    for i in range(array_length):
+        if subtype['has_tail']:
+            offset = _binary_to_int(
+                expr.bin.slice(pre_offset + i * 32 + 24, 8), pl.UInt64
+            )
+            if subtype['static']:
+                tail_length_bytes: int | pl.Expr = subtype['n_bits'] // 8  # type: ignore
+            else:
+                tail_length_bytes = _binary_to_int(
+                    expr.bin.slice(pre_offset + offset + 24, 8), pl.UInt64
+                )
+                offset += 32
+            body = expr.bin.slice(pre_offset + offset, tail_length_bytes)
+        else:
+            body = expr.bin.slice(pre_offset + i * 32, 32)
+        subexpr = decode_binary_expr(
+            body,
+            subtype,
+            hex_output=hex_output,
+            fixed_output=fixed_output,
+            checksum=checksum,
+            int_output=int_output,
+        )
+        if length is not None:
+            subexpr = pl.when(length > i).then(subexpr)
+        exprs.append(subexpr)
+
+    output = pl.concat_list(exprs)
+
+    if abi_type['array_length'] is None:
+        output = output.list.eval(
+            pl.element().filter(pl.element().is_not_null())
+        )
+
+    return output
+
+
+def _decode_tuple(
+    expr: pl.Expr,
+    abi_type: decoding_types.AbiType,
+    hex_output: bool = False,
+    fixed_output: bool = False,
+    checksum: bool = False,
+    int_output: decoding_types.IntOutput = 'float',
+) -> pl.Expr:
+    import polars as pl
+
+    if abi_type['name'] == '()':
+        return pl.lit({})
+
+    tuple_names = abi_type['tuple_names']
+    tuple_types = abi_type['tuple_types']
+    if tuple_types is None:
+        raise Exception('tuple_types must be specified')
+    if tuple_names is None:
+        tuple_names = [None] * len(tuple_types)
+    fields = []
+    for i, (name, subtype) in enumerate(zip(tuple_names, tuple_types)):
+        if name is None:
+            name = 'field' + str(i)
+        if not subtype['has_tail']:
+            field = decode_binary_expr(
+                expr=expr.bin.slice(i * 32, 32),
+                abi_type=subtype,
+                padded=True,
+                hex_output=hex_output,
+                fixed_output=fixed_output,
+                checksum=checksum,
+                int_output=int_output,
+            )
+        else:
+            offset = _binary_to_int(expr.bin.slice(i * 32 + 24, 8), pl.UInt64)
+            tail_length = _binary_to_int(
+                expr.bin.slice(offset + 24, 8), pl.UInt64
+            )
+
+            if (
+                subtype['array_type'] is not None
+                and (subtype['array_type']['has_tail'])
+            ):
+                raise NotImplementedError(
+                    'decoding tuples of arrays: ' + str(abi_type['name'])
+                )
+            if subtype['tuple_types'] is not None and any(
+                tuple_type['has_tail'] for tuple_type in subtype['tuple_types']
+            ):
+                raise NotImplementedError(
+                    'decoding nested dynammic tuples: ' + str(abi_type['name'])
+                )
+
+            padded = True
+            if subtype['name'] in ('string', 'bytes'):
+                padded = False
+                offset = offset + 32
+            else:
+                tail_length = (tail_length + 1) * 32
+            data = expr.bin.slice(offset, tail_length)
+            field = decode_binary_expr(
+                data,
+                subtype,
+                padded=padded,
+                hex_output=hex_output,
+                fixed_output=fixed_output,
+                checksum=checksum,
+                int_output=int_output,
+            )
+        fields.append(field.alias(name))
+    return pl.struct(fields)
+
+
+def _binary_to_int(expr: pl.Expr, dtype: type[pl.DataType]) -> pl.Expr:
+    return expr.bin.reinterpret(dtype=dtype, endianness='big')
+
+
+def _is_negative(expr: pl.Expr) -> pl.Expr:
+    import polars as pl
+
+    return expr.bin.slice(0, 1) > pl.lit(b'\x7f')
+
+
+def _decode_binary_signed_int(
+    expr: pl.Expr,
+    abi_type: decoding_types.AbiType,
+    int_output: decoding_types.IntOutput,
+) -> pl.Expr:
+    import polars as pl
+
+    n_bits = abi_type['n_bits']
+    if n_bits is None:
+        raise Exception('n_bits must be specified')
+    if n_bits % 8 != 0:
+        raise Exception('n_bits must be multiple of 8')
+    elif n_bits <= 0:
+        raise Exception('n_bits must be positive')
+    if n_bits == 8:
+        return _binary_to_int(expr, pl.Int8)
+    elif n_bits == 16:
+        return _binary_to_int(expr, pl.Int16)
+    elif n_bits == 32:
+        return _binary_to_int(expr, pl.Int32)
+    elif n_bits == 64:
+        return _binary_to_int(expr, pl.Int64)
+    elif n_bits == 24:
+        full = (
+            pl.when(_is_negative(expr))
+            .then(b'\xff' + expr)
+            .otherwise(b'\x00' + expr)
+        )
+        return _binary_to_int(full, pl.Int32)
+    elif n_bits < 64:
+        n_padding_bytes = (64 - n_bits) // 8
+        full = (
+            pl.when(_is_negative(expr))
+            .then(b'\xff' * n_padding_bytes + expr)
+            .otherwise(b'\x00' * n_padding_bytes + expr)
+        )
+        return _binary_to_int(full, pl.Int64)
+    elif n_bits > 64:
+        return _decode_wide_int(expr, 'i' + str(n_bits), int_output)
+    else:
+        raise Exception('invalid number of bits')
+
+
+def _decode_binary_unsigned_int(
+    expr: pl.Expr,
+    abi_type: decoding_types.AbiType,
+    int_output: decoding_types.IntOutput,
+) -> pl.Expr:
+    import polars as pl
+
+    n_bits = abi_type['n_bits']
+    if n_bits is None:
+        raise Exception('n_bits must be specified')
+    if n_bits % 8 != 0:
+        raise Exception('n_bits must be multiple of 8')
+    elif n_bits <= 0:
+        raise Exception('n_bits must be positive')
+    if n_bits == 8:
+        return _binary_to_int(expr, pl.UInt8)
+    elif n_bits == 16:
+        return _binary_to_int(expr, pl.UInt16)
+    elif n_bits == 32:
+        return _binary_to_int(expr, pl.UInt32)
+    elif n_bits == 64:
+        return _binary_to_int(expr, pl.UInt64)
+    elif n_bits == 24:
+        return _binary_to_int(b'\x00' + expr, pl.UInt32)
+    elif n_bits < 64:
+        n_padding_bytes = (64 - n_bits) // 8
+        return _binary_to_int(b'\x00' * n_padding_bytes + expr, pl.UInt64)
+    elif n_bits > 64:
+        return _decode_wide_int(expr, 'u' + str(n_bits), int_output)
+    else:
+        raise Exception('invalid number of bits')
+
+
+def _decode_wide_int(
+    expr: pl.Expr, raw_type: str, int_output: decoding_types.IntOutput
+) -> pl.Expr:
+    if int_output == 'float':
+        return conversions.binary_expr_to_float(expr, raw_type)
+    elif int_output == 'exact':
+        return conversions.binary_expr_to_int(expr, raw_type)
+    elif int_output == 'decimal_str':
+        return conversions.raw_binary_expr_to_decimal_str(expr, raw_type)
+    else:
+        raise Exception('invalid int_output: ' + str(int_output))
+
+
+def _decode_binary_fixed(
+    expr: pl.Expr,
+    abi_type: decoding_types.AbiType,
+    int_output: decoding_types.IntOutput,
+    *,
+    signed: bool,
+) -> pl.Expr:
+    import polars as pl
+
+    from .. import amounts
+
+    fixed_scale = abi_type['fixed_scale']
+    if fixed_scale is None:
+        raise Exception('must specify fixed_scale')
+    int_type = ('int' if signed else 'uint') + str(abi_type['n_bits'])
+    if int_output == 'float':
+        f64 = decode_binary_expr(expr, int_type, padded=False)
+        return f64 / (10.0 ** pl.lit(int(fixed_scale)))
+
+    # decimal strings are exact for any number of digits
+    if int_output == 'decimal_str':
+        digits = decode_binary_expr(
+            expr, int_type, padded=False, int_output='decimal_str'
+        )
+        return conversions.scale_decimal_str_expr(
+            digits.cast(pl.String), fixed_scale
+        )
+
+    # pl.Decimal values go through the same path as token amounts, values
+    # over 38 digits become null
+    if int_output != 'exact':
+        raise Exception('invalid int_output: ' + str(int_output))
+    if fixed_scale > amounts._max_precision:
+        raise Exception(
+            'exact output supports scales up to 38, use decimal_str'
+        )
+    raw = decode_binary_expr(expr, int_type, padded=False, int_output='exact')
+    return amounts.scale_amount(
+        raw, fixed_scale, signed=signed, scale=fixed_scale
+    )
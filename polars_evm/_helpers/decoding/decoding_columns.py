@@ -6,6 +6,7 @@ if typing.TYPE_CHECKING:
     import polars as pl
 
 from .. import conversions
+from . import decoding_binary
 from . import decoding_types
 
 
@@ -16,40 +17,47 @@ def decode_df(
     padded: bool = True,
     prefix: bool = True,
     hex_output: bool = False,
+    fixed_output: bool = False,
+    checksum: bool = False,
+    int_output: decoding_types.IntOutput = 'float',
     replace: bool = False,
 ) -> pl.DataFrame:
     import polars as pl
 
-    hex_exprs = {}
     decode_exprs = {}
     schema = df.collect_schema()
     for name, abi_type in column_types.items():
         column_dtype = schema.get(name)
         if column_dtype == pl.String:
-            hex_expr = pl.col(name)
+            expr = decode_hex_expr(
+                pl.col(name),
+                abi_type=abi_type,
+                padded=padded,
+                prefix=prefix,
+                hex_output=hex_output,
+                fixed_output=fixed_output,
+                checksum=checksum,
+                int_output=int_output,
+            )
         elif column_dtype == pl.Binary:
-            hex_name = name + 'as_hex'
-            hex_exprs[hex_name] = pl.col.name.bin.encode('hex')
-            hex_expr = pl.col(hex_name)
+            expr = decoding_binary.decode_binary_expr(
+                pl.col(name),
+                abi_type=abi_type,
+                padded=padded,
+                hex_output=hex_output,
+                fixed_output=fixed_output,
+                checksum=checksum,
+                int_output=int_output,
+            )
         else:
             raise Exception('invalid column type')
 
         if not replace:
             name = name + '_decoded'
 
-        decode_exprs[name] = decode_hex_expr(
-            hex_expr,
-            abi_type=abi_type,
-            padded=padded,
-            prefix=prefix,
-            hex_output=hex_output,
-        )
+        decode_exprs[name] = expr
 
-    return (
-        df.with_columns(**hex_exprs)
-        .with_columns(**decode_exprs)
-        .drop(*hex_exprs.keys())
-    )
+    return df.with_columns(**decode_exprs)
 
 
 def decode_hex_series(
@@ -59,6 +67,9 @@ def decode_hex_series(
     padded: bool = True,
     prefix: bool = True,
     hex_output: bool = False,
+    fixed_output: bool = False,
+    checksum: bool = False,
+    int_output: decoding_types.IntOutput = 'float',
 ) -> pl.Series:
     expr = decode_hex_expr(
         pl.col.as_hex,
@@ -66,6 +77,9 @@ def decode_hex_series(
         padded=padded,
         prefix=prefix,
         hex_output=hex_output,
+        fixed_output=fixed_output,
+        checksum=checksum,
+        int_output=int_output,
     )
     return pl.DataFrame({'as_hex': series}).select(decoded=expr)['decoded']
 
@@ -77,6 +91,9 @@ def decode_hex_expr(
     padded: bool = True,
     prefix: bool = True,
     hex_output: bool = False,
+    fixed_output: bool = False,
+    checksum: bool = False,
+    int_output: decoding_types.IntOutput = 'float',
     max_array_length: int = 32,
 ) -> pl.Expr:
     """
@@ -84,11 +101,15 @@ def decode_hex_expr(
 
     - padded: True if there might be leftside padding
     - prefix: True if there might be a '0x' prefix on entries
+    - fixed_output: output address and bytesN as pl.Array(pl.UInt8, n_bytes)
+    - checksum: with hex_output, output addresses as EIP-55 checksummed hex
 
     see abi spec here https://docs.soliditylang.org/en/develop/abi-spec.html
     """
     import polars as pl
 
+    if hex_output and fixed_output:
+        raise Exception('cannot use both hex_output and fixed_output')
     if isinstance(abi_type, str):
         abi_type = decoding_types.parse_abi_type(abi_type)
     type_name = abi_type['name']
@@ -113,9 +134,19 @@ def decode_hex_expr(
 
     # decode type
     if type_name.endswith(']'):
-        return _decode_array(expr, abi_type, hex_output, max_array_length)
+        return _decode_array(
+            expr,
+            abi_type,
+            hex_output,
+            fixed_output,
+            checksum,
+            int_output,
+            max_array_length,
+        )
     elif type_name.endswith(')'):
-        return _decode_tuple(expr, abi_type, hex_output)
+        return _decode_tuple(
+            expr, abi_type, hex_output, fixed_output, checksum, int_output
+        )
     elif type_name == 'bytes':
         if padded:
             length = _hex_to_int(expr.str.slice(48, 16), pl.UInt64)
@@ -125,29 +156,22 @@ def decode_hex_expr(
     elif type_name == 'string':
         return expr.str.decode('hex').cast(pl.String)
     elif type_name == 'address':
-        return _format_binary(expr, hex_output)
+        if hex_output and checksum:
+            return _format_checksum(expr)
+        return _format_fixed(expr, 20, hex_output, fixed_output)
     elif type_name == 'bool':
         return expr.str.slice(-1) != '0'
     elif type_name.startswith('int'):
-        return _decode_hex_signed_int(expr, abi_type)
+        return _decode_hex_signed_int(expr, abi_type, int_output)
     elif type_name.startswith('uint'):
-        return _decode_hex_unsigned_int(expr, abi_type)
+        return _decode_hex_unsigned_int(expr, abi_type, int_output)
     elif type_name.startswith('bytes'):
-        return _format_binary(expr, hex_output)
+        n_bytes = abi_type['n_bits'] // 8  # type: ignore
+        return _format_fixed(expr, n_bytes, hex_output, fixed_output)
     elif type_name.startswith('fixed'):
-        f64 = decode_hex_expr(
-            expr, 'int' + str(abi_type['n_bits']), padded=False
-        )
-        if abi_type['fixed_scale'] is None:
-            raise Exception('must specify fixed_scale')
-        return f64 / (10.0 ** pl.lit(int(abi_type['fixed_scale'])))
+        return _decode_hex_fixed(expr, abi_type, int_output, signed=True)
     elif type_name.startswith('ufixed'):
-        f64 = decode_hex_expr(
-            expr, 'uint' + str(abi_type['n_bits']), padded=False
-        )
-        if abi_type['fixed_scale'] is None:
-            raise Exception('must specify fixed_scale')
-        return f64 / (10.0 ** pl.lit(int(abi_type['fixed_scale'])))
+        return _decode_hex_fixed(expr, abi_type, int_output, signed=False)
     elif type_name == 'function':
         return pl.struct(
             address=_format_binary(expr.str.slice(-48, 40), hex_output),
@@ -164,10 +188,28 @@ def _format_binary(expr: pl.Expr, hex_output: bool) -> pl.Expr:
         return expr.str.decode('hex')
 
 
+def _format_fixed(
+    expr: pl.Expr, n_bytes: int, hex_output: bool, fixed_output: bool
+) -> pl.Expr:
+    if fixed_output:
+        binary = expr.str.decode('hex', strict=False)
+        return conversions.binary_expr_to_fixed(binary, n_bytes)
+    else:
+        return _format_binary(expr, hex_output)
+
+
+def _format_checksum(expr: pl.Expr) -> pl.Expr:
+    binary = expr.str.decode('hex', strict=False)
+    return conversions.binary_expr_to_hex(binary, prefix=True, checksum=True)
+
+
 def _decode_array(
     expr: pl.Expr,
     abi_type: decoding_types.AbiType,
     hex_output: bool,
+    fixed_output: bool,
+    checksum: bool,
+    int_output: decoding_types.IntOutput,
     max_array_length: int,
 ) -> pl.Expr:
     import polars as pl
@@ -177,12 +219,15 @@ def _decode_array(
         raise Exception('must specify array type')
 
     exprs = []
+    length: pl.Expr | None
     if abi_type['array_length'] is not None:
         array_length = abi_type['array_length']
         pre_offset = 0
+        length = None
     else:
         array_length = max_array_length
         pre_offset = 64
+        length = _hex_to_int(expr.str.slice(48, 16), pl.UInt64)
     for i in range(array_length):
         if subtype['has_tail']:
             offset = _hex_to_int(
@@ -200,50 +245,35 @@ def _decode_array(
             )
         else:
             body = expr.str.slice(pre_offset + i * 64, 64)
-        subexpr = decode_hex_expr(body, subtype, hex_output=hex_output)
+        subexpr = decode_hex_expr(
+            body,
+            subtype,
+            hex_output=hex_output,
+            fixed_output=fixed_output,
+            checksum=checksum,
+            int_output=int_output,
+        )
+        if length is not None:
+            subexpr = pl.when(length > i).then(subexpr)
         exprs.append(subexpr)
 
     output = pl.concat_list(exprs)
 
     if abi_type['array_length'] is None:
-        if subtype['name'].startswith('bytes'):
-            output = output.list.eval(pl.element().filter(pl.element() != '0x'))
-        elif subtype['name'].endswith(')'):
-            field_names = _get_tuple_field_names(subtype)
-            output = output.list.eval(
-                pl.element().filter(
-                    pl.element().struct.field(*field_names).null_count()
-                    < len(field_names)
-                )
-            )
-        else:
-            output = output.list.eval(
-                pl.element().filter(pl.element().is_not_null())
-            )
+        output = output.list.eval(
+            pl.element().filter(pl.element().is_not_null())
+        )
 
     return output
 
 
-def _get_tuple_field_names(abi_type: decoding_types.AbiType) -> list[str]:
-    tuple_types = abi_type['tuple_types']
-    if tuple_types is None:
-        raise Exception('not a tuple type')
-
-    tuple_names = abi_type['tuple_names']
-    if tuple_names is None:
-        tuple_names = [None] * len(tuple_types)
-    output_names = []
-    for i, name in enumerate(tuple_names):
-        if name is None:
-            name = 'field' + str(i)
-        output_names.append(name)
-    return output_names
-
-
 def _decode_tuple(
     expr: pl.Expr,
     abi_type: decoding_types.AbiType,
     hex_output: bool = False,
+    fixed_output: bool = False,
+    checksum: bool = False,
+    int_output: decoding_types.IntOutput = 'float',
 ) -> pl.Expr:
     import polars as pl
 
@@ -267,6 +297,9 @@ def _decode_tuple(
                 padded=True,
                 prefix=False,
                 hex_output=hex_output,
+                fixed_output=fixed_output,
+                checksum=checksum,
+                int_output=int_output,
             )
         else:
             offset = _hex_to_int(expr.str.slice(i * 64 + 48, 16), pl.UInt64)
@@ -303,6 +336,9 @@ def _decode_tuple(
                 padded=padded,
                 prefix=False,
                 hex_output=hex_output,
+                fixed_output=fixed_output,
+                checksum=checksum,
+                int_output=int_output,
             )
         fields.append(field.alias(name))
     return pl.struct(fields)
@@ -313,7 +349,9 @@ def _hex_to_int(expr: pl.Expr, dtype: type[pl.DataType]) -> pl.Expr:
 
 
 def _decode_hex_signed_int(
-    expr: pl.Expr, abi_type: decoding_types.AbiType
+    expr: pl.Expr,
+    abi_type: decoding_types.AbiType,
+    int_output: decoding_types.IntOutput,
 ) -> pl.Expr:
     import polars as pl
 
@@ -338,7 +376,7 @@ def _decode_hex_signed_int(
         return _hex_to_int(full, pl.Int32)
     elif n_bits < 64:
         is_negative = expr.str.slice(0, 2).str.to_lowercase() > '7f'
-        n_padding_bytes = int((64 - n_bits) / 2)
+        n_padding_bytes = int((64 - n_bits) / 8)
         full = (
             pl.when(is_negative)
             .then('FF' * n_padding_bytes + expr)
@@ -346,13 +384,15 @@ def _decode_hex_signed_int(
         )
         return _hex_to_int(full, pl.Int64)
     elif n_bits > 64:
-        return conversions.hex_expr_to_float(expr, 'i' + str(n_bits))
+        return _decode_wide_int(expr, 'i' + str(n_bits), int_output)
     else:
         raise Exception('invalid number of bits')
 
 
 def _decode_hex_unsigned_int(
-    expr: pl.Expr, abi_type: decoding_types.AbiType
+    expr: pl.Expr,
+    abi_type: decoding_types.AbiType,
+    int_output: decoding_types.IntOutput,
 ) -> pl.Expr:
     import polars as pl
 
@@ -374,9 +414,65 @@ def _decode_hex_unsigned_int(
     elif n_bits == 24:
         return _hex_to_int('00' + expr, pl.UInt32)
     elif n_bits < 64:
-        n_padding_bytes = int((64 - n_bits) / 2)
+        n_padding_bytes = int((64 - n_bits) / 8)
         return _hex_to_int('00' * n_padding_bytes + expr, pl.UInt64)
     elif n_bits > 64:
-        return conversions.hex_expr_to_float(expr, 'u' + str(n_bits))
+        return _decode_wide_int(expr, 'u' + str(n_bits), int_output)
     else:
         raise Exception('invalid number of bits')
+
+
+def _decode_wide_int(
+    expr: pl.Expr, raw_type: str, int_output: decoding_types.IntOutput
+) -> pl.Expr:
+    if int_output == 'float':
+        return conversions.hex_expr_to_float(expr, raw_type)
+    elif int_output == 'exact':
+        return conversions.hex_expr_to_int(expr, raw_type)
+    elif int_output == 'decimal_str':
+        binary = expr.str.decode('hex')
+        return conversions.raw_binary_expr_to_decimal_str(binary, raw_type)
+    else:
+        raise Exception('invalid int_output: ' + str(int_output))
+
+
+def _decode_hex_fixed(
+    expr: pl.Expr,
+    abi_type: decoding_types.AbiType,
+    int_output: decoding_types.IntOutput,
+    *,
+    signed: bool,
+) -> pl.Expr:
+    import polars as pl
+
+    from .. import amounts
+
+    fixed_scale = abi_type['fixed_scale']
+    if fixed_scale is None:
+        raise Exception('must specify fixed_scale')
+    int_type = ('int' if signed else 'uint') + str(abi_type['n_bits'])
+    if int_output == 'float':
+        f64 = decode_hex_expr(expr, int_type, padded=False)
+        return f64 / (10.0 ** pl.lit(int(fixed_scale)))
+
+    # decimal strings are exact for any number of digits
+    if int_output == 'decimal_str':
+        digits = decode_hex_expr(
+            expr, int_type, padded=False, int_output='decimal_str'
+        )
+        return conversions.scale_decimal_str_expr(
+            digits.cast(pl.String), fixed_scale
+        )
+
+    # pl.Decimal values go through the same path as token amounts, values
+    # over 38 digits become null
+    if int_output != 'exact':
+        raise Exception('invalid int_output: ' + str(int_output))
+    if fixed_scale > amounts._max_precision:
+        raise Exception(
+            'exact output supports scales up to 38, use decimal_str'
+        )
+    raw = decode_hex_expr(expr, int_type, padded=False, int_output='exact')
+    return amounts.scale_amount(
+        raw, fixed_scale, signed=signed, scale=fixed_scale
+    )
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import functools
+import json
 import typing
 
+from . import decoding_binary
 from . import decoding_columns
 
 if typing.TYPE_CHECKING:
     import polars as pl
 
+    from ..address_dictionary import AddressDictionary
+    from . import decoding_types
+
     _T = typing.TypeVar('_T', pl.DataFrame, pl.LazyFrame)
 
 
@@ -18,57 +24,43 @@ def decode_events(
     drop_raw_columns: bool = True,
     name_prefix: str | None = None,
     hex_output: bool = False,
+    fixed_output: bool = False,
+    checksum: bool = False,
+    int_output: decoding_types.IntOutput = 'float',
+    address_dictionary: AddressDictionary | None = None,
 ) -> _T:
-    import polars as pl
+    """
+    - address_dictionary: output address fields as UInt32 ids of dictionary
 
+    decoding expressions are cached by abi, raw column dtypes, and options,
+    so repeated calls over new frames only build them once
+    """
     # decide which columns to decode
     if columns is None:
         columns = [input['name'] for input in event_abi.get('inputs', [])]
 
-    # gather abi info
-    input_abis = {i['name']: i for i in event_abi['inputs']}
-    indexed = [i['name'] for i in event_abi['inputs'] if i['indexed']]
-    unindexed = [i['name'] for i in event_abi['inputs'] if not i['indexed']]
-
-    # build columns
     schema = events.collect_schema()
-    temp_exprs = {}
-    column_exprs = {}
-    for column in columns:
-        # get raw column expr
-        if column in indexed:
-            raw_column = 'topic' + str(indexed.index(column) + 1)
-        else:
-            raw_column = 'data'
+    filters, column_exprs, id_columns = _get_event_plan(
+        json.dumps(event_abi, sort_keys=True),
+        tuple(schema.get(name) for name in _raw_columns),
+        tuple(columns),
+        hex_output=hex_output,
+        fixed_output=fixed_output,
+        checksum=checksum,
+        int_output=int_output,
+        use_ids=address_dictionary is not None,
+    )
 
-        # create temp hex column as needed
-        schema_dtype = schema.get(raw_column)
-        if schema_dtype == pl.Binary:
-            hex_name = raw_column + '_hex'
-            temp_exprs[hex_name] = pl.col(raw_column).bin.encode('hex')
-            expr = pl.col(hex_name)
-            padded = True
-            prefix = False
-        elif schema_dtype == pl.String:
-            expr = pl.col(raw_column)
-            padded = True
-            prefix = True
-        else:
-            raise Exception()
-        if column not in indexed:
-            expr = expr.str.slice(64 * unindexed.index(column), 64)
-
-        # decode column expression
-        column_exprs[column] = decoding_columns.decode_hex_expr(
-            expr=expr,
-            abi_type=input_abis[column]['type'],
-            padded=padded,
-            prefix=prefix,
-            hex_output=hex_output,
-        )
+    # ids are looked up outside of the cache, the dictionary can grow
+    column_exprs = dict(column_exprs)
+    if address_dictionary is not None:
+        for column in id_columns:
+            column_exprs[column] = address_dictionary.intern_expr(
+                column_exprs[column]
+            )
 
     # insert prefix
-    if name_prefix is None and any(k in events.columns for k in column_exprs):
+    if name_prefix is None and any(k in schema for k in column_exprs):
         name_prefix = 'event__'
     if name_prefix is not None:
         column_exprs = {name_prefix + k: v for k, v in column_exprs.items()}
@@ -76,14 +68,9 @@ def decode_events(
     # decide which columns to drop
     drop = []
     if drop_raw_columns:
-        drop = ['topic0', 'topic1', 'topic2', 'topic3', 'data']
+        drop = list(_raw_columns)
 
-    return (
-        events.filter(_get_event_filters(schema, event_abi))
-        .with_columns(**temp_exprs)
-        .with_columns(**column_exprs)
-        .drop(*temp_exprs.keys(), *drop)
-    )
+    return events.filter(filters).with_columns(**column_exprs).drop(*drop)
 
 
 def decode_contract_events(
@@ -93,23 +80,23 @@ def decode_contract_events(
     drop_raw_columns: bool = True,
     name_prefix: str | None = None,
     hex_output: bool = False,
+    fixed_output: bool = False,
+    checksum: bool = False,
+    int_output: decoding_types.IntOutput = 'float',
+    address_dictionary: AddressDictionary | None = None,
     ignore_unknown: bool = False,
     key: typing.Literal['topic0', 'name'] | None = None,
 ) -> dict[str, pl.DataFrame]:
-    import ctc
     import polars as pl
 
-    events = events.with_columns(
-        data_hex=pl.col.data.bin.encode('hex'),
-    ).with_columns(selector=pl.col.topic0)
+    events = events.with_columns(selector=pl.col.topic0)
 
     event_abis: list[dict[str, typing.Any]] = [
         event_abi for event_abi in contract_abi if event_abi['type'] == 'event'
     ]
     names = [event_abi['name'] for event_abi in event_abis]
     topic0s = [
-        bytes.fromhex(ctc.get_event_hash(event_abi)[2:])  # type: ignore
-        for event_abi in event_abis
+        bytes.fromhex(get_event_hash(event_abi)[2:]) for event_abi in event_abis
     ]
     abis_by_selector = dict(zip(topic0s, event_abis))
 
@@ -138,19 +125,121 @@ def decode_contract_events(
             drop_raw_columns=drop_raw_columns,
             name_prefix=name_prefix,
             hex_output=hex_output,
+            fixed_output=fixed_output,
+            checksum=checksum,
+            int_output=int_output,
+            address_dictionary=address_dictionary,
         )
 
     return output
 
 
 def get_event_hash(event_abi: dict[str, typing.Any]) -> str:
+    return _get_event_hash(json.dumps(event_abi, sort_keys=True))
+
+
+#
+# # helpers
+#
+
+
+_raw_columns = ('topic0', 'topic1', 'topic2', 'topic3', 'data')
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_event_hash(event_abi_json: str) -> str:
     import ctc
 
-    return ctc.get_event_hash(event_abi)  # type: ignore
+    return ctc.get_event_hash(json.loads(event_abi_json))  # type: ignore
+
+
+@functools.lru_cache(maxsize=256)
+def _get_event_plan(
+    event_abi_json: str,
+    raw_dtypes: tuple[pl.DataType | None, ...],
+    columns: tuple[str, ...],
+    *,
+    hex_output: bool,
+    fixed_output: bool,
+    checksum: bool,
+    int_output: decoding_types.IntOutput,
+    use_ids: bool,
+) -> tuple[list[pl.Expr], dict[str, pl.Expr], list[str]]:
+    """
+    build event filters and decoding expressions of each column
+
+    returns filters, decoding expressions, and address columns to map to ids.
+    results are shared between calls and must not be modified
+    """
+    import polars as pl
+
+    event_abi = json.loads(event_abi_json)
+    schema = dict(zip(_raw_columns, raw_dtypes))
+
+    # gather abi info
+    input_abis = {i['name']: i for i in event_abi['inputs']}
+    indexed = [i['name'] for i in event_abi['inputs'] if i['indexed']]
+    unindexed = [i['name'] for i in event_abi['inputs'] if not i['indexed']]
+
+    # build columns
+    column_exprs = {}
+    id_columns = []
+    for column in columns:
+        # get raw column expr
+        if column in indexed:
+            raw_column = 'topic' + str(indexed.index(column) + 1)
+        else:
+            raw_column = 'data'
+
+        # addresses are decoded as binary before mapping to ids
+        column_hex_output = hex_output
+        column_fixed_output = fixed_output
+        if use_ids and input_abis[column]['type'] == 'address':
+            column_hex_output = False
+            column_fixed_output = False
+            id_columns.append(column)
+
+        # decode binary columns directly, decode string columns as hex
+        schema_dtype = schema.get(raw_column)
+        if schema_dtype == pl.Binary:
+            expr = pl.col(raw_column)
+            if column not in indexed:
+                expr = expr.bin.slice(32 * unindexed.index(column), 32)
+            column_exprs[column] = decoding_binary.decode_binary_expr(
+                expr=expr,
+                abi_type=input_abis[column]['type'],
+                padded=True,
+                hex_output=column_hex_output,
+                fixed_output=column_fixed_output,
+                checksum=checksum,
+                int_output=int_output,
+            )
+        elif schema_dtype == pl.String:
+            expr = pl.col(raw_column)
+            if column not in indexed:
+                expr = expr.str.strip_prefix('0x').str.slice(
+                    64 * unindexed.index(column), 64
+                )
+            column_exprs[column] = decoding_columns.decode_hex_expr(
+                expr=expr,
+                abi_type=input_abis[column]['type'],
+                padded=True,
+                prefix=True,
+                hex_output=column_hex_output,
+                fixed_output=column_fixed_output,
+                checksum=checksum,
+                int_output=int_output,
+            )
+        else:
+            raise Exception('invalid column dtype: ' + str(schema_dtype))
+
+    filters = _get_event_filters(schema, event_abi)
+    return filters, column_exprs, id_columns
 
 
 def _get_event_filters(
-    schema: pl.Schema, event_abi: dict[str, typing.Any]
+    schema: typing.Mapping[str, pl.DataType | None],
+    event_abi: dict[str, typing.Any],
 ) -> list[pl.Expr]:
     import polars as pl
 
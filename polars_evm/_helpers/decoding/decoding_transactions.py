@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
+import json
 import typing
 
-from . import decoding_columns
+from . import decoding_binary
 
 if typing.TYPE_CHECKING:
     import polars as pl
@@ -34,19 +36,19 @@ def _decode_transactions_contract_abi(
     contract_abi: list[dict[str, typing.Any]],
     ignore_unknown: bool,
 ) -> dict[str, pl.DataFrame]:
-    import ctc
+    import polars as pl
 
     transactions = transactions.with_columns(
-        input_hex=pl.col.input.bin.encode('hex'),
-    ).with_columns(
-        selector=pl.col.input_hex.str.slice(0, 8),
+        selector=pl.col.input.bin.slice(0, 4).bin.encode('hex'),
     )
 
-    abis_by_selector = {
-        ctc.get_function_selector(function_abi): function_abi  # type: ignore
-        for function_abi in contract_abi
-        if function_abi['type'] == 'function'
-    }
+    abis_by_selector = {}
+    for function_abi in contract_abi:
+        if function_abi['type'] == 'function':
+            selector = _get_function_selector(
+                json.dumps(function_abi, sort_keys=True)
+            )
+            abis_by_selector[selector] = function_abi
 
     if ignore_unknown:
         transactions = transactions.filter(
@@ -69,27 +71,54 @@ def _decode_transactions_function_abi(
     transactions: pl.DataFrame,
     function_abi: dict[str, typing.Any],
 ) -> pl.DataFrame:
+    import polars as pl
+
+    function_selector, cols = _get_function_plan(
+        json.dumps(function_abi, sort_keys=True)
+    )
+    return transactions.filter(
+        pl.col.input.bin.starts_with(bytes.fromhex(function_selector))
+    ).with_columns(
+        selector=pl.col.input.bin.slice(0, 4).bin.encode('hex'),
+        function_data=pl.col.input.bin.slice(4).bin.encode('hex'),
+        function_name=pl.lit(function_abi['name']),
+        **cols,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_function_selector(function_abi_json: str) -> str:
+    """function selector as hex without prefix"""
     import ctc
 
-    function_selector = ctc.get_function_selector(function_abi)  # type: ignore
+    function_abi = json.loads(function_abi_json)
+    return _strip_prefix(ctc.get_function_selector(function_abi))  # type: ignore
+
+
+@functools.lru_cache(maxsize=256)
+def _get_function_plan(
+    function_abi_json: str,
+) -> tuple[str, dict[str, pl.Expr]]:
+    """
+    function selector and decoding expressions of each input
+
+    results are shared between calls and must not be modified
+    """
+    import polars as pl
 
+    function_abi = json.loads(function_abi_json)
     cols = {}
     for i, input in enumerate(function_abi['inputs']):
-        cols[input['name']] = decoding_columns.decode_hex_expr(
-            pl.col.input_hex.str.slice(64 * i, 64),
+        cols[input['name']] = decoding_binary.decode_binary_expr(
+            pl.col.input.bin.slice(4 + 32 * i, 32),
             input['type'],
             padded=True,
-            prefix=False,
         )
+    return _get_function_selector(function_abi_json), cols
 
-    return (
-        transactions.with_columns(input_hex=pl.col.input.bin.encode('hex'))
-        .filter(pl.col.input_hex.str.starts_with(function_selector))
-        .with_columns(
-            selector=pl.col.input_hex.str.slice(0, 8),
-            function_data=pl.col.input_hex.str.slice(8),
-            function_name=pl.lit(function_abi['name']),
-            **cols,
-        )
-        .drop('input_hex')
-    )
+
+def _strip_prefix(selector: str) -> str:
+    if selector.startswith('0x'):
+        return selector[2:]
+    else:
+        return selector
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import typing
 
 if typing.TYPE_CHECKING:
@@ -15,8 +16,17 @@ if typing.TYPE_CHECKING:
         tuple_types: list[AbiType] | None
         has_tail: bool  # when AbiType stored in tuple/array, is it in head?
 
+    # how integers wider than 64 bits are decoded
+    IntOutput = typing.Literal['float', 'exact', 'decimal_str']
 
+
+@functools.lru_cache(maxsize=4096)
 def parse_abi_type(abi_type: str) -> AbiType:
+    """
+    parse abi type string into an AbiType
+
+    results are memoized, so parsed types are shared and must not be modified
+    """
     # default values
     static = True
     n_bits = None
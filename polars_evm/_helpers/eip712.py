@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    _NDArray = np.ndarray[typing.Any, typing.Any]
+
+    Eip712Field = typing.Mapping[str, str]
+    Eip712Types = typing.Mapping[str, typing.Sequence[Eip712Field]]
+
+
+def eip712_hash_series(
+    series: pl.Series,
+    types: Eip712Types,
+    domain: typing.Mapping[str, typing.Any] | None = None,
+    primary_type: str | None = None,
+) -> pl.Series:
+    """
+    EIP-712 hashStruct of each struct, or its signing digest given a domain
+
+    types is the types object of EIP-712 typed data. struct fields are read
+    from struct columns by name. integer fields are integer columns or 32
+    byte words, address and bytesN fields are binary or hex, and arrays are
+    list columns. the digest is keccak(0x1901 ++ domain separator ++
+    hashStruct), with the domain separator computed once. rows with missing
+    or malformed fields become null
+    """
+    import numpy as np
+
+    from .conversions.binary_numpy_conversions import _numpy_to_binary_series
+    from .hashes import _keccak_rows
+
+    if primary_type is None:
+        primary_type = _get_primary_type(types)
+    hashes, valid = _hash_structs(series, primary_type, types)
+    if domain is not None:
+        separator = eip712_domain_separator(domain, types)
+        messages = np.empty((len(series), 66), dtype=np.uint8)
+        messages[:, :2] = [0x19, 0x01]
+        messages[:, 2:34] = np.frombuffer(separator, dtype=np.uint8)
+        messages[:, 34:] = hashes
+        hashes = _keccak_rows(messages)
+    return _numpy_to_binary_series(series.name, hashes, valid)
+
+
+def eip712_hash_expr(
+    expr: pl.Expr,
+    types: Eip712Types,
+    domain: typing.Mapping[str, typing.Any] | None = None,
+    primary_type: str | None = None,
+) -> pl.Expr:
+    """EIP-712 hashStruct or signing digest of each struct"""
+    import polars as pl
+
+    if primary_type is None:
+        primary_type = _get_primary_type(types)
+    return expr.map_batches(
+        lambda series: eip712_hash_series(series, types, domain, primary_type),
+        return_dtype=pl.Binary,
+        is_elementwise=True,
+    )
+
+
+def eip712_domain_separator(
+    domain: typing.Mapping[str, typing.Any],
+    types: Eip712Types | None = None,
+) -> bytes:
+    """
+    hashStruct of an EIP712Domain
+
+    the EIP712Domain type is taken from types if present, and otherwise
+    built from the fields of the domain in their canonical order
+    """
+    import polars as pl
+
+    if types is not None and 'EIP712Domain' in types:
+        domain_type = list(types['EIP712Domain'])
+    else:
+        domain_type = [
+            {'name': name, 'type': field_type}
+            for name, field_type in _domain_field_types.items()
+            if name in domain
+        ]
+    for name in domain:
+        if name not in {field['name'] for field in domain_type}:
+            raise Exception('invalid EIP712Domain field: ' + name)
+    domain_types = {'EIP712Domain': domain_type}
+    series = pl.Series(
+        [{field['name']: domain.get(field['name']) for field in domain_type}]
+    )
+    hashes, valid = _hash_structs(series, 'EIP712Domain', domain_types)
+    if not valid.all():
+        raise Exception('invalid EIP712Domain values')
+    return bytes(hashes[0])
+
+
+def eip712_encode_type(primary_type: str, types: Eip712Types) -> str:
+    """encodeType of a struct, followed by its dependencies sorted by name"""
+    dependencies = sorted(
+        _get_dependencies(primary_type, types) - {primary_type}
+    )
+    return ''.join(
+        name
+        + '('
+        + ','.join(field['type'] + ' ' + field['name'] for field in types[name])
+        + ')'
+        for name in [primary_type, *dependencies]
+    )
+
+
+#
+# # helpers
+#
+
+
+_domain_field_types = {
+    'name': 'string',
+    'version': 'string',
+    'chainId': 'uint256',
+    'verifyingContract': 'address',
+    'salt': 'bytes32',
+}
+
+
+def _get_primary_type(types: Eip712Types) -> str:
+    """the only struct type that no other struct type references"""
+    candidates = set(types) - {'EIP712Domain'}
+    for name in types:
+        for field in types[name]:
+            candidates.discard(_base_type(field['type']))
+    if len(candidates) != 1:
+        raise Exception('could not infer primary_type, specify it explicitly')
+    return candidates.pop()
+
+
+def _base_type(field_type: str) -> str:
+    return field_type.split('[', maxsplit=1)[0]
+
+
+def _get_dependencies(primary_type: str, types: Eip712Types) -> set[str]:
+    dependencies = {primary_type}
+    stack = [primary_type]
+    while len(stack) > 0:
+        for field in types[stack.pop()]:
+            base_type = _base_type(field['type'])
+            if base_type in types and base_type not in dependencies:
+                dependencies.add(base_type)
+                stack.append(base_type)
+    return dependencies
+
+
+def _hash_structs(
+    series: pl.Series, type_name: str, types: Eip712Types
+) -> tuple[_NDArray, _NDArray]:
+    """hashStruct words of a struct series, as (n, 32) words and validity"""
+    import numpy as np
+    import polars as pl
+
+    from .hashes import _keccak_rows, keccak
+
+    if not isinstance(series.dtype, pl.Struct):
+        raise Exception('invalid dtype for ' + type_name + ' structs')
+    encoded_type = eip712_encode_type(type_name, types)
+    type_hash = typing.cast(
+        bytes, keccak(encoded_type, output='binary', text=True)
+    )
+    fields = types[type_name]
+    field_names = {field.name for field in series.dtype.fields}
+
+    messages = np.empty((len(series), 32 * (1 + len(fields))), dtype=np.uint8)
+    messages[:, :32] = np.frombuffer(type_hash, dtype=np.uint8)
+    valid = series.is_not_null().to_numpy()
+    for i, field in enumerate(fields):
+        if field['name'] not in field_names:
+            raise Exception(
+                'missing field ' + field['name'] + ' of ' + type_name
+            )
+        words, field_valid = _encode_field(
+            series.struct.field(field['name']), field['type'], types
+        )
+        messages[:, 32 * (i + 1) : 32 * (i + 2)] = words
+        valid = valid & field_valid
+    return _keccak_rows(messages), valid
+
+
+def _encode_field(
+    series: pl.Series, field_type: str, types: Eip712Types
+) -> tuple[_NDArray, _NDArray]:
+    """encodeData words of one field, dynamic values are hashed"""
+    import polars as pl
+
+    from .conversions import hex_series_to_binary
+    from .conversions.binary_numpy_conversions import _binary_words
+    from .hashes import keccak_series
+    from .storage_slots import _key_words
+
+    if field_type.endswith(']'):
+        return _hash_arrays(series, field_type, types)
+    elif field_type in types:
+        return _hash_structs(series, field_type, types)
+    elif field_type == 'string':
+        hashes = keccak_series(series, output='binary', text=True)
+        return _binary_words(hashes, 32)
+    elif field_type == 'bytes':
+        if series.dtype == pl.String:
+            series = hex_series_to_binary(series)
+        return _binary_words(keccak_series(series, output='binary'), 32)
+    else:
+        return _key_words(series, field_type)
+
+
+def _hash_arrays(
+    series: pl.Series, field_type: str, types: Eip712Types
+) -> tuple[_NDArray, _NDArray]:
+    """keccak of the concatenated encodeData words of each array"""
+    import numpy as np
+    import polars as pl
+
+    from .hashes import _keccak_buffers
+
+    element_type = field_type.rsplit('[', maxsplit=1)[0]
+    if isinstance(series.dtype, pl.Array):
+        series = series.arr.to_list()
+    if not isinstance(series.dtype, pl.List):
+        raise Exception('invalid dtype for ' + field_type + ' arrays')
+
+    lengths = series.list.len().fill_null(0).to_numpy().astype(np.int64)
+    elements = series.explode(empty_as_null=False, keep_nulls=False)
+    words, element_valid = _encode_field(elements, element_type, types)
+
+    # rows are valid only if all of their elements are
+    starts = np.cumsum(lengths) - lengths
+    invalid_rows = np.repeat(np.arange(len(series)), lengths)[~element_valid]
+    valid = series.is_not_null().to_numpy()
+    valid[invalid_rows] = False
+
+    hashes = _keccak_buffers(
+        np.ascontiguousarray(words).reshape(-1), starts * 32, lengths * 32
+    )
+    return hashes, valid
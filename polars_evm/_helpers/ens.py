@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+
+def namehash_series(series: pl.Series) -> pl.Series:
+    """
+    ENS namehash of each name, as 32 byte pl.Binary
+
+    names are split into labels and nodes are built one label depth at a
+    time across all rows. each distinct label and each distinct pair of
+    parent node and label is hashed once, so shared parents such as eth are
+    only hashed once per batch. names must already be normalized. the empty
+    name hashes to 32 zero bytes
+    """
+    import numpy as np
+    import polars as pl
+
+    from .conversions.binary_numpy_conversions import (
+        _binary_words,
+        _numpy_to_binary_series,
+    )
+    from .hashes import _keccak_rows
+
+    if series.dtype != pl.String:
+        raise Exception('invalid dtype for ens names: ' + str(series.dtype))
+
+    # labels from the top level domain downward, as ids of distinct labels
+    names = series.fill_null('')
+    labels = names.str.split('.').list.reverse()
+    n_labels = labels.list.len().to_numpy().astype(np.int64)
+    offsets = np.cumsum(n_labels) - n_labels
+    depths = np.where((names == '').to_numpy(), 0, n_labels)
+    flat = (
+        labels.explode()
+        .to_frame('label')
+        .with_columns(id=pl.col.label.rank('dense') - 1)
+    )
+    distinct_labels = flat.unique('id').sort('id')['label']
+    label_words, _ = _binary_words(labelhash_series(distinct_labels), 32)
+    label_ids = flat['id'].to_numpy().astype(np.int64)
+    n_distinct = max(len(distinct_labels), 1)
+
+    # node = keccak(parent node ++ labelhash), nodes are rows of a table
+    # that starts with the 32 zero byte root node
+    table = np.zeros((1, 32), dtype=np.uint8)
+    node_ids = np.zeros(len(series), dtype=np.int64)
+    for depth in range(int(depths.max(initial=0))):
+        rows = np.flatnonzero(depths > depth)
+        pairs = node_ids[rows] * n_distinct + label_ids[offsets[rows] + depth]
+        distinct_pairs, pair_ids = np.unique(pairs, return_inverse=True)
+        parents, pair_labels = np.divmod(distinct_pairs, n_distinct)
+        messages = np.concatenate(
+            [table[parents], label_words[pair_labels]], axis=1
+        )
+        node_ids[rows] = len(table) + pair_ids
+        table = np.concatenate([table, _keccak_rows(messages)])
+
+    valid = series.is_not_null().to_numpy()
+    return _numpy_to_binary_series(series.name, table[node_ids], valid)
+
+
+def namehash_expr(expr: pl.Expr) -> pl.Expr:
+    """ENS namehash of each name, as 32 byte pl.Binary"""
+    import polars as pl
+
+    return expr.map_batches(
+        namehash_series, return_dtype=pl.Binary, is_elementwise=True
+    )
+
+
+def labelhash_series(series: pl.Series) -> pl.Series:
+    """ENS labelhash of each label, keccak of its utf8 bytes"""
+    from .hashes import keccak_series
+
+    return keccak_series(series, output='binary', text=True)
+
+
+def labelhash_expr(expr: pl.Expr) -> pl.Expr:
+    """ENS labelhash of each label, keccak of its utf8 bytes"""
+    from .hashes import keccak_expr
+
+    return keccak_expr(expr, output='binary', text=True)
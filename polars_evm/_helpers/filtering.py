@@ -2,13 +2,32 @@ from __future__ import annotations
 
 import typing
 
+from . import conversions
+
 if typing.TYPE_CHECKING:
     import polars as pl
 
     _T = typing.TypeVar('_T', pl.DataFrame, pl.LazyFrame)
 
+    # bounds for filtering 32 byte words as integers, e.g. {'gt': 10**24}
+    class WordRange(typing.TypedDict, total=False):
+        gt: int
+        ge: int
+        lt: int
+        le: int
+        signed: bool
+
+    _CompareOp = typing.Literal['>', '>=', '<', '<=']
+
+
+def filter_binary(df: _T, column_values: dict[str, typing.Any]) -> _T:
+    """
+    filter rows by the values of binary or hex columns
 
-def filter_binary(df: _T, column_values: dict[str, list[str]]) -> _T:
+    values can be a single value, a list or series of values, or a WordRange
+    dict like {'gt': 10**24} to compare 32 byte words as integers. rows that
+    are not 32 byte words never match a WordRange
+    """
     import polars as pl
 
     filter: bool | pl.Expr
@@ -17,13 +36,22 @@ def filter_binary(df: _T, column_values: dict[str, list[str]]) -> _T:
     for column_name, values in column_values.items():
         column_dtype = schema.get(column_name)
 
-        if column_dtype == pl.Binary:
+        if isinstance(values, dict):
+            if column_dtype not in (pl.Binary, pl.String):
+                raise Exception('column must have type pl.Binary or pl.String')
+            filter = _word_range_filter(
+                pl.col(column_name),
+                typing.cast('WordRange', values),
+                hex=column_dtype == pl.String,
+            )
+
+        elif column_dtype == pl.Binary:
             if isinstance(values, pl.Series):
                 if values.dtype == pl.Series:
                     filter = pl.col(column_name).is_in(values)
                 elif values.dtype == pl.String:
                     filter = pl.col(column_name).is_in(
-                        values.evm.hex_to_binary()
+                        conversions.hex_series_to_binary(values)
                     )
                 else:
                     raise Exception()
@@ -49,7 +77,7 @@ def filter_binary(df: _T, column_values: dict[str, list[str]]) -> _T:
             if isinstance(values, pl.Series):
                 if values.dtype == pl.Series:
                     filter = pl.col(column_name).is_in(
-                        values.evm.binary_to_hex()
+                        conversions.binary_series_to_hex(values)
                     )
                 elif values.dtype == pl.String:
                     filter = pl.col(column_name).is_in(values)
@@ -79,3 +107,146 @@ def filter_binary(df: _T, column_values: dict[str, list[str]]) -> _T:
         filters.append(filter)
 
     return df.filter(*filters)
+
+
+#
+# # integer comparisons of 32 byte words
+#
+
+
+def u256_gt(expr: pl.Expr, value: int, *, signed: bool = False) -> pl.Expr:
+    """
+    compare 32 byte big-endian words against an integer without decoding
+
+    the bound is encoded once and compared to the raw bytes, so the predicate
+    is exact and can be pushed down into scans. values that are not 32 bytes,
+    like 20 byte addresses, give null
+    """
+    return _compare_word(expr, '>', value, signed=signed, hex=False)
+
+
+def u256_ge(expr: pl.Expr, value: int, *, signed: bool = False) -> pl.Expr:
+    return _compare_word(expr, '>=', value, signed=signed, hex=False)
+
+
+def u256_lt(expr: pl.Expr, value: int, *, signed: bool = False) -> pl.Expr:
+    return _compare_word(expr, '<', value, signed=signed, hex=False)
+
+
+def u256_le(expr: pl.Expr, value: int, *, signed: bool = False) -> pl.Expr:
+    return _compare_word(expr, '<=', value, signed=signed, hex=False)
+
+
+def u256_between(
+    expr: pl.Expr,
+    lower: int,
+    upper: int,
+    *,
+    signed: bool = False,
+    closed: typing.Literal['both', 'left', 'right', 'none'] = 'both',
+) -> pl.Expr:
+    lower_op: _CompareOp
+    upper_op: _CompareOp
+    if closed == 'both':
+        lower_op, upper_op = '>=', '<='
+    elif closed == 'left':
+        lower_op, upper_op = '>=', '<'
+    elif closed == 'right':
+        lower_op, upper_op = '>', '<='
+    elif closed == 'none':
+        lower_op, upper_op = '>', '<'
+    else:
+        raise Exception('invalid closed: ' + str(closed))
+    return _compare_word(
+        expr, lower_op, lower, signed=signed, hex=False
+    ) & _compare_word(expr, upper_op, upper, signed=signed, hex=False)
+
+
+def _word_range_filter(
+    expr: pl.Expr, word_range: WordRange, hex: bool
+) -> pl.Expr:
+    import polars as pl
+
+    ops: dict[str, _CompareOp] = {
+        'gt': '>',
+        'ge': '>=',
+        'lt': '<',
+        'le': '<=',
+    }
+    for key in word_range.keys():
+        if key != 'signed' and key not in ops:
+            raise Exception('invalid range key: ' + str(key))
+    signed = word_range.get('signed', False)
+    filters = []
+    for key, op in ops.items():
+        value = word_range.get(key)
+        if isinstance(value, int):
+            filters.append(
+                _compare_word(expr, op, value, signed=signed, hex=hex)
+            )
+    if len(filters) == 0:
+        raise Exception('range must specify at least one bound')
+    return pl.all_horizontal(filters)
+
+
+def _compare_word(
+    expr: pl.Expr,
+    op: _CompareOp,
+    value: int,
+    *,
+    signed: bool,
+    hex: bool,
+) -> pl.Expr:
+    """
+    compare words to an encoded bound
+
+    words sort like unsigned integers. for signed integers, negative values
+    sort above positive values but keep their order relative to each other,
+    so the sign of the word is checked separately. values that are not 32
+    byte words compare as null
+    """
+    import polars as pl
+
+    # encode bound
+    if signed:
+        if value < -(2**255) or value >= 2**255:
+            raise Exception('value out of range for int256: ' + str(value))
+    elif value < 0 or value >= 2**256:
+        raise Exception('value out of range for uint256: ' + str(value))
+    word = value.to_bytes(32, 'big', signed=signed)
+    bound: str | bytes
+    negative_threshold: str | bytes
+    if hex:
+        # normalize case, prefix, and width so strings sort like words
+        expr = expr.str.to_lowercase().str.strip_prefix('0x').str.zfill(64)
+        is_word = expr.str.len_bytes() == 64
+        bound = word.hex()
+        negative_threshold = '8'
+    else:
+        is_word = expr.bin.size() == 32
+        bound = word
+        negative_threshold = b'\x80'
+
+    if op == '>':
+        compare = expr > pl.lit(bound)
+    elif op == '>=':
+        compare = expr >= pl.lit(bound)
+    elif op == '<':
+        compare = expr < pl.lit(bound)
+    elif op == '<=':
+        compare = expr <= pl.lit(bound)
+    else:
+        raise Exception('invalid op: ' + str(op))
+    if signed:
+        is_negative = expr >= pl.lit(negative_threshold)
+        if op in ('>', '>='):
+            if value >= 0:
+                compare = is_negative.not_() & compare
+            else:
+                compare = is_negative.not_() | compare
+        else:
+            if value >= 0:
+                compare = is_negative | compare
+            else:
+                compare = is_negative & compare
+    return pl.when(is_word).then(compare)
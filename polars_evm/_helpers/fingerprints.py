@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+
+def fingerprint64_series(
+    series: pl.Series, *, offset: int = 0, check_collisions: bool = False
+) -> pl.Series:
+    """
+    UInt64 keys from 8 bytes of hashes, see fingerprint64_expr()
+
+    with check_collisions=True, raise if distinct values share a key
+    """
+    import polars as pl
+
+    fingerprints = (
+        series.to_frame('value')
+        .select(fingerprint64_expr(pl.col.value, offset=offset))
+        .to_series()
+        .alias(series.name)
+    )
+    if check_collisions:
+        _check_collisions(series, fingerprints)
+    return fingerprints
+
+
+def fingerprint64_expr(
+    expr: pl.Expr, *, offset: int = 0, check_collisions: bool = False
+) -> pl.Expr:
+    """
+    UInt64 keys from 8 bytes of hashes, without hashing
+
+    keccak hashes are already uniformly random, so any 8 of their bytes make
+    a key that only collides for about 1 in 2**64 pairs of distinct values.
+    values shorter than offset + 8 bytes become null
+    """
+    import polars as pl
+
+    if offset < 0:
+        raise Exception('offset must be non-negative')
+    if check_collisions:
+        return expr.map_batches(
+            functools.partial(
+                fingerprint64_series, offset=offset, check_collisions=True
+            ),
+            return_dtype=pl.UInt64,
+        )
+    return expr.bin.slice(offset, 8).bin.reinterpret(
+        dtype=pl.UInt64, endianness='little'
+    )
+
+
+def join_on_hash(
+    df: pl.DataFrame,
+    other: pl.DataFrame,
+    on: str,
+    *,
+    how: typing.Literal['inner', 'left'] = 'inner',
+    offset: int = 0,
+    suffix: str = '_right',
+) -> pl.DataFrame:
+    """
+    join on a hash column using UInt64 fingerprints as join keys
+
+    matches are verified against the full bytes afterwards. if any
+    fingerprints collide, the join is redone on the full bytes
+    """
+    import polars as pl
+
+    if how not in ('inner', 'left'):
+        raise Exception('invalid how: ' + str(how))
+    key = '__fingerprint'
+    right_on = on + suffix
+    fingerprint = fingerprint64_expr(pl.col(on), offset=offset).alias(key)
+    joined = df.with_columns(fingerprint).join(
+        other.with_columns(fingerprint),
+        on=key,
+        how=how,
+        suffix=suffix,
+        maintain_order='left',
+    )
+
+    # verify full bytes of matched rows
+    mismatched = pl.col(right_on).is_not_null() & (
+        pl.col(on) != pl.col(right_on)
+    )
+    if joined.select(mismatched.any()).item():
+        return df.join(other, on=on, how=how, suffix=suffix)
+    return joined.drop(key, right_on)
+
+
+def _check_collisions(values: pl.Series, fingerprints: pl.Series) -> None:
+    import polars as pl
+
+    n_collisions = (
+        pl.DataFrame({'value': values, 'fingerprint': fingerprints})
+        .drop_nulls()
+        .unique()
+        .select(pl.col.fingerprint.is_duplicated().sum())
+        .item()
+    )
+    if n_collisions > 0:
+        raise Exception(
+            str(n_collisions) + ' distinct values share 64 bit fingerprints'
+        )
@@ -1,11 +1,79 @@
 from __future__ import annotations
 
+import functools
+import threading
 import typing
 
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    _NDArray = np.ndarray[typing.Any, typing.Any]
+
+    KeccakOutput = typing.Literal['hex', 'binary', 'prefix_hex', 'raw_hex']
+
+    class KeccakCacheInfo(typing.TypedDict):
+        hits: int
+        misses: int
+        size: int
+        max_size: int
+
+
+# keccak-f[1600] round constants
+_round_constants = [
+    0x0000000000000001,
+    0x0000000000008082,
+    0x800000000000808A,
+    0x8000000080008000,
+    0x000000000000808B,
+    0x0000000080000001,
+    0x8000000080008081,
+    0x8000000000008009,
+    0x000000000000008A,
+    0x0000000000000088,
+    0x0000000080008009,
+    0x000000008000000A,
+    0x000000008000808B,
+    0x800000000000008B,
+    0x8000000000008089,
+    0x8000000000008003,
+    0x8000000000008002,
+    0x8000000000000080,
+    0x000000000000800A,
+    0x800000008000000A,
+    0x8000000080008081,
+    0x8000000000008080,
+    0x0000000080000001,
+    0x8000000080008008,
+]
+
+# rotation offsets of lane (x, y), stored as _rotations[x][y]
+_rotations = [
+    [0, 36, 3, 41, 18],
+    [1, 44, 10, 45, 2],
+    [62, 6, 43, 15, 61],
+    [28, 55, 25, 21, 56],
+    [27, 20, 39, 8, 14],
+]
+
+# bytes absorbed per permutation for 256 bit digests
+_rate = 136
+
+# rows hashed at once, sized so that the 25 lanes stay in cache
+_chunk_size = 16384
+
+# process-wide LRU cache of digests, keyed by the exact bytes hashed. entries
+# are rows of a frame of value, digest, and row number that is joined
+# against the values of each batch, and the last use of each row is kept in
+# a numpy array so that lookups never create python objects per value
+_keccak_cache_lock = threading.Lock()
+_keccak_cache_state = {'hits': 0, 'misses': 0, 'max_size': 2**20, 'tick': 0}
+_keccak_cache_entries: list[typing.Any] = [None, None]  # [frame, last_used]
+
 
 def keccak(
     data: str | bytes,
-    output: typing.Literal['hex', 'binary', 'prefix_hex', 'raw_hex'] = 'hex',
+    output: KeccakOutput = 'hex',
     text: bool = False,
 ) -> str | bytes:
     from Crypto.Hash import keccak as f_keccak
@@ -38,3 +106,425 @@ def keccak(
         return '0x' + as_binary.hex()
     else:
         raise Exception('unknown output format: ' + str(output))
+
+
+def keccak_series(
+    series: pl.Series, output: KeccakOutput = 'hex', text: bool = False
+) -> pl.Series:
+    """
+    keccak256 of every value of a series
+
+    only unique values are hashed, and their digests are joined back onto
+    the rows. digests of unique values are kept in a process-wide LRU cache,
+    see keccak_cache_info(). binary values are hashed as is, strings are
+    hashed as hex, or as utf8 text when text=True
+    """
+    import polars as pl
+
+    from .conversions import binary_series_to_hex
+    from .conversions import hex_series_to_binary
+
+    if output not in ('hex', 'binary', 'prefix_hex', 'raw_hex'):
+        raise Exception('unknown output format: ' + str(output))
+    if series.dtype == pl.String:
+        if text:
+            series = series.cast(pl.Binary)
+        else:
+            series = hex_series_to_binary(series)
+    elif text:
+        raise Exception('not str, cannot use text=True')
+    elif series.dtype != pl.Binary:
+        raise Exception('invalid dtype for keccak: ' + str(series.dtype))
+
+    hashes = _keccak_deduplicated(series)
+    if output == 'binary':
+        return hashes
+    else:
+        return binary_series_to_hex(hashes, prefix=output != 'raw_hex')
+
+
+def keccak_expr(
+    expr: pl.Expr, output: KeccakOutput = 'hex', text: bool = False
+) -> pl.Expr:
+    """keccak256 of every value, see keccak_series()"""
+    import polars as pl
+
+    if output == 'binary':
+        return_dtype: type[pl.DataType] = pl.Binary
+    else:
+        return_dtype = pl.String
+    return expr.map_batches(
+        functools.partial(keccak_series, output=output, text=text),
+        return_dtype=return_dtype,
+        is_elementwise=True,
+    )
+
+
+def keccak_cache_info() -> KeccakCacheInfo:
+    """hits, misses, and size of the process-wide keccak digest cache"""
+    with _keccak_cache_lock:
+        frame = _keccak_cache_entries[0]
+        return {
+            'hits': _keccak_cache_state['hits'],
+            'misses': _keccak_cache_state['misses'],
+            'size': 0 if frame is None else len(frame),
+            'max_size': _keccak_cache_state['max_size'],
+        }
+
+
+def set_keccak_cache_size(max_size: int) -> None:
+    """set the maximum number of cached digests, 0 disables the cache"""
+    if max_size < 0:
+        raise Exception('max_size must be non-negative')
+    with _keccak_cache_lock:
+        _keccak_cache_state['max_size'] = max_size
+        _evict_cached_digests(max_size)
+
+
+def clear_keccak_cache() -> None:
+    """remove all cached digests and reset the hit and miss counters"""
+    with _keccak_cache_lock:
+        _keccak_cache_entries[:] = [None, None]
+        _keccak_cache_state['hits'] = 0
+        _keccak_cache_state['misses'] = 0
+
+
+def _keccak_deduplicated(series: pl.Series) -> pl.Series:
+    """
+    keccak256 of pl.Binary values, hashing each distinct value once
+
+    digests of distinct values are looked up in the cache, the missing ones
+    are hashed in one batch, and all digests are joined back onto the rows
+    """
+    import polars as pl
+
+    uniques = series.drop_nulls().unique()
+    cached = _get_cached_digests(uniques)
+    if cached is None:
+        digests = _keccak_binary_series(uniques)
+    else:
+        digests = cached
+        missing = digests.is_null()
+        if missing.any():
+            missing_values = uniques.filter(missing)
+            computed = _keccak_binary_series(missing_values)
+            _set_cached_digests(missing_values, computed)
+            digests = digests.scatter(
+                missing.arg_true(), computed.rename(digests.name)
+            )
+
+    return (
+        series.to_frame('value')
+        .join(
+            pl.DataFrame({'value': uniques, 'digest': digests}),
+            on='value',
+            how='left',
+            maintain_order='left',
+        )['digest']
+        .alias(series.name)
+    )
+
+
+def _keccak_rows(messages: _NDArray) -> _NDArray:
+    """keccak256 of each row of an (n, length) uint8 array, deduplicated"""
+    import numpy as np
+
+    from .conversions.binary_numpy_conversions import (
+        _binary_words,
+        _numpy_to_binary_series,
+    )
+
+    valid = np.ones(len(messages), dtype=bool)
+    values = _numpy_to_binary_series('', messages, valid)
+    digests, _ = _binary_words(_keccak_deduplicated(values), 32)
+    return digests
+
+
+def _keccak_buffers(
+    data: _NDArray, starts: _NDArray, lengths: _NDArray
+) -> _NDArray:
+    """keccak256 of messages stored in one uint8 buffer, deduplicated"""
+    import numpy as np
+
+    from .conversions.binary_numpy_conversions import (
+        _binary_words,
+        _buffers_to_binary_series,
+    )
+
+    # offsets into the buffer, gathering messages that are not consecutive
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+    if len(starts) > 0 and (starts[1:] == starts[:-1] + lengths[:-1]).all():
+        offsets = offsets + starts[0]
+    else:
+        positions = np.arange(int(offsets[-1])) - np.repeat(
+            offsets[:-1], lengths
+        )
+        data = data[np.repeat(starts, lengths) + positions]
+    valid = np.ones(len(starts), dtype=bool)
+    values = _buffers_to_binary_series('', data, offsets, valid)
+    digests, _ = _binary_words(_keccak_deduplicated(values), 32)
+    return digests
+
+
+def _get_cached_digests(uniques: pl.Series) -> pl.Series | None:
+    """
+    digests of distinct values, null for values that are not cached
+
+    returns None if the cache is disabled
+    """
+    import polars as pl
+
+    with _keccak_cache_lock:
+        if _keccak_cache_state['max_size'] == 0:
+            return None
+        frame, last_used = _keccak_cache_entries
+        if frame is None:
+            found = pl.Series('digest', [None] * len(uniques), pl.Binary)
+            n_hits = 0
+        else:
+            matches = uniques.to_frame('value').join(
+                frame, on='value', how='left', maintain_order='left'
+            )
+            if len(matches) != len(uniques):
+                # guard against duplicate cache keys fanning out the join
+                matches = matches.unique(
+                    'value', keep='first', maintain_order=True
+                )
+            found = matches['digest']
+            rows = matches['row'].drop_nulls().to_numpy()
+            _keccak_cache_state['tick'] += 1
+            last_used[rows] = _keccak_cache_state['tick']
+            n_hits = len(rows)
+        _keccak_cache_state['hits'] += n_hits
+        _keccak_cache_state['misses'] += len(uniques) - n_hits
+    return found
+
+
+def _set_cached_digests(values: pl.Series, digests: pl.Series) -> None:
+    """add digests of values that are not cached yet"""
+    import numpy as np
+    import polars as pl
+
+    with _keccak_cache_lock:
+        max_size = _keccak_cache_state['max_size']
+        if max_size == 0:
+            return
+        frame, last_used = _keccak_cache_entries
+        new = pl.DataFrame({'value': values, 'digest': digests})
+        if frame is not None:
+            # other threads may have cached some values since the lookup
+            new = new.join(frame.select('value'), on='value', how='anti')
+        new = new.tail(max_size)
+        if len(new) == 0:
+            return
+        n_cached = 0 if frame is None else len(frame)
+        new = new.with_columns(
+            row=pl.int_range(n_cached, n_cached + len(new), dtype=pl.Int64)
+        )
+        _keccak_cache_state['tick'] += 1
+        new_used = np.full(len(new), _keccak_cache_state['tick'])
+        if frame is None:
+            _keccak_cache_entries[:] = [new, new_used]
+        else:
+            _keccak_cache_entries[:] = [
+                pl.concat([frame, new], rechunk=False),
+                np.concatenate([last_used, new_used]),
+            ]
+        if n_cached + len(new) > max_size:
+            # evict a quarter of the entries at once to amortize the cost
+            _evict_cached_digests(max_size - max_size // 4)
+
+
+def _evict_cached_digests(max_size: int) -> None:
+    """keep the max_size most recently used entries, call with lock held"""
+    import numpy as np
+    import polars as pl
+
+    frame, last_used = _keccak_cache_entries
+    if frame is None or len(frame) <= max_size:
+        return
+    if max_size == 0:
+        _keccak_cache_entries[:] = [None, None]
+        return
+    recent = np.argsort(-last_used, kind='stable')[:max_size]
+    keep = np.sort(recent)
+    _keccak_cache_entries[:] = [
+        frame[keep].with_columns(row=pl.int_range(max_size)),
+        last_used[keep],
+    ]
+
+
+def _keccak_binary_series(series: pl.Series) -> pl.Series:
+    """
+    keccak256 of pl.Binary values, without per-row python objects
+
+    values are read from the arrow offsets and data buffers and hashed with
+    a vectorized keccak in chunks of rows
+    """
+    import numpy as np
+
+    from .conversions.binary_numpy_conversions import _numpy_to_binary_series
+
+    data, starts, lengths, valid = _large_binary_buffers(series)
+    if valid.all():
+        digests = _keccak_numpy_variable(data, starts, lengths)
+    else:
+        rows = np.flatnonzero(valid)
+        digests = np.zeros((len(series), 32), dtype=np.uint8)
+        digests[rows] = _keccak_numpy_variable(
+            data, starts[rows], lengths[rows]
+        )
+    return _numpy_to_binary_series(series.name, digests, valid)
+
+
+def _large_binary_buffers(
+    series: pl.Series,
+) -> tuple[_NDArray, _NDArray, _NDArray, _NDArray]:
+    """(data, starts, lengths, valid) of pl.Binary values in one buffer"""
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa  # type: ignore
+
+    # contiguous data buffer with 64 bit offsets
+    array = series.to_arrow(compat_level=pl.CompatLevel.newest())
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    array = array.cast(pa.large_binary())
+    buffers = array.buffers()
+    offsets = np.frombuffer(buffers[1], dtype=np.int64)
+    offsets = offsets[array.offset : array.offset + len(array) + 1]
+    if buffers[2] is None:
+        data = np.zeros(0, dtype=np.uint8)
+    else:
+        data = np.frombuffer(buffers[2], dtype=np.uint8)
+    valid = np.ones(len(array), dtype=bool)
+    if array.null_count > 0:
+        valid = array.is_valid().to_numpy(zero_copy_only=False)
+
+    starts = offsets[:-1]
+    lengths = offsets[1:] - starts
+    return data, starts, lengths, valid
+
+
+def _keccak_numpy(messages: _NDArray) -> _NDArray:
+    """keccak256 of each row of an (n, length) uint8 array, as (n, 32) uint8"""
+    import numpy as np
+
+    n_rows, length = messages.shape
+    n_blocks = length // _rate + 1
+    digests = np.empty((n_rows, 32), dtype=np.uint8)
+    for start in range(0, n_rows, _chunk_size):
+        chunk = messages[start : start + _chunk_size]
+
+        # pad as message || 0x01 || 0x00... || 0x80
+        padded = np.zeros((len(chunk), n_blocks * _rate), dtype=np.uint8)
+        padded[:, :length] = chunk
+        padded[:, length] ^= 0x01
+        padded[:, -1] ^= 0x80
+        digests[start : start + _chunk_size] = _keccak_absorb(padded)
+    return digests
+
+
+def _keccak_numpy_variable(
+    data: _NDArray, starts: _NDArray, lengths: _NDArray
+) -> _NDArray:
+    """
+    keccak256 of messages of any length stored in one uint8 buffer
+
+    rows are grouped by their number of blocks rather than exact length,
+    so each group is padded per row and hashed in one pass
+    """
+    import numpy as np
+
+    # consecutive messages of one length are rows of a matrix
+    if len(starts) > 0 and lengths[0] > 0:
+        width = int(lengths[0])
+        first = int(starts[0])
+        if (lengths == width).all() and (np.diff(starts) == width).all():
+            end = first + width * len(starts)
+            return _keccak_numpy(data[first:end].reshape(-1, width))
+
+    digests = np.empty((len(starts), 32), dtype=np.uint8)
+    row_blocks = lengths // _rate + 1
+    for n_blocks in np.unique(row_blocks):
+        rows = np.flatnonzero(row_blocks == n_blocks)
+        for start in range(0, len(rows), _chunk_size):
+            chunk = rows[start : start + _chunk_size]
+            chunk_lengths = lengths[chunk]
+
+            # scatter message bytes into zeroed blocks, then pad each row
+            padded = np.zeros((len(chunk), n_blocks * _rate), dtype=np.uint8)
+            row_numbers = np.repeat(np.arange(len(chunk)), chunk_lengths)
+            row_offsets = np.repeat(
+                np.cumsum(chunk_lengths) - chunk_lengths, chunk_lengths
+            )
+            positions = np.arange(len(row_numbers)) - row_offsets
+            sources = np.repeat(starts[chunk], chunk_lengths) + positions
+            padded[row_numbers, positions] = data[sources]
+            padded[np.arange(len(chunk)), chunk_lengths] ^= 0x01
+            padded[:, -1] ^= 0x80
+            digests[chunk] = _keccak_absorb(padded)
+    return digests
+
+
+def _keccak_absorb(padded: _NDArray) -> _NDArray:
+    """absorb (n, n_blocks * rate) padded rows and squeeze 32 byte digests"""
+    import numpy as np
+
+    n_blocks = padded.shape[1] // _rate
+    lanes = padded.view('<u8')
+    state = [np.zeros(len(padded), dtype=np.uint64) for _ in range(25)]
+    for block in range(n_blocks):
+        for i in range(_rate // 8):
+            state[i] = state[i] ^ lanes[:, block * _rate // 8 + i]
+        state = _keccak_permute(state)
+    output = np.stack(state[:4], axis=1).astype('<u8')
+    return output.view(np.uint8)
+
+
+def _keccak_permute(state: list[_NDArray]) -> list[_NDArray]:
+    """keccak-f[1600] on 25 lane arrays, lane (x, y) stored at x + 5 * y"""
+    import numpy as np
+
+    for round_constant in _round_constants:
+        # theta
+        columns = [
+            state[x]
+            ^ state[x + 5]
+            ^ state[x + 10]
+            ^ state[x + 15]
+            ^ state[x + 20]
+            for x in range(5)
+        ]
+        mixes = [
+            columns[(x - 1) % 5] ^ _rotate(columns[(x + 1) % 5], 1)
+            for x in range(5)
+        ]
+
+        # rho and pi
+        rotated: list[_NDArray] = [state[0]] * 25
+        for x in range(5):
+            for y in range(5):
+                lane = state[x + 5 * y] ^ mixes[x]
+                target = y + 5 * ((2 * x + 3 * y) % 5)
+                rotated[target] = _rotate(lane, _rotations[x][y])
+
+        # chi
+        state = [
+            rotated[x + y]
+            ^ (~rotated[(x + 1) % 5 + y] & rotated[(x + 2) % 5 + y])
+            for y in range(0, 25, 5)
+            for x in range(5)
+        ]
+
+        # iota
+        state[0] = state[0] ^ np.uint64(round_constant)
+    return state
+
+
+def _rotate(lane: _NDArray, n_bits: int) -> _NDArray:
+    import numpy as np
+
+    if n_bits == 0:
+        return lane
+    return (lane << np.uint64(n_bits)) | (lane >> np.uint64(64 - n_bits))
@@ -0,0 +1,587 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+    Limbs = typing.Union[pl.Expr, int]
+    Overflow = typing.Literal['null', 'wrap']
+
+
+N_LIMBS = 4
+LIMB_BITS = 64
+
+
+#
+# # conversions
+#
+
+
+def binary_expr_to_limbs(expr: pl.Expr) -> pl.Expr:
+    """
+    convert 32 byte big-endian words into limbs
+
+    limbs are pl.Array(pl.UInt64, 4) in little-endian order, index 0 holds the
+    least significant 64 bits. signed values use two's complement, arithmetic
+    wraps modulo 2**256 like the EVM
+    """
+    import polars as pl
+
+    limbs = [
+        expr.bin.slice(24 - 8 * i, 8).bin.reinterpret(
+            dtype=pl.UInt64, endianness='big'
+        )
+        for i in range(N_LIMBS)
+    ]
+    return pl.when(expr.bin.size() == 32).then(pl.concat_arr(limbs))
+
+
+def limbs_expr_to_binary(expr: pl.Expr) -> pl.Expr:
+    """convert limbs into 32 byte big-endian words"""
+    import polars as pl
+
+    return expr.map_batches(
+        limbs_series_to_binary, return_dtype=pl.Binary, is_elementwise=True
+    )
+
+
+def limbs_series_to_binary(series: pl.Series) -> pl.Series:
+    """convert limbs into 32 byte big-endian words in a single numpy pass"""
+    limbs, valid = _array_series_to_numpy(series)
+    return _numpy_limbs_to_binary(series.name, limbs, valid)
+
+
+def int_to_limbs(value: int) -> list[int]:
+    """convert python int into limbs, negative values use two's complement"""
+    if value < -(2**255) or value >= 2**256:
+        raise Exception('value out of range for 256 bits: ' + str(value))
+    value = value % 2**256
+    return [(value >> (LIMB_BITS * i)) % 2**LIMB_BITS for i in range(N_LIMBS)]
+
+
+def limbs_to_int(limbs: typing.Sequence[int], signed: bool = False) -> int:
+    """convert limbs into python int"""
+    value = sum(limb << (LIMB_BITS * i) for i, limb in enumerate(limbs))
+    if signed and value >= 2**255:
+        value -= 2**256
+    return value
+
+
+#
+# # arithmetic
+#
+
+
+def limbs_add(a: pl.Expr, b: Limbs) -> pl.Expr:
+    import polars as pl
+
+    sum_limbs, _carry = _add(_get_limbs(a), _get_limbs(b), pl.lit(0))
+    return _concat_limbs(sum_limbs)
+
+
+def limbs_sub(a: pl.Expr, b: Limbs) -> pl.Expr:
+    import polars as pl
+
+    inverted = [~limb for limb in _get_limbs(b)]
+    sum_limbs, _carry = _add(_get_limbs(a), inverted, pl.lit(1))
+    return _concat_limbs(sum_limbs)
+
+
+def limbs_neg(a: pl.Expr) -> pl.Expr:
+    return _concat_limbs(_neg(_get_limbs(a)))
+
+
+def limbs_mul(a: pl.Expr, scalar: int | pl.Expr) -> pl.Expr:
+    """multiply by an int with magnitude below 2**64 or by a UInt64 expr"""
+    import polars as pl
+
+    negative = False
+    if isinstance(scalar, int):
+        negative = scalar < 0
+        scalar = abs(scalar)
+        if scalar >= 2**LIMB_BITS:
+            raise Exception('scalar must be less than 2**64')
+        scalar = pl.lit(scalar, dtype=pl.UInt64)
+
+    product_limbs = []
+    carry = pl.lit(0, dtype=pl.UInt128)
+    for limb in _get_limbs(a):
+        product = limb.cast(pl.UInt128) * scalar + carry
+        product_limbs.append(_low_limb(product))
+        carry = _high_limb(product)
+
+    if negative:
+        product_limbs = _neg(product_limbs)
+    return _concat_limbs(product_limbs)
+
+
+def limbs_div(
+    a: pl.Expr, scalar: int | pl.Expr, *, signed: bool = False
+) -> pl.Expr:
+    """
+    divide by an int with magnitude below 2**64 or by a UInt64 expr
+
+    quotients round toward zero, division by zero gives null
+    """
+    import polars as pl
+
+    limbs = _get_limbs(a)
+
+    # divide magnitudes
+    negative = False
+    if isinstance(scalar, int):
+        if scalar < 0 and not signed:
+            raise Exception('negative scalar requires signed=True')
+        negative = scalar < 0
+        scalar = abs(scalar)
+        if scalar >= 2**LIMB_BITS:
+            raise Exception('scalar must be less than 2**64')
+        scalar = pl.lit(scalar, dtype=pl.UInt64)
+    if signed:
+        # magnitudes and signs are computed once per batch rather than
+        # repeated in the expression tree of every quotient limb
+        return pl.concat_arr(limbs + [scalar.cast(pl.UInt64)]).map_batches(
+            functools.partial(_divide_signed, negative=negative),
+            return_dtype=pl.Array(pl.UInt64, N_LIMBS),
+            is_elementwise=True,
+        )
+    quotient = _udiv(limbs, scalar)
+
+    # restore sign
+    if negative:
+        quotient = _neg(quotient)
+    return _concat_limbs(quotient)
+
+
+#
+# # comparisons
+#
+
+
+def limbs_eq(a: pl.Expr, b: Limbs) -> pl.Expr:
+    import polars as pl
+
+    pairs = zip(_get_limbs(a), _get_limbs(b))
+    return pl.all_horizontal([a_limb == b_limb for a_limb, b_limb in pairs])
+
+
+def limbs_ne(a: pl.Expr, b: Limbs) -> pl.Expr:
+    return ~limbs_eq(a, b)
+
+
+def limbs_gt(a: pl.Expr, b: Limbs, *, signed: bool = False) -> pl.Expr:
+    return _compare(_get_limbs(a), _get_limbs(b), signed=signed)
+
+
+def limbs_lt(a: pl.Expr, b: Limbs, *, signed: bool = False) -> pl.Expr:
+    return _compare(_get_limbs(b), _get_limbs(a), signed=signed)
+
+
+def limbs_ge(a: pl.Expr, b: Limbs, *, signed: bool = False) -> pl.Expr:
+    return ~limbs_lt(a, b, signed=signed)
+
+
+def limbs_le(a: pl.Expr, b: Limbs, *, signed: bool = False) -> pl.Expr:
+    return ~limbs_gt(a, b, signed=signed)
+
+
+def limbs_sort_key(a: pl.Expr, *, signed: bool = False) -> pl.Expr:
+    """struct key whose field order matches numeric order, for sorting"""
+    import polars as pl
+
+    limbs = _get_limbs(a)
+    if signed:
+        limbs[-1] = limbs[-1].xor(pl.lit(2**63, dtype=pl.UInt64))
+    fields = [limb.alias('limb' + str(i)) for i, limb in enumerate(limbs)]
+    return pl.when(a.is_not_null()).then(pl.struct(reversed(fields)))
+
+
+#
+# # aggregations
+#
+
+
+def limbs_sum(
+    a: pl.Expr, *, signed: bool = False, overflow: Overflow = 'null'
+) -> pl.Expr:
+    """
+    exact sum of limbs, usable in group_by() and over()
+
+    limbs are split into 32 bit halves that are summed as UInt64, and carries
+    are propagated afterward, so no intermediate sum can overflow for groups
+    of fewer than 2**32 rows. sums that do not fit in 256 bits become null,
+    or wrap modulo 2**256 with overflow='wrap'
+    """
+    return _exact_sum(_get_limbs(a), 'sum', signed=signed, overflow=overflow)
+
+
+def limbs_cum_sum(
+    a: pl.Expr, *, signed: bool = False, overflow: Overflow = 'null'
+) -> pl.Expr:
+    """exact cumulative sum of limbs, usable in group_by() and over()"""
+    limbs = _get_limbs(a)
+    return _exact_sum(limbs, 'cum_sum', signed=signed, overflow=overflow)
+
+
+def limbs_diff(
+    a: pl.Expr,
+    n: int = 1,
+    *,
+    signed: bool = False,
+    overflow: Overflow = 'null',
+) -> pl.Expr:
+    """
+    exact difference with the value n rows earlier
+
+    for unsigned values a negative difference is an overflow, use
+    overflow='wrap' to get the two's complement difference instead
+    """
+    limbs = _get_limbs(a)
+    return _exact_diff(limbs, n, signed=signed, overflow=overflow)
+
+
+def u256_sum(
+    expr: pl.Expr, *, signed: bool = False, overflow: Overflow = 'null'
+) -> pl.Expr:
+    """exact sum of 32 byte big-endian words, returned as a 32 byte word"""
+    limbs = _binary_limbs(expr)
+    output = _exact_sum(limbs, 'sum', signed=signed, overflow=overflow)
+    return limbs_expr_to_binary(output)
+
+
+def u256_cum_sum(
+    expr: pl.Expr, *, signed: bool = False, overflow: Overflow = 'null'
+) -> pl.Expr:
+    """exact cumulative sum of 32 byte big-endian words"""
+    limbs = _binary_limbs(expr)
+    output = _exact_sum(limbs, 'cum_sum', signed=signed, overflow=overflow)
+    return limbs_expr_to_binary(output)
+
+
+def u256_diff(
+    expr: pl.Expr,
+    n: int = 1,
+    *,
+    signed: bool = False,
+    overflow: Overflow = 'null',
+) -> pl.Expr:
+    """exact difference of 32 byte big-endian words"""
+    limbs = _binary_limbs(expr)
+    output = _exact_diff(limbs, n, signed=signed, overflow=overflow)
+    return limbs_expr_to_binary(output)
+
+
+def _exact_sum(
+    limbs: list[pl.Expr],
+    method: typing.Literal['sum', 'cum_sum'],
+    *,
+    signed: bool,
+    overflow: Overflow,
+) -> pl.Expr:
+    """
+    sum 32 bit halves of limbs, then propagate carries
+
+    polars does not share subexpressions inside group_by() and over(), so the
+    sums are packed into one array and carried in a single numpy pass rather
+    than by a chain of expressions that would each recompute the sums
+    """
+    import polars as pl
+
+    _check_overflow(overflow)
+    halves = []
+    for limb in limbs:
+        halves.append(limb % 2**32)
+        halves.append(limb // 2**32)
+    if signed:
+        halves.append(_is_negative(limbs).cast(pl.UInt64))
+    sums = [getattr(half, method)() for half in halves]
+    return pl.concat_arr(sums).map_batches(
+        functools.partial(_carry_sums, signed=signed, overflow=overflow),
+        return_dtype=pl.Array(pl.UInt64, N_LIMBS),
+        is_elementwise=True,
+    )
+
+
+def _exact_diff(
+    limbs: list[pl.Expr], n: int, *, signed: bool, overflow: Overflow
+) -> pl.Expr:
+    import polars as pl
+
+    _check_overflow(overflow)
+    previous = [limb.shift(n) for limb in limbs]
+    return pl.concat_arr(limbs + previous).map_batches(
+        functools.partial(_subtract_limbs, signed=signed, overflow=overflow),
+        return_dtype=pl.Array(pl.UInt64, N_LIMBS),
+        is_elementwise=True,
+    )
+
+
+def _carry_sums(
+    series: pl.Series, *, signed: bool, overflow: Overflow
+) -> pl.Series:
+    import numpy as np
+
+    sums, valid = _array_series_to_numpy(series)
+
+    # carry between halves
+    halves = np.empty((len(sums), 2 * N_LIMBS), dtype=np.uint64)
+    carry = np.zeros(len(sums), dtype=np.uint64)
+    for i in range(2 * N_LIMBS):
+        total = sums[:, i] + carry
+        halves[:, i] = total & np.uint64(2**32 - 1)
+        carry = total >> np.uint64(32)
+    limbs = halves[:, ::2] | (halves[:, 1::2] << np.uint64(32))
+
+    # check that bits above 256 are an extension of the sign bit
+    if overflow == 'null':
+        if signed:
+            # the high bits are carry - n_negative, which must be 0 or -1
+            n_negative = sums[:, 2 * N_LIMBS]
+            is_negative = limbs[:, -1] >= np.uint64(2**63)
+            valid &= np.where(
+                is_negative,
+                carry + np.uint64(1) == n_negative,
+                carry == n_negative,
+            )
+        else:
+            valid &= carry == 0
+
+    return _numpy_to_limbs_series(series.name, limbs, valid)
+
+
+def _subtract_limbs(
+    series: pl.Series, *, signed: bool, overflow: Overflow
+) -> pl.Series:
+    import numpy as np
+
+    values, valid = _array_series_to_numpy(series)
+    a = values[:, :N_LIMBS]
+    b = values[:, N_LIMBS:]
+
+    # subtract with borrow
+    limbs = np.empty_like(a)
+    borrow = np.zeros(len(a), dtype=np.uint64)
+    for i in range(N_LIMBS):
+        limbs[:, i] = a[:, i] - b[:, i] - borrow
+        borrow = (
+            (a[:, i] < b[:, i]) | ((a[:, i] == b[:, i]) & (borrow == 1))
+        ).astype(np.uint64)
+
+    if overflow == 'null':
+        if signed:
+            # overflow if operand signs differ and result sign differs from a
+            a_negative = a[:, -1] >= np.uint64(2**63)
+            b_negative = b[:, -1] >= np.uint64(2**63)
+            output_negative = limbs[:, -1] >= np.uint64(2**63)
+            valid &= (a_negative == b_negative) | (
+                output_negative == a_negative
+            )
+        else:
+            valid &= borrow == 0
+
+    return _numpy_to_limbs_series(series.name, limbs, valid)
+
+
+def _divide_signed(series: pl.Series, *, negative: bool) -> pl.Series:
+    """
+    divide signed limbs by a UInt64 divisor, rounding toward zero
+
+    rows are limbs followed by the divisor. negative flips the quotient sign
+    """
+    import numpy as np
+    import polars as pl
+
+    values, valid = _array_series_to_numpy(series)
+    a = values[:, :N_LIMBS]
+    divisor = values[:, N_LIMBS]
+    valid &= divisor != 0
+
+    # divide magnitudes with 128 bit remainders, from the top limb down
+    is_negative = a[:, -1] >= np.uint64(2**63)
+    magnitudes = np.where(is_negative[:, None], _numpy_neg(a), a)
+    divisors = pl.Series(np.where(valid, divisor, 1)).cast(pl.UInt128)
+    remainder = pl.Series(np.zeros(len(a), dtype=np.uint64)).cast(pl.UInt128)
+    limb_size = pl.Series([2**LIMB_BITS], dtype=pl.UInt128)
+    quotient = np.empty_like(a)
+    for i in range(N_LIMBS - 1, -1, -1):
+        current = remainder * limb_size + pl.Series(magnitudes[:, i])
+        quotient[:, i] = (current // divisors).cast(pl.UInt64).to_numpy()
+        remainder = current % divisors
+
+    # restore sign
+    flip = is_negative != negative
+    quotient = np.where(flip[:, None], _numpy_neg(quotient), quotient)
+    return _numpy_to_limbs_series(series.name, quotient, valid)
+
+
+def _numpy_neg(limbs: typing.Any) -> typing.Any:
+    """two's complement of (n, 4) uint64 limbs"""
+    import numpy as np
+
+    output = np.empty_like(limbs)
+    carry = np.ones(len(limbs), dtype=np.uint64)
+    for i in range(N_LIMBS):
+        output[:, i] = ~limbs[:, i] + carry
+        carry = carry & (output[:, i] == 0)
+    return output
+
+
+def _array_series_to_numpy(
+    series: pl.Series,
+) -> tuple[typing.Any, typing.Any]:
+    """convert UInt64 array series to 2d numpy array and row validity mask"""
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa  # type: ignore
+
+    width = series.dtype.size  # type: ignore
+
+    # without nulls the flat values can be viewed directly
+    array = series.to_arrow()
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if array.null_count == 0 and array.values.null_count == 0:
+        start = array.offset * width
+        values = array.values.slice(start, len(array) * width).to_numpy()
+        return values.reshape(-1, width), np.ones(len(array), dtype=bool)
+
+    columns = [pl.col.array.arr.get(i).alias(str(i)) for i in range(width)]
+    frame = series.to_frame('array').select(columns)
+    is_complete = frame.select(pl.all_horizontal(pl.all().is_not_null()))
+    valid = series.is_not_null().to_numpy() & is_complete.to_series().to_numpy()
+    values = frame.select(pl.all().fill_null(0)).to_numpy().astype(np.uint64)
+    return values, valid
+
+
+def _numpy_to_limbs_series(
+    name: str, limbs: typing.Any, valid: typing.Any
+) -> pl.Series:
+    import polars as pl
+
+    output = pl.Series(name, limbs, dtype=pl.Array(pl.UInt64, N_LIMBS))
+    if valid.all():
+        return output
+    else:
+        return output.to_frame().select(pl.when(pl.Series(valid)).then(name))[
+            name
+        ]
+
+
+def _numpy_limbs_to_binary(
+    name: str, limbs: typing.Any, valid: typing.Any
+) -> pl.Series:
+    """convert (n, 4) uint64 limbs into 32 byte words, invalid rows are null"""
+    import numpy as np
+
+    from .conversions.binary_numpy_conversions import _numpy_to_binary_series
+
+    words = np.ascontiguousarray(limbs[:, ::-1]).astype('>u8')
+    return _numpy_to_binary_series(name, words.view(np.uint8), valid)
+
+
+def _check_overflow(overflow: Overflow) -> None:
+    if overflow not in ('null', 'wrap'):
+        raise Exception('invalid overflow: ' + str(overflow))
+
+
+#
+# # limb helpers
+#
+
+
+def _binary_limbs(expr: pl.Expr) -> list[pl.Expr]:
+    """limbs read directly from 32 byte words, null for other widths"""
+    import polars as pl
+
+    is_word = expr.bin.size() == 32
+    return [
+        pl.when(is_word).then(
+            expr.bin.slice(24 - 8 * i, 8).bin.reinterpret(
+                dtype=pl.UInt64, endianness='big'
+            )
+        )
+        for i in range(N_LIMBS)
+    ]
+
+
+def _get_limbs(value: Limbs) -> list[pl.Expr]:
+    import polars as pl
+
+    if isinstance(value, int):
+        return [pl.lit(limb, dtype=pl.UInt64) for limb in int_to_limbs(value)]
+    else:
+        return [value.arr.get(i) for i in range(N_LIMBS)]
+
+
+def _concat_limbs(limbs: list[pl.Expr]) -> pl.Expr:
+    import polars as pl
+
+    is_valid = pl.all_horizontal([limb.is_not_null() for limb in limbs])
+    return pl.when(is_valid).then(pl.concat_arr(limbs))
+
+
+def _low_limb(expr: pl.Expr) -> pl.Expr:
+    import polars as pl
+
+    return (expr % pl.lit(2**LIMB_BITS, dtype=pl.UInt128)).cast(pl.UInt64)
+
+
+def _high_limb(expr: pl.Expr) -> pl.Expr:
+    import polars as pl
+
+    return expr // pl.lit(2**LIMB_BITS, dtype=pl.UInt128)
+
+
+def _add(
+    a: list[pl.Expr], b: list[pl.Expr], carry: pl.Expr
+) -> tuple[list[pl.Expr], pl.Expr]:
+    import polars as pl
+
+    carry = carry.cast(pl.UInt128)
+    sum_limbs = []
+    for a_limb, b_limb in zip(a, b):
+        total = a_limb.cast(pl.UInt128) + b_limb + carry
+        sum_limbs.append(_low_limb(total))
+        carry = _high_limb(total)
+    return sum_limbs, carry
+
+
+def _neg(limbs: list[pl.Expr]) -> list[pl.Expr]:
+    import polars as pl
+
+    zeros = [pl.lit(0, dtype=pl.UInt64)] * N_LIMBS
+    inverted = [~limb for limb in limbs]
+    return _add(inverted, zeros, pl.lit(1))[0]
+
+
+def _udiv(limbs: list[pl.Expr], divisor: pl.Expr) -> list[pl.Expr]:
+    import polars as pl
+
+    divisor = divisor.cast(pl.UInt128)
+    quotient = []
+    remainder = pl.lit(0, dtype=pl.UInt128)
+    for limb in reversed(limbs):
+        current = remainder * pl.lit(2**LIMB_BITS, dtype=pl.UInt128) + limb
+        quotient.append((current // divisor).cast(pl.UInt64))
+        remainder = current % divisor
+    return list(reversed(quotient))
+
+
+def _is_negative(limbs: list[pl.Expr]) -> pl.Expr:
+    return limbs[-1] >= 2**63
+
+
+def _compare(a: list[pl.Expr], b: list[pl.Expr], *, signed: bool) -> pl.Expr:
+    """a > b, evaluated from the least significant limb upward"""
+    import polars as pl
+
+    if signed:
+        sign_bit = pl.lit(2**63, dtype=pl.UInt64)
+        a = a[:-1] + [a[-1].xor(sign_bit)]
+        b = b[:-1] + [b[-1].xor(sign_bit)]
+    result = a[0] > b[0]
+    for a_limb, b_limb in zip(a[1:], b[1:]):
+        result = (a_limb > b_limb) | ((a_limb == b_limb) & result)
+    return result
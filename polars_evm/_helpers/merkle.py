@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    _NDArray = np.ndarray[typing.Any, typing.Any]
+
+
+def merkle_root(
+    df: pl.DataFrame,
+    leaf: str,
+    group_by: str | typing.Sequence[str] | None = None,
+    *,
+    sorted_pairs: bool = True,
+) -> pl.DataFrame:
+    """
+    merkle root of the 32 byte leaves of each group, as a merkle_root column
+
+    all groups are hashed together one tree level at a time. leaves are
+    taken in row order. with sorted_pairs=True each pair is sorted before
+    hashing, as in OpenZeppelin MerkleProof. a node without a sibling is
+    promoted to the next level unchanged. groups are sorted by their keys
+    """
+    import polars as pl
+
+    from .conversions.binary_numpy_conversions import _numpy_to_binary_series
+
+    group_columns, group_ids = _get_group_ids(df, group_by)
+    leaves, order, groups = _sorted_leaves(df, leaf, group_ids)
+    roots, _ = _merkle_levels(leaves, groups, sorted_pairs, proofs=False)
+
+    root_series = _numpy_to_binary_series(
+        'merkle_root', roots, _all_valid(len(roots))
+    )
+    if len(group_columns) == 0:
+        return root_series.to_frame()
+    first_rows = order[_group_starts(groups, len(roots))]
+    return df.select(pl.col(group_columns).gather(first_rows)).with_columns(
+        root_series
+    )
+
+
+def merkle_proofs(
+    df: pl.DataFrame,
+    leaf: str,
+    group_by: str | typing.Sequence[str] | None = None,
+    *,
+    sorted_pairs: bool = True,
+) -> pl.DataFrame:
+    """
+    add a merkle_proof column with the proof of each leaf within its group
+
+    proofs are lists of 32 byte sibling hashes from the leaf level upward,
+    see merkle_root() for how trees are built
+    """
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa  # type: ignore
+
+    from .conversions.binary_numpy_conversions import _numpy_to_binary_series
+
+    _, group_ids = _get_group_ids(df, group_by)
+    leaves, order, groups = _sorted_leaves(df, leaf, group_ids)
+    _, (proof_leaves, siblings) = _merkle_levels(
+        leaves, groups, sorted_pairs, proofs=True
+    )
+
+    # siblings are stored row by row in the original row order, and level
+    # by level within each row
+    proof_rows = order[proof_leaves]
+    proof_order = np.argsort(proof_rows, kind='stable')
+    values = _numpy_to_binary_series(
+        'merkle_proof', siblings[proof_order], _all_valid(len(siblings))
+    )
+    proof_lengths = np.bincount(proof_rows, minlength=len(df))
+    offsets = np.concatenate([[0], np.cumsum(proof_lengths)])
+    proofs = pa.LargeListArray.from_arrays(
+        pa.array(offsets, type=pa.int64()),
+        values.to_arrow(compat_level=pl.CompatLevel.newest()),
+    )
+    return df.with_columns(
+        pl.Series('merkle_proof', proofs, dtype=pl.List(pl.Binary))
+    )
+
+
+#
+# # helpers
+#
+
+
+def _get_group_ids(
+    df: pl.DataFrame, group_by: str | typing.Sequence[str] | None
+) -> tuple[list[str], _NDArray]:
+    import numpy as np
+    import polars as pl
+
+    if group_by is None:
+        return [], np.zeros(len(df), dtype=np.int64)
+    if isinstance(group_by, str):
+        group_by = [group_by]
+    group_columns = list(group_by)
+    ids = df.select(pl.struct(group_columns).rank('dense') - 1).to_series()
+    return group_columns, ids.to_numpy().astype(np.int64)
+
+
+def _sorted_leaves(
+    df: pl.DataFrame, leaf: str, group_ids: _NDArray
+) -> tuple[_NDArray, _NDArray, _NDArray]:
+    """leaf words sorted by group, the sort order, and sorted group ids"""
+    import numpy as np
+
+    from .conversions.binary_numpy_conversions import _binary_words
+
+    words, valid = _binary_words(df[leaf], 32)
+    if not valid.all():
+        raise Exception('merkle leaves must be non-null 32 byte hashes')
+    order = np.argsort(group_ids, kind='stable')
+    return words[order], order, group_ids[order]
+
+
+def _merkle_levels(
+    nodes: _NDArray, groups: _NDArray, sorted_pairs: bool, *, proofs: bool
+) -> tuple[_NDArray, tuple[_NDArray, _NDArray]]:
+    """
+    hash sorted leaves of all groups into roots, one level per pass
+
+    returns roots of each group and, when proofs=True, the sibling words of
+    every proof with the leaf each belongs to, in order of level
+    """
+    import numpy as np
+
+    from .hashes import _keccak_numpy
+
+    n_groups = int(groups[-1]) + 1 if len(groups) > 0 else 0
+    counts = np.bincount(groups, minlength=n_groups)
+    leaf_nodes = np.arange(len(nodes))
+    proof_leaves = [np.zeros(0, dtype=np.int64)]
+    siblings = [np.zeros((0, 32), dtype=np.uint8)]
+    while (counts > 1).any():
+        starts = _group_starts(groups, n_groups)
+        positions = np.arange(len(nodes)) - starts[groups]
+        is_left = positions % 2 == 0
+        has_right = is_left & (positions + 1 < counts[groups])
+
+        if proofs:
+            leaf_is_left = is_left[leaf_nodes]
+            has_sibling = ~leaf_is_left | has_right[leaf_nodes]
+            partners = np.where(leaf_is_left, leaf_nodes + 1, leaf_nodes - 1)
+            proof_leaves.append(np.flatnonzero(has_sibling))
+            siblings.append(nodes[partners[has_sibling]])
+
+        # hash pairs, nodes without a sibling move up unchanged
+        lefts = np.flatnonzero(has_right)
+        parents = nodes[is_left]
+        parents[has_right[is_left]] = _keccak_numpy(
+            _pair_messages(nodes[lefts], nodes[lefts + 1], sorted_pairs)
+        )
+        leaf_nodes = (np.cumsum(is_left) - 1)[leaf_nodes]
+        nodes = parents
+        groups = groups[is_left]
+        counts = (counts + 1) // 2
+
+    return nodes, (np.concatenate(proof_leaves), np.concatenate(siblings))
+
+
+def _pair_messages(
+    lefts: _NDArray, rights: _NDArray, sorted_pairs: bool
+) -> _NDArray:
+    """(n, 64) concatenated pairs, sorted by value if sorted_pairs"""
+    import numpy as np
+
+    if sorted_pairs:
+        # compare big-endian words from the least significant limb upward
+        left_limbs = lefts.view('>u8')
+        right_limbs = rights.view('>u8')
+        is_ordered = left_limbs[:, 3] <= right_limbs[:, 3]
+        for i in range(2, -1, -1):
+            is_ordered = (left_limbs[:, i] < right_limbs[:, i]) | (
+                (left_limbs[:, i] == right_limbs[:, i]) & is_ordered
+            )
+        swap = ~is_ordered[:, None]
+        lefts, rights = (
+            np.where(swap, rights, lefts),
+            np.where(swap, lefts, rights),
+        )
+    return np.concatenate([lefts, rights], axis=1)
+
+
+def _group_starts(groups: _NDArray, n_groups: int) -> _NDArray:
+    import numpy as np
+
+    counts = np.bincount(groups, minlength=n_groups)
+    return np.cumsum(counts) - counts
+
+
+def _all_valid(n: int) -> _NDArray:
+    import numpy as np
+
+    return np.ones(n, dtype=bool)
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    _NDArray = np.ndarray[typing.Any, typing.Any]
+
+    Slot = typing.Union[int, pl.Expr]
+    SlotSeries = typing.Union[int, pl.Series]
+
+
+def mapping_slot_series(
+    key: pl.Series, slot: SlotSeries, key_type: str = 'address'
+) -> pl.Series:
+    """
+    storage slots of mapping values, keccak(pad32(key) ++ pad32(slot))
+
+    string and bytes keys are hashed unpadded as keccak(key ++ pad32(slot)).
+    keys that do not fit key_type become null
+    """
+    import numpy as np
+
+    from .conversions.binary_numpy_conversions import _numpy_to_binary_series
+    from .hashes import _keccak_buffers, _keccak_rows
+
+    _check_key_type(key_type)
+    slot_words, slot_valid = _slot_words(slot, len(key))
+    if key_type in ('string', 'bytes'):
+        data, starts, lengths, valid = _dynamic_key_messages(
+            key, key_type, slot_words
+        )
+        digests = _keccak_buffers(data, starts, lengths)
+    else:
+        key_words, valid = _key_words(key, key_type)
+        digests = _keccak_rows(np.concatenate([key_words, slot_words], axis=1))
+    return _numpy_to_binary_series(key.name, digests, valid & slot_valid)
+
+
+def mapping_slot_expr(
+    key: pl.Expr, slot: Slot, key_type: str = 'address'
+) -> pl.Expr:
+    """
+    storage slots of mapping values as 32 byte words
+
+    slot is the declared slot of the mapping, or an expr of 32 byte words
+    such as the output of another mapping_slot_expr()
+    """
+    import polars as pl
+
+    _check_key_type(key_type)
+    return pl.map_batches(
+        [key, _slot_lit(slot)],
+        lambda series: mapping_slot_series(series[0], series[1], key_type),
+        return_dtype=pl.Binary,
+        is_elementwise=True,
+    )
+
+
+def nested_mapping_slot_series(
+    keys: typing.Sequence[pl.Series],
+    slot: SlotSeries,
+    key_types: str | typing.Sequence[str] = 'address',
+) -> pl.Series:
+    """storage slots of nested mapping values, keys from outermost inward"""
+    key_types = _get_key_types(keys, key_types)
+    slots = _slot_series(slot)
+    for key, key_type in zip(keys, key_types):
+        slots = mapping_slot_series(key, slots, key_type)
+    return slots.alias(keys[0].name)
+
+
+def nested_mapping_slot_expr(
+    keys: typing.Sequence[pl.Expr],
+    slot: Slot,
+    key_types: str | typing.Sequence[str] = 'address',
+) -> pl.Expr:
+    """
+    storage slots of nested mapping values, keys from outermost inward
+
+    for mapping(address => mapping(address => uint256)) allowance at slot p,
+    the slot of allowance[owner][spender] is
+    keccak(pad32(spender) ++ keccak(pad32(owner) ++ pad32(p)))
+    """
+    key_types = _get_key_types(keys, key_types)
+    slots = _slot_lit(slot)
+    for key, key_type in zip(keys, key_types):
+        slots = mapping_slot_expr(key, slots, key_type)
+    name = keys[0].meta.output_name(raise_if_undetermined=False)
+    if name is not None:
+        slots = slots.alias(name)
+    return slots
+
+
+def array_element_slot_series(
+    index: pl.Series, slot: SlotSeries, element_words: int = 1
+) -> pl.Series:
+    """
+    storage slots of dynamic array elements, keccak(slot) + index * words
+
+    the addition is exact modulo 2**256. negative indices become null
+    """
+    import numpy as np
+    import polars as pl
+
+    from .conversions.word_conversions import _u128_to_numpy_limbs
+    from .hashes import _keccak_rows
+    from .limbs import _numpy_limbs_to_binary
+
+    if element_words < 1 or element_words >= 2**64:
+        raise Exception('element_words must be between 1 and 2**64 - 1')
+    if not index.dtype.is_integer():
+        raise Exception('invalid dtype for array index: ' + str(index.dtype))
+
+    # hash each distinct slot word once
+    slot_words, slot_valid = _slot_words(slot, len(index))
+    if len(index) > 0 and slot_words.strides[0] == 0:
+        bases = np.broadcast_to(_keccak_rows(slot_words[:1]), slot_words.shape)
+    else:
+        bases = _keccak_rows(slot_words)
+    base_limbs = bases.view('>u8')[:, ::-1].astype(np.uint64)
+
+    # offsets below 2**128, then add with carries between limbs
+    offsets = index.to_frame('index').select(
+        pl.when(pl.col.index >= 0).then(
+            pl.col.index.cast(pl.UInt128, strict=False)
+            * pl.lit(element_words, dtype=pl.UInt128)
+        )
+    )
+    offset_limbs = _u128_to_numpy_limbs(offsets.to_series())
+    valid = offsets.to_series().is_not_null().to_numpy() & slot_valid
+    limbs = np.empty_like(base_limbs)
+    carry = np.zeros(len(index), dtype=np.uint64)
+    for i in range(4):
+        partial = base_limbs[:, i] + offset_limbs[:, i]
+        total = partial + carry
+        carry = ((partial < base_limbs[:, i]) | (total < partial)).astype(
+            np.uint64
+        )
+        limbs[:, i] = total
+    return _numpy_limbs_to_binary(index.name, limbs, valid)
+
+
+def array_element_slot_expr(
+    index: pl.Expr, slot: Slot, element_words: int = 1
+) -> pl.Expr:
+    """
+    storage slots of dynamic array elements as 32 byte words
+
+    elements spanning several words are laid out element_words apart. slot
+    is the declared slot of the array, or an expr of 32 byte words such as
+    the output of mapping_slot_expr() for arrays stored in mappings
+    """
+    import polars as pl
+
+    return pl.map_batches(
+        [index, _slot_lit(slot)],
+        lambda series: array_element_slot_series(
+            series[0], series[1], element_words
+        ),
+        return_dtype=pl.Binary,
+        is_elementwise=True,
+    )
+
+
+#
+# # helpers
+#
+
+
+def _check_key_type(key_type: str) -> None:
+    if key_type in ('address', 'bool', 'string', 'bytes'):
+        return
+    abi_type = _parse_static_key_type(key_type)
+    if abi_type is None:
+        raise Exception('invalid mapping key type: ' + key_type)
+
+
+@functools.lru_cache
+def _parse_static_key_type(key_type: str) -> tuple[str, int, bool] | None:
+    """(kind, n_bits, signed) of uintN, intN, and bytesN key types"""
+    import re
+
+    match = re.fullmatch('(u?int|bytes)([0-9]*)', key_type)
+    if match is None:
+        return None
+    name, size = match.groups()
+    if name == 'bytes':
+        if size == '':
+            return None
+        n_bits = 8 * int(size)
+    else:
+        n_bits = int(size) if size != '' else 256
+    if n_bits % 8 != 0 or not 0 < n_bits <= 256:
+        return None
+    if name == 'bytes':
+        return ('bytes', n_bits, False)
+    else:
+        return ('int', n_bits, name == 'int')
+
+
+def _get_key_types(
+    keys: typing.Sequence[typing.Any], key_types: str | typing.Sequence[str]
+) -> list[str]:
+    if len(keys) == 0:
+        raise Exception('must specify at least one key')
+    if isinstance(key_types, str):
+        return [key_types] * len(keys)
+    if len(key_types) != len(keys):
+        raise Exception('must specify one key type per key')
+    return list(key_types)
+
+
+def _slot_lit(slot: Slot) -> pl.Expr:
+    import polars as pl
+
+    if isinstance(slot, int):
+        _check_slot(slot)
+        return pl.lit(slot.to_bytes(32, 'big'), dtype=pl.Binary)
+    else:
+        return slot
+
+
+def _slot_series(slot: SlotSeries) -> pl.Series:
+    import polars as pl
+
+    if isinstance(slot, int):
+        _check_slot(slot)
+        return pl.Series([slot.to_bytes(32, 'big')], dtype=pl.Binary)
+    else:
+        return slot
+
+
+def _check_slot(slot: int) -> None:
+    if slot < 0 or slot >= 2**256:
+        raise Exception('slot out of range for 256 bits: ' + str(slot))
+
+
+def _slot_words(slot: SlotSeries, n_rows: int) -> tuple[_NDArray, _NDArray]:
+    """(n_rows, 32) slot words, a single slot is broadcast to every row"""
+    import numpy as np
+    import polars as pl
+
+    from .conversions import hex_series_to_binary, int_series_to_word
+    from .conversions.binary_numpy_conversions import _binary_words
+
+    slot = _slot_series(slot)
+    if slot.dtype == pl.String:
+        slot = hex_series_to_binary(slot)
+    elif slot.dtype.is_integer():
+        slot = int_series_to_word(slot)
+    words, valid = _binary_words(slot, 32)
+    if len(slot) == 1 and n_rows != 1:
+        words = np.broadcast_to(words, (n_rows, 32))
+        valid = np.broadcast_to(valid, (n_rows,))
+    elif len(slot) != n_rows:
+        raise Exception('slot must be a single value or one value per key')
+    return words, valid
+
+
+def _key_words(key: pl.Series, key_type: str) -> tuple[_NDArray, _NDArray]:
+    """(n, 32) abi encoded words of static mapping keys"""
+    import numpy as np
+    import polars as pl
+
+    from .conversions import hex_series_to_binary
+    from .conversions.binary_numpy_conversions import _binary_words
+
+    if key.dtype == pl.String:
+        key = hex_series_to_binary(key)
+
+    if key_type == 'address':
+        words = np.zeros((len(key), 32), dtype=np.uint8)
+        words[:, 12:], valid = _binary_words(key, 20)
+        return words, valid
+    elif key_type == 'bool':
+        if key.dtype == pl.Boolean:
+            key = key.cast(pl.UInt8)
+        return _binary_words(_int_key_words(key, 8, False), 32)
+
+    parsed = _parse_static_key_type(key_type)
+    if parsed is None:
+        raise Exception('invalid mapping key type: ' + key_type)
+    kind, n_bits, signed = parsed
+    if kind == 'bytes':
+        n_bytes = n_bits // 8
+        words = np.zeros((len(key), 32), dtype=np.uint8)
+        words[:, :n_bytes], valid = _binary_words(key, n_bytes)
+        return words, valid
+    else:
+        return _binary_words(_int_key_words(key, n_bits, signed), 32)
+
+
+def _int_key_words(key: pl.Series, n_bits: int, signed: bool) -> pl.Series:
+    """integer keys as words, binary keys must already be 32 byte words"""
+    import polars as pl
+
+    from .conversions import int_series_to_word
+
+    if key.dtype.is_integer():
+        return int_series_to_word(key, n_bits, signed)
+    elif key.dtype == pl.Binary:
+        return key
+    else:
+        raise Exception('invalid dtype for integer keys: ' + str(key.dtype))
+
+
+def _dynamic_key_messages(
+    key: pl.Series, key_type: str, slot_words: _NDArray
+) -> tuple[_NDArray, _NDArray, _NDArray, _NDArray]:
+    """buffer of key ++ slot messages for string and bytes keys"""
+    import numpy as np
+    import polars as pl
+
+    from .conversions import hex_series_to_binary
+    from .hashes import _large_binary_buffers
+
+    if key.dtype == pl.String:
+        if key_type == 'string':
+            key = key.cast(pl.Binary)
+        else:
+            key = hex_series_to_binary(key)
+    elif key.dtype != pl.Binary:
+        raise Exception('invalid dtype for ' + key_type + ' keys')
+    data, starts, lengths, valid = _large_binary_buffers(key)
+    lengths = np.where(valid, lengths, 0)
+
+    # each message is the key bytes followed by the 32 byte slot word
+    message_lengths = lengths + 32
+    message_starts = np.cumsum(message_lengths) - message_lengths
+    messages = np.empty(int(message_lengths.sum()), dtype=np.uint8)
+    positions = np.arange(int(lengths.sum())) - np.repeat(
+        np.cumsum(lengths) - lengths, lengths
+    )
+    sources = np.repeat(starts, lengths) + positions
+    messages[np.repeat(message_starts, lengths) + positions] = data[sources]
+    slot_positions = (message_starts + lengths)[:, None] + np.arange(32)
+    messages[slot_positions] = slot_words
+    return messages, message_starts, message_lengths, valid
@@ -15,11 +15,49 @@ class DataFrameEvm:
     def filter_binary(self, **column_addresses: typing.Any) -> pl.DataFrame:
         return _helpers.filter_binary(self._df, column_addresses)
 
+    def join_on_hash(
+        self,
+        other: pl.DataFrame,
+        on: str,
+        *,
+        how: typing.Literal['inner', 'left'] = 'inner',
+        offset: int = 0,
+        suffix: str = '_right',
+    ) -> pl.DataFrame:
+        return _helpers.join_on_hash(
+            self._df, other, on, how=how, offset=offset, suffix=suffix
+        )
+
+    def merkle_root(
+        self,
+        leaf: str,
+        group_by: str | typing.Sequence[str] | None = None,
+        *,
+        sorted_pairs: bool = True,
+    ) -> pl.DataFrame:
+        return _helpers.merkle_root(
+            self._df, leaf, group_by, sorted_pairs=sorted_pairs
+        )
+
+    def merkle_proofs(
+        self,
+        leaf: str,
+        group_by: str | typing.Sequence[str] | None = None,
+        *,
+        sorted_pairs: bool = True,
+    ) -> pl.DataFrame:
+        return _helpers.merkle_proofs(
+            self._df, leaf, group_by, sorted_pairs=sorted_pairs
+        )
+
     def binary_to_hex(
-        self, columns: typing.Sequence[str] | None = None, prefix: bool = True
+        self,
+        columns: typing.Sequence[str] | None = None,
+        prefix: bool = True,
+        checksum: bool = False,
     ) -> pl.DataFrame:
         return _helpers.binary_df_to_hex(
-            self._df, columns=columns, prefix=prefix
+            self._df, columns=columns, prefix=prefix, checksum=checksum
         )
 
     def hex_to_binary(
@@ -30,12 +68,49 @@ class DataFrameEvm:
         )
 
     def binary_to_float(
-        self, column_types: dict[str, str], replace: bool = False
+        self,
+        column_types: dict[str, str],
+        replace: bool = False,
+        method: typing.Literal['expr', 'numpy'] = 'expr',
     ) -> pl.DataFrame:
         return _helpers.binary_df_to_float(
+            df=self._df,
+            column_types=column_types,
+            replace=replace,
+            method=method,
+        )
+
+    def binary_to_int(
+        self, column_types: dict[str, str], replace: bool = False
+    ) -> pl.DataFrame:
+        return _helpers.binary_df_to_int(
             df=self._df, column_types=column_types, replace=replace
         )
 
+    def normalize_amounts(
+        self,
+        column_tokens: dict[str, str],
+        decimals_table: pl.DataFrame,
+        *,
+        table_token: str = 'address',
+        table_decimals: str = 'decimals',
+        signed: bool = False,
+        scale: int = 18,
+        output: _helpers.AmountOutput = 'decimal',
+        replace: bool = False,
+    ) -> pl.DataFrame:
+        return _helpers.normalize_amounts(
+            self._df,
+            column_tokens,
+            decimals_table,
+            table_token=table_token,
+            table_decimals=table_decimals,
+            signed=signed,
+            scale=scale,
+            output=output,
+            replace=replace,
+        )
+
     def decode(
         self,
         column_types: dict[str, str | _helpers.AbiType],
@@ -43,6 +118,9 @@ class DataFrameEvm:
         padded: bool = True,
         prefix: bool = True,
         hex_output: bool = False,
+        fixed_output: bool = False,
+        checksum: bool = False,
+        int_output: _helpers.IntOutput = 'float',
         replace: bool = False,
     ) -> pl.DataFrame:
         return _helpers.decode_df(
@@ -51,6 +129,9 @@ class DataFrameEvm:
             padded=padded,
             prefix=prefix,
             hex_output=hex_output,
+            fixed_output=fixed_output,
+            checksum=checksum,
+            int_output=int_output,
             replace=replace,
         )
 
@@ -62,6 +143,10 @@ class DataFrameEvm:
         drop_raw_columns: bool = True,
         name_prefix: str | None = None,
         hex_output: bool = False,
+        fixed_output: bool = False,
+        checksum: bool = False,
+        int_output: _helpers.IntOutput = 'float',
+        address_dictionary: _helpers.AddressDictionary | None = None,
     ) -> pl.DataFrame:
         return _helpers.decode_events(
             events=self._df,
@@ -70,6 +155,10 @@ class DataFrameEvm:
             drop_raw_columns=drop_raw_columns,
             name_prefix=name_prefix,
             hex_output=hex_output,
+            fixed_output=fixed_output,
+            checksum=checksum,
+            int_output=int_output,
+            address_dictionary=address_dictionary,
         )
 
     def decode_contract_events(
@@ -79,6 +168,10 @@ class DataFrameEvm:
         drop_raw_columns: bool = True,
         name_prefix: str | None = None,
         hex_output: bool = False,
+        fixed_output: bool = False,
+        checksum: bool = False,
+        int_output: _helpers.IntOutput = 'float',
+        address_dictionary: _helpers.AddressDictionary | None = None,
         ignore_unknown: bool = False,
         key: typing.Literal['topic0', 'name'] | None = None,
     ) -> dict[str, pl.DataFrame]:
@@ -88,6 +181,10 @@ class DataFrameEvm:
             drop_raw_columns=drop_raw_columns,
             name_prefix=name_prefix,
             hex_output=hex_output,
+            fixed_output=fixed_output,
+            checksum=checksum,
+            int_output=int_output,
+            address_dictionary=address_dictionary,
             ignore_unknown=ignore_unknown,
             key=key,
         )
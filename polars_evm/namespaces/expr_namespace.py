@@ -12,20 +12,277 @@ class ExprEvm:
     def __init__(self, expr: pl.Expr):
         self._expr = expr
 
-    def binary_to_hex(self, prefix: bool = True) -> pl.Expr:
-        return _helpers.binary_expr_to_hex(self._expr, prefix=prefix)
+    def binary_to_hex(
+        self, prefix: bool = True, checksum: bool = False
+    ) -> pl.Expr:
+        return _helpers.binary_expr_to_hex(
+            self._expr, prefix=prefix, checksum=checksum
+        )
 
     def hex_to_binary(self, prefix: bool = True) -> pl.Expr:
         return _helpers.hex_expr_to_binary(self._expr, prefix=prefix)
 
-    def binary_to_float(self, raw_type: str) -> pl.Expr:
-        return _helpers.hex_expr_to_float(
-            self._expr.bin.encode('hex'), raw_type=raw_type
-        )
+    def binary_to_float(
+        self,
+        raw_type: str,
+        method: typing.Literal['expr', 'numpy'] = 'expr',
+    ) -> pl.Expr:
+        if method == 'numpy':
+            return self._expr.map_batches(
+                lambda series: _helpers.binary_series_to_float_numpy(
+                    series, raw_type=raw_type
+                ),
+                return_dtype=pl.Float64,
+            )
+        elif method == 'expr':
+            return _helpers.binary_expr_to_float(self._expr, raw_type=raw_type)
+        else:
+            raise Exception('invalid method: ' + str(method))
 
     def hex_to_float(self, raw_type: str) -> pl.Expr:
         return _helpers.hex_expr_to_float(self._expr, raw_type=raw_type)
 
+    def binary_to_int(self, raw_type: str) -> pl.Expr:
+        return _helpers.binary_expr_to_int(self._expr, raw_type=raw_type)
+
+    def hex_to_int(self, raw_type: str) -> pl.Expr:
+        return _helpers.hex_expr_to_int(self._expr, raw_type=raw_type)
+
+    def binary_to_decimal_str(self, signed: bool = False) -> pl.Expr:
+        return _helpers.binary_expr_to_decimal_str(self._expr, signed=signed)
+
+    def int_to_word(
+        self,
+        n_bits: int = 256,
+        signed: bool = False,
+        *,
+        hex_output: bool = False,
+    ) -> pl.Expr:
+        return _helpers.int_expr_to_word(
+            self._expr, n_bits, signed, hex_output=hex_output
+        )
+
+    def decimal_str_to_word(
+        self,
+        n_bits: int = 256,
+        signed: bool = False,
+        *,
+        hex_output: bool = False,
+    ) -> pl.Expr:
+        return _helpers.decimal_str_expr_to_word(
+            self._expr, n_bits, signed, hex_output=hex_output
+        )
+
+    def float_to_word(
+        self,
+        n_bits: int = 256,
+        signed: bool = False,
+        *,
+        hex_output: bool = False,
+    ) -> pl.Expr:
+        return _helpers.float_expr_to_word(
+            self._expr, n_bits, signed, hex_output=hex_output
+        )
+
+    def scale_amount(
+        self,
+        decimals: pl.Expr | int,
+        *,
+        signed: bool = False,
+        scale: int = 18,
+        output: _helpers.AmountOutput = 'decimal',
+    ) -> pl.Expr:
+        return _helpers.scale_amount(
+            self._expr, decimals, signed=signed, scale=scale, output=output
+        )
+
+    def q_to_float(
+        self,
+        int_bits: int,
+        frac_bits: int,
+        *,
+        squared: bool = False,
+        signed: bool = False,
+    ) -> pl.Expr:
+        return _helpers.q_expr_to_float(
+            self._expr, int_bits, frac_bits, squared=squared, signed=signed
+        )
+
+    def q_to_fraction(
+        self,
+        int_bits: int,
+        frac_bits: int,
+        *,
+        squared: bool = False,
+        signed: bool = False,
+    ) -> pl.Expr:
+        return _helpers.q_expr_to_fraction(
+            self._expr, int_bits, frac_bits, squared=squared, signed=signed
+        )
+
+    def to_fixed(self, width: int = 32) -> pl.Expr:
+        return _helpers.binary_expr_to_fixed(self._expr, width)
+
+    def from_fixed(self) -> pl.Expr:
+        return _helpers.fixed_expr_to_binary(self._expr)
+
+    def fingerprint64(
+        self, *, offset: int = 0, check_collisions: bool = False
+    ) -> pl.Expr:
+        return _helpers.fingerprint64_expr(
+            self._expr, offset=offset, check_collisions=check_collisions
+        )
+
+    def intern_addresses(
+        self, dictionary: _helpers.AddressDictionary
+    ) -> pl.Expr:
+        return dictionary.intern_expr(self._expr)
+
+    def resolve_ids(self, dictionary: _helpers.AddressDictionary) -> pl.Expr:
+        return dictionary.resolve_expr(self._expr)
+
+    def hex_quantity_to_int(
+        self, dtype: pl.DataType | type[pl.DataType] = pl.UInt64
+    ) -> pl.Expr:
+        return _helpers.hex_quantity_expr_to_int(self._expr, dtype=dtype)
+
+    def hex_quantity_to_word(self) -> pl.Expr:
+        return _helpers.hex_quantity_expr_to_word(self._expr)
+
+    def binary_to_limbs(self) -> pl.Expr:
+        return _helpers.binary_expr_to_limbs(self._expr)
+
+    def limbs_to_binary(self) -> pl.Expr:
+        return _helpers.limbs_expr_to_binary(self._expr)
+
+    def limbs_add(self, other: pl.Expr | int) -> pl.Expr:
+        return _helpers.limbs_add(self._expr, other)
+
+    def limbs_sub(self, other: pl.Expr | int) -> pl.Expr:
+        return _helpers.limbs_sub(self._expr, other)
+
+    def limbs_neg(self) -> pl.Expr:
+        return _helpers.limbs_neg(self._expr)
+
+    def limbs_mul(self, scalar: pl.Expr | int) -> pl.Expr:
+        return _helpers.limbs_mul(self._expr, scalar)
+
+    def limbs_div(
+        self, scalar: pl.Expr | int, *, signed: bool = False
+    ) -> pl.Expr:
+        return _helpers.limbs_div(self._expr, scalar, signed=signed)
+
+    def limbs_eq(self, other: pl.Expr | int) -> pl.Expr:
+        return _helpers.limbs_eq(self._expr, other)
+
+    def limbs_ne(self, other: pl.Expr | int) -> pl.Expr:
+        return _helpers.limbs_ne(self._expr, other)
+
+    def limbs_gt(
+        self, other: pl.Expr | int, *, signed: bool = False
+    ) -> pl.Expr:
+        return _helpers.limbs_gt(self._expr, other, signed=signed)
+
+    def limbs_ge(
+        self, other: pl.Expr | int, *, signed: bool = False
+    ) -> pl.Expr:
+        return _helpers.limbs_ge(self._expr, other, signed=signed)
+
+    def limbs_lt(
+        self, other: pl.Expr | int, *, signed: bool = False
+    ) -> pl.Expr:
+        return _helpers.limbs_lt(self._expr, other, signed=signed)
+
+    def limbs_le(
+        self, other: pl.Expr | int, *, signed: bool = False
+    ) -> pl.Expr:
+        return _helpers.limbs_le(self._expr, other, signed=signed)
+
+    def limbs_sort_key(self, *, signed: bool = False) -> pl.Expr:
+        return _helpers.limbs_sort_key(self._expr, signed=signed)
+
+    def u256_gt(self, value: int, *, signed: bool = False) -> pl.Expr:
+        return _helpers.u256_gt(self._expr, value, signed=signed)
+
+    def u256_ge(self, value: int, *, signed: bool = False) -> pl.Expr:
+        return _helpers.u256_ge(self._expr, value, signed=signed)
+
+    def u256_lt(self, value: int, *, signed: bool = False) -> pl.Expr:
+        return _helpers.u256_lt(self._expr, value, signed=signed)
+
+    def u256_le(self, value: int, *, signed: bool = False) -> pl.Expr:
+        return _helpers.u256_le(self._expr, value, signed=signed)
+
+    def u256_between(
+        self,
+        lower: int,
+        upper: int,
+        *,
+        signed: bool = False,
+        closed: typing.Literal['both', 'left', 'right', 'none'] = 'both',
+    ) -> pl.Expr:
+        return _helpers.u256_between(
+            self._expr, lower, upper, signed=signed, closed=closed
+        )
+
+    def limbs_sum(
+        self,
+        *,
+        signed: bool = False,
+        overflow: typing.Literal['null', 'wrap'] = 'null',
+    ) -> pl.Expr:
+        return _helpers.limbs_sum(self._expr, signed=signed, overflow=overflow)
+
+    def limbs_cum_sum(
+        self,
+        *,
+        signed: bool = False,
+        overflow: typing.Literal['null', 'wrap'] = 'null',
+    ) -> pl.Expr:
+        return _helpers.limbs_cum_sum(
+            self._expr, signed=signed, overflow=overflow
+        )
+
+    def limbs_diff(
+        self,
+        n: int = 1,
+        *,
+        signed: bool = False,
+        overflow: typing.Literal['null', 'wrap'] = 'null',
+    ) -> pl.Expr:
+        return _helpers.limbs_diff(
+            self._expr, n, signed=signed, overflow=overflow
+        )
+
+    def u256_sum(
+        self,
+        *,
+        signed: bool = False,
+        overflow: typing.Literal['null', 'wrap'] = 'null',
+    ) -> pl.Expr:
+        return _helpers.u256_sum(self._expr, signed=signed, overflow=overflow)
+
+    def u256_cum_sum(
+        self,
+        *,
+        signed: bool = False,
+        overflow: typing.Literal['null', 'wrap'] = 'null',
+    ) -> pl.Expr:
+        return _helpers.u256_cum_sum(
+            self._expr, signed=signed, overflow=overflow
+        )
+
+    def u256_diff(
+        self,
+        n: int = 1,
+        *,
+        signed: bool = False,
+        overflow: typing.Literal['null', 'wrap'] = 'null',
+    ) -> pl.Expr:
+        return _helpers.u256_diff(
+            self._expr, n, signed=signed, overflow=overflow
+        )
+
     def decode_hex(
         self,
         abi_type: str,
@@ -33,6 +290,9 @@ class ExprEvm:
         padded: bool = True,
         prefix: bool = True,
         hex_output: bool = False,
+        fixed_output: bool = False,
+        checksum: bool = False,
+        int_output: _helpers.IntOutput = 'float',
     ) -> pl.Expr:
         return _helpers.decode_hex_expr(
             self._expr,
@@ -40,6 +300,29 @@ class ExprEvm:
             padded=padded,
             prefix=prefix,
             hex_output=hex_output,
+            fixed_output=fixed_output,
+            checksum=checksum,
+            int_output=int_output,
+        )
+
+    def decode_binary(
+        self,
+        abi_type: str,
+        *,
+        padded: bool = True,
+        hex_output: bool = False,
+        fixed_output: bool = False,
+        checksum: bool = False,
+        int_output: _helpers.IntOutput = 'float',
+    ) -> pl.Expr:
+        return _helpers.decode_binary_expr(
+            self._expr,
+            abi_type=abi_type,
+            padded=padded,
+            hex_output=hex_output,
+            fixed_output=fixed_output,
+            checksum=checksum,
+            int_output=int_output,
         )
 
     def keccak(
@@ -49,6 +332,74 @@ class ExprEvm:
         ] = 'hex',
         text: bool = False,
     ) -> pl.Expr:
-        return self._expr.map_elements(
-            lambda datum: _helpers.keccak(datum, output=output, text=text)
+        return _helpers.keccak_expr(self._expr, output=output, text=text)
+
+    def keccak_packed(
+        self,
+        *exprs: pl.Expr,
+        types: typing.Sequence[str],
+        output: typing.Literal[
+            'hex', 'binary', 'prefix_hex', 'raw_hex'
+        ] = 'hex',
+    ) -> pl.Expr:
+        return _helpers.keccak_packed_expr(
+            [self._expr, *exprs], types, output=output
+        )
+
+    def keccak_encoded(
+        self,
+        *exprs: pl.Expr,
+        types: typing.Sequence[str],
+        output: typing.Literal[
+            'hex', 'binary', 'prefix_hex', 'raw_hex'
+        ] = 'hex',
+    ) -> pl.Expr:
+        return _helpers.keccak_encoded_expr(
+            [self._expr, *exprs], types, output=output
+        )
+
+    def mapping_slot(
+        self, slot: int | pl.Expr, key_type: str = 'address'
+    ) -> pl.Expr:
+        return _helpers.mapping_slot_expr(self._expr, slot, key_type)
+
+    def nested_mapping_slot(
+        self,
+        inner_keys: typing.Sequence[pl.Expr],
+        slot: int | pl.Expr,
+        key_types: str | typing.Sequence[str] = 'address',
+    ) -> pl.Expr:
+        return _helpers.nested_mapping_slot_expr(
+            [self._expr, *inner_keys], slot, key_types
+        )
+
+    def array_element_slot(
+        self, slot: int | pl.Expr, element_words: int = 1
+    ) -> pl.Expr:
+        return _helpers.array_element_slot_expr(self._expr, slot, element_words)
+
+    def create_address(self, nonce: int | pl.Expr) -> pl.Expr:
+        return _helpers.create_address_expr(self._expr, nonce)
+
+    def create2_address(
+        self,
+        salt: bytes | str | pl.Expr,
+        init_code_hash: bytes | str | pl.Expr,
+    ) -> pl.Expr:
+        return _helpers.create2_address_expr(self._expr, salt, init_code_hash)
+
+    def namehash(self) -> pl.Expr:
+        return _helpers.namehash_expr(self._expr)
+
+    def labelhash(self) -> pl.Expr:
+        return _helpers.labelhash_expr(self._expr)
+
+    def eip712_hash(
+        self,
+        types: typing.Mapping[str, typing.Sequence[typing.Mapping[str, str]]],
+        domain: typing.Mapping[str, typing.Any] | None = None,
+        primary_type: str | None = None,
+    ) -> pl.Expr:
+        return _helpers.eip712_hash_expr(
+            self._expr, types, domain, primary_type
         )
@@ -20,6 +20,10 @@ class LazyFrameEvm:
         drop_raw_columns: bool = True,
         name_prefix: str | None = None,
         hex_output: bool = False,
+        fixed_output: bool = False,
+        checksum: bool = False,
+        int_output: _helpers.IntOutput = 'float',
+        address_dictionary: _helpers.AddressDictionary | None = None,
     ) -> pl.LazyFrame:
         return _helpers.decode_events(
             events=self._lf,
@@ -28,16 +32,23 @@ class LazyFrameEvm:
             drop_raw_columns=drop_raw_columns,
             name_prefix=name_prefix,
             hex_output=hex_output,
+            fixed_output=fixed_output,
+            checksum=checksum,
+            int_output=int_output,
+            address_dictionary=address_dictionary,
         )
 
     def filter_binary(self, **column_addresses: typing.Any) -> pl.LazyFrame:
         return _helpers.filter_binary(self._lf, column_addresses)
 
     def binary_to_hex(
-        self, columns: typing.Sequence[str] | None = None, prefix: bool = True
+        self,
+        columns: typing.Sequence[str] | None = None,
+        prefix: bool = True,
+        checksum: bool = False,
     ) -> pl.LazyFrame:
         return _helpers.binary_df_to_hex(
-            self._lf, columns=columns, prefix=prefix
+            self._lf, columns=columns, prefix=prefix, checksum=checksum
         )
 
     def hex_to_binary(
@@ -51,7 +62,44 @@ class LazyFrameEvm:
         self,
         column_types: dict[str, str],
         replace: bool = False,
+        method: typing.Literal['expr', 'numpy'] = 'expr',
     ) -> pl.LazyFrame:
         return _helpers.binary_df_to_float(
+            df=self._lf,
+            column_types=column_types,
+            replace=replace,
+            method=method,
+        )
+
+    def binary_to_int(
+        self,
+        column_types: dict[str, str],
+        replace: bool = False,
+    ) -> pl.LazyFrame:
+        return _helpers.binary_df_to_int(
             df=self._lf, column_types=column_types, replace=replace
         )
+
+    def normalize_amounts(
+        self,
+        column_tokens: dict[str, str],
+        decimals_table: pl.DataFrame,
+        *,
+        table_token: str = 'address',
+        table_decimals: str = 'decimals',
+        signed: bool = False,
+        scale: int = 18,
+        output: _helpers.AmountOutput = 'decimal',
+        replace: bool = False,
+    ) -> pl.LazyFrame:
+        return _helpers.normalize_amounts(
+            self._lf,
+            column_tokens,
+            decimals_table,
+            table_token=table_token,
+            table_decimals=table_decimals,
+            signed=signed,
+            scale=scale,
+            output=output,
+            replace=replace,
+        )
@@ -6,23 +6,159 @@ import polars as pl
 
 from .. import _helpers
 
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+    _NDArray = np.ndarray[typing.Any, typing.Any]
+
 
 @pl.api.register_series_namespace('evm')
 class SeriesEvm:
     def __init__(self, series: pl.Series):
         self._series = series
 
-    def binary_to_hex(self, prefix: bool = True) -> pl.Series:
-        return _helpers.binary_series_to_hex(self._series, prefix=prefix)
+    def binary_to_hex(
+        self, prefix: bool = True, checksum: bool = False
+    ) -> pl.Series:
+        return _helpers.binary_series_to_hex(
+            self._series, prefix=prefix, checksum=checksum
+        )
 
     def hex_to_binary(self, prefix: bool | None = None) -> pl.Series:
         return _helpers.hex_series_to_binary(self._series, prefix=prefix)
 
-    def binary_to_float(self, raw_type: str) -> pl.Seties:
+    def binary_to_float(
+        self,
+        raw_type: str,
+        method: typing.Literal['expr', 'numpy'] = 'expr',
+    ) -> pl.Series:
         return _helpers.binary_series_to_float(
-            hex_series=self._series, raw_type=raw_type
+            hex_series=self._series, raw_type=raw_type, method=method
+        )
+
+    def binary_to_int(self, raw_type: str) -> pl.Series:
+        return _helpers.binary_series_to_int(self._series, raw_type=raw_type)
+
+    def binary_to_decimal_str(self, signed: bool = False) -> pl.Series:
+        return _helpers.binary_series_to_decimal_str(
+            self._series, signed=signed
+        )
+
+    def int_to_word(
+        self,
+        n_bits: int = 256,
+        signed: bool = False,
+        *,
+        hex_output: bool = False,
+    ) -> pl.Series:
+        return _helpers.int_series_to_word(
+            self._series, n_bits, signed, hex_output=hex_output
+        )
+
+    def decimal_str_to_word(
+        self,
+        n_bits: int = 256,
+        signed: bool = False,
+        *,
+        hex_output: bool = False,
+    ) -> pl.Series:
+        return _helpers.decimal_str_series_to_word(
+            self._series, n_bits, signed, hex_output=hex_output
+        )
+
+    def float_to_word(
+        self,
+        n_bits: int = 256,
+        signed: bool = False,
+        *,
+        hex_output: bool = False,
+    ) -> pl.Series:
+        return _helpers.float_series_to_word(
+            self._series, n_bits, signed, hex_output=hex_output
+        )
+
+    def scale_amount(
+        self,
+        decimals: pl.Series | int,
+        *,
+        signed: bool = False,
+        scale: int = 18,
+        output: _helpers.AmountOutput = 'decimal',
+    ) -> pl.Series:
+        return _helpers.scale_amount_series(
+            self._series, decimals, signed=signed, scale=scale, output=output
+        )
+
+    def q_to_float(
+        self,
+        int_bits: int,
+        frac_bits: int,
+        *,
+        squared: bool = False,
+        signed: bool = False,
+    ) -> pl.Series:
+        return _helpers.q_series_to_float(
+            self._series, int_bits, frac_bits, squared=squared, signed=signed
+        )
+
+    def q_to_fraction(
+        self,
+        int_bits: int,
+        frac_bits: int,
+        *,
+        squared: bool = False,
+        signed: bool = False,
+    ) -> pl.Series:
+        return _helpers.q_series_to_fraction(
+            self._series, int_bits, frac_bits, squared=squared, signed=signed
+        )
+
+    def to_numpy_words(self, width: int = 32) -> _NDArray:
+        return _helpers.binary_series_to_numpy_words(self._series, width)
+
+    @staticmethod
+    def from_numpy_words(words: _NDArray, name: str = '') -> pl.Series:
+        return _helpers.numpy_words_to_binary_series(words, name=name)
+
+    def to_fixed(self, width: int = 32) -> pl.Series:
+        return _helpers.binary_series_to_fixed(self._series, width)
+
+    def from_fixed(self) -> pl.Series:
+        return _helpers.fixed_series_to_binary(self._series)
+
+    def fingerprint64(
+        self, *, offset: int = 0, check_collisions: bool = False
+    ) -> pl.Series:
+        return _helpers.fingerprint64_series(
+            self._series, offset=offset, check_collisions=check_collisions
+        )
+
+    def intern_addresses(
+        self, dictionary: _helpers.AddressDictionary, *, extend: bool = False
+    ) -> pl.Series:
+        return _helpers.intern_addresses_series(
+            self._series, dictionary, extend=extend
         )
 
+    def resolve_ids(self, dictionary: _helpers.AddressDictionary) -> pl.Series:
+        return _helpers.resolve_ids_series(self._series, dictionary)
+
+    def hex_quantity_to_int(
+        self, dtype: pl.DataType | type[pl.DataType] = pl.UInt64
+    ) -> pl.Series:
+        return _helpers.hex_quantity_series_to_int(self._series, dtype=dtype)
+
+    def hex_quantity_to_word(self) -> pl.Series:
+        return _helpers.hex_quantity_series_to_word(self._series)
+
+    def binary_to_limbs(self) -> pl.Series:
+        return self._series.to_frame().select(
+            _helpers.binary_expr_to_limbs(pl.col(self._series.name))
+        )[self._series.name]
+
+    def limbs_to_binary(self) -> pl.Series:
+        return _helpers.limbs_series_to_binary(self._series)
+
     def keccak(
         self,
         output: typing.Literal[
@@ -30,6 +166,78 @@ class SeriesEvm:
         ] = 'hex',
         text: bool = False,
     ) -> pl.Series:
-        return self._series.map_elements(
-            lambda datum: _helpers.keccak(datum, output=output, text=text)
+        return _helpers.keccak_series(self._series, output=output, text=text)
+
+    def keccak_packed(
+        self,
+        *others: pl.Series,
+        types: typing.Sequence[str],
+        output: typing.Literal[
+            'hex', 'binary', 'prefix_hex', 'raw_hex'
+        ] = 'hex',
+    ) -> pl.Series:
+        return _helpers.keccak_packed_series(
+            [self._series, *others], types, output=output
+        )
+
+    def keccak_encoded(
+        self,
+        *others: pl.Series,
+        types: typing.Sequence[str],
+        output: typing.Literal[
+            'hex', 'binary', 'prefix_hex', 'raw_hex'
+        ] = 'hex',
+    ) -> pl.Series:
+        return _helpers.keccak_encoded_series(
+            [self._series, *others], types, output=output
+        )
+
+    def mapping_slot(
+        self, slot: int | pl.Series, key_type: str = 'address'
+    ) -> pl.Series:
+        return _helpers.mapping_slot_series(self._series, slot, key_type)
+
+    def nested_mapping_slot(
+        self,
+        inner_keys: typing.Sequence[pl.Series],
+        slot: int | pl.Series,
+        key_types: str | typing.Sequence[str] = 'address',
+    ) -> pl.Series:
+        return _helpers.nested_mapping_slot_series(
+            [self._series, *inner_keys], slot, key_types
+        )
+
+    def array_element_slot(
+        self, slot: int | pl.Series, element_words: int = 1
+    ) -> pl.Series:
+        return _helpers.array_element_slot_series(
+            self._series, slot, element_words
+        )
+
+    def create_address(self, nonce: int | pl.Series) -> pl.Series:
+        return _helpers.create_address_series(self._series, nonce)
+
+    def create2_address(
+        self,
+        salt: bytes | str | pl.Series,
+        init_code_hash: bytes | str | pl.Series,
+    ) -> pl.Series:
+        return _helpers.create2_address_series(
+            self._series, salt, init_code_hash
+        )
+
+    def namehash(self) -> pl.Series:
+        return _helpers.namehash_series(self._series)
+
+    def labelhash(self) -> pl.Series:
+        return _helpers.labelhash_series(self._series)
+
+    def eip712_hash(
+        self,
+        types: typing.Mapping[str, typing.Sequence[typing.Mapping[str, str]]],
+        domain: typing.Mapping[str, typing.Any] | None = None,
+        primary_type: str | None = None,
+    ) -> pl.Series:
+        return _helpers.eip712_hash_series(
+            self._series, types, domain, primary_type
         )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+import polars as pl
+import polars_evm  # noqa: F401
+from polars_evm._helpers import keccak
+
+
+owner = bytes.fromhex('c36442b4a4522e871399cd717abdd847ab11fe88')
+
+
+def word(value: int) -> bytes:
+    return (value % 2**256).to_bytes(32, 'big')
+
+
+def padded(value: bytes) -> bytes:
+    return value + b'\x00' * (-len(value) % 32)
+
+
+def test_keccak_packed_position_key() -> None:
+    ticks = [(-887220, 887220), (-200, 100), (0, 60)]
+    target = [
+        keccak(
+            owner
+            + (lower % 2**24).to_bytes(3, 'big')
+            + (upper % 2**24).to_bytes(3, 'big')
+        )
+        for lower, upper in ticks
+    ]
+
+    df = pl.DataFrame(
+        {
+            'owner': [owner] * len(ticks),
+            'tick_lower': [lower for lower, _ in ticks],
+            'tick_upper': [upper for _, upper in ticks],
+        },
+        schema_overrides={'tick_lower': pl.Int32, 'tick_upper': pl.Int32},
+    )
+    output = df.select(
+        pl.col.owner.evm.keccak_packed(
+            pl.col.tick_lower,
+            pl.col.tick_upper,
+            types=['address', 'int24', 'int24'],
+        )
+    )
+    assert output['owner'].to_list() == target
+
+
+def test_keccak_packed_dynamic() -> None:
+    names = pl.Series('name', ['ab', 'x' * 40, None])
+    ids = pl.Series('ids', [[1, 2], [], [3]], dtype=pl.List(pl.UInt64))
+    flags = pl.Series('flag', [True, False, True])
+    output = names.evm.keccak_packed(
+        ids, flags, types=['string', 'uint8[]', 'bool'], output='binary'
+    )
+    assert output.to_list() == [
+        keccak(b'ab' + word(1) + word(2) + b'\x01', output='binary'),
+        keccak(b'x' * 40 + b'\x00', output='binary'),
+        None,
+    ]
+
+
+def test_keccak_encoded() -> None:
+    df = pl.DataFrame(
+        {
+            'nonce': pl.Series([9, 10], dtype=pl.UInt64),
+            'name': ['ab', 'x' * 40],
+            'ids': pl.Series([[1, 2], []], dtype=pl.List(pl.UInt64)),
+            'pair': pl.Series([[5, 6], [7, 8]], dtype=pl.Array(pl.UInt64, 2)),
+        }
+    )
+    target = []
+    for row in df.iter_rows(named=True):
+        name = row['name'].encode()
+        name_tail = word(len(name)) + padded(name)
+        ids_tail = word(len(row['ids'])) + b''.join(map(word, row['ids']))
+        encoded = (
+            word(row['nonce'])
+            + word(5 * 32)
+            + word(5 * 32 + len(name_tail))
+            + b''.join(map(word, row['pair']))
+            + name_tail
+            + ids_tail
+        )
+        target.append(keccak(encoded))
+
+    output = df.select(
+        pl.col.nonce.evm.keccak_encoded(
+            pl.col.name,
+            pl.col.ids,
+            pl.col.pair,
+            types=['uint256', 'string', 'uint256[]', 'uint256[2]'],
+        )
+    )
+    assert output['nonce'].to_list() == target
+
+
+def test_keccak_encoded_literal() -> None:
+    df = pl.DataFrame({'token': [owner, b'\x01' * 20, b'\x02']})
+    output = df.select(
+        pl.col.token.evm.keccak_encoded(pl.lit(-1), types=['address', 'int256'])
+    )
+    assert output['token'].to_list() == [
+        keccak(word(int.from_bytes(owner, 'big')) + word(-1)),
+        keccak(word(int.from_bytes(b'\x01' * 20, 'big')) + word(-1)),
+        None,
+    ]
+
+
+@pytest.mark.parametrize(
+    ('types', 'message'),
+    [
+        (['address'], 'one abi type per column'),
+        (['address', 'string[]'], 'static elements'),
+        (['address', 'uint7'], 'invalid mapping key type'),
+    ],
+)
+def test_keccak_packed_invalid_types(types: list[str], message: str) -> None:
+    with pytest.raises(Exception, match=message):
+        pl.col.a.evm.keccak_packed(pl.col.b, types=types)
@@ -610,3 +610,28 @@ def test_abi_decoding(test: tuple[str, typing.Any, str]) -> None:
 
     actual_output = decode_value(raw_bytes, abi_type)
     assert actual_output == target_output
+
+
+@pytest.mark.parametrize('test', decoding_tests)
+def test_abi_decoding_binary(test: tuple[str, typing.Any, str]) -> None:
+    abi_type, target_output, raw_bytes = test
+
+    try:
+        hex_output = decode_value(raw_bytes, abi_type)
+    except NotImplementedError:
+        pytest.skip('not implemented for hex decoding')
+
+    if raw_bytes.startswith('0x'):
+        binary = bytes.fromhex(raw_bytes[2:])
+    else:
+        binary = bytes.fromhex(raw_bytes)
+    df = pl.DataFrame({'as_binary': pl.Series([binary], dtype=pl.Binary)})
+    output = df.evm.decode({'as_binary': abi_type})['as_binary_decoded']
+    binary_output = output.to_list()[0]
+    parsed_abi_type = polars_evm._helpers.decoding_types.parse_abi_type(
+        abi_type
+    )
+    if parsed_abi_type['tuple_types'] is not None:
+        binary_output = _flatten(parsed_abi_type, binary_output)
+
+    assert binary_output == hex_output
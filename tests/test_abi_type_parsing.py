@@ -145,3 +145,9 @@ def test_abi_type_parsing(abi_type_test: tuple[str, AbiType]) -> None:
     abi_type, target_parsed = abi_type_test
     actual_parsed = parse_abi_type(abi_type)
     assert target_parsed == actual_parsed
+
+
+def test_abi_type_parsing_is_memoized() -> None:
+    parsed = parse_abi_type('(uint256,address[])[2]')
+    assert parse_abi_type('(uint256,address[])[2]') is parsed
+    assert parsed['array_type'] is parse_abi_type('(uint256,address[])')
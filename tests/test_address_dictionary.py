@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+import polars as pl
+import polars_evm
+
+
+addresses = [bytes([i]) * 20 for i in range(1, 6)]
+
+
+def test_extend_keeps_ids() -> None:
+    dictionary = polars_evm.AddressDictionary(pl.Series(addresses[:3]))
+    assert dictionary.table['id'].to_list() == [0, 1, 2]
+
+    extension = pl.Series([addresses[4], addresses[1], None, addresses[3]])
+    dictionary.extend(extension)
+    assert len(dictionary) == 5
+    assert dictionary.table['address'].to_list() == [
+        addresses[0],
+        addresses[1],
+        addresses[2],
+        addresses[4],
+        addresses[3],
+    ]
+
+    hexes = pl.Series(['0x' + address.hex() for address in addresses])
+    dictionary.extend(hexes)
+    assert len(dictionary) == 5
+
+    with pytest.raises(Exception, match='must be 20 bytes'):
+        dictionary.extend(pl.Series([b'\x01' * 32]))
+
+
+def test_intern_and_resolve() -> None:
+    dictionary = polars_evm.AddressDictionary(pl.Series(addresses[:3]))
+    values = [addresses[2], None, addresses[4], addresses[0]]
+    df = pl.DataFrame({'address': values})
+
+    ids = df.select(pl.col.address.evm.intern_addresses(dictionary))
+    assert ids['address'].dtype == pl.UInt32
+    assert ids['address'].to_list() == [2, None, None, 0]
+    resolved = ids.select(pl.col.address.evm.resolve_ids(dictionary))
+    assert resolved['address'].to_list() == [
+        addresses[2],
+        None,
+        None,
+        addresses[0],
+    ]
+
+    series_ids = df['address'].evm.intern_addresses(dictionary, extend=True)
+    assert series_ids.to_list() == [2, None, 3, 0]
+    assert series_ids.evm.resolve_ids(dictionary).to_list() == values
+
+
+def test_exprs_read_extended_dictionary() -> None:
+    dictionary = polars_evm.AddressDictionary()
+    interned = pl.col.address.evm.intern_addresses(dictionary)
+    resolved = pl.col.address.evm.resolve_ids(dictionary)
+    df = pl.DataFrame({'address': addresses[:2] + [None]})
+    ids = df.lazy().select(interned)
+
+    dictionary.extend(pl.Series(addresses[1:3]))
+    assert ids.collect()['address'].to_list() == [None, 0, None]
+    output = ids.select(resolved).collect()
+    assert output['address'].to_list() == [None, addresses[1], None]
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.arrow'])
+def test_persist(tmp_path: pathlib.Path, suffix: str) -> None:
+    dictionary = polars_evm.AddressDictionary(pl.Series(addresses[::-1]))
+    path = str(tmp_path / ('addresses' + suffix))
+    dictionary.write(path)
+
+    loaded = polars_evm.AddressDictionary.read(path)
+    assert loaded.table.equals(dictionary.table)
+    loaded.extend(pl.Series([bytes(20)]))
+    assert loaded.table['id'].to_list() == [0, 1, 2, 3, 4, 5]
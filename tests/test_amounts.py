@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import decimal
+
+import pytest
+import polars as pl
+import polars_evm  # noqa: F401
+
+
+amounts = [0, 1, -1, 10**18, 123456789, -(10**37), 9 * 10**37, 2**127 - 1]
+decimals = [18, 6, 0, 18, 3, 18, 18, 0]
+
+
+def _target(
+    values: list[int], n_decimals: list[int]
+) -> list[decimal.Decimal | None]:
+    target: list[decimal.Decimal | None] = []
+    for value, n in zip(values, n_decimals):
+        units = value * 10 ** (18 - n)
+        if abs(units) < 10**38:
+            target.append(decimal.Decimal(units).scaleb(-18))
+        else:
+            target.append(None)
+    return target
+
+
+@pytest.mark.parametrize('dtype', ['int', 'str', 'binary'])
+def test_scale_amount(dtype: str) -> None:
+    if dtype == 'int':
+        series = pl.Series('amount', amounts, dtype=pl.Int128)
+    elif dtype == 'str':
+        series = pl.Series('amount', [str(value) for value in amounts])
+    else:
+        series = pl.Series(
+            'amount',
+            [(value % 2**256).to_bytes(32, 'big') for value in amounts],
+        )
+    target = _target(amounts, decimals)
+
+    output = series.evm.scale_amount(pl.Series(decimals), signed=True)
+    assert output.dtype == pl.Decimal(38, 18)
+    assert output.to_list() == target
+
+    df = pl.DataFrame({'amount': series, 'decimals': decimals})
+    output = df.select(
+        pl.col.amount.evm.scale_amount(pl.col.decimals, signed=True)
+    )
+    assert output['amount'].to_list() == target
+
+    output = series.evm.scale_amount(
+        pl.Series(decimals), signed=True, output='float'
+    )
+    assert output.to_list() == pytest.approx(
+        [value / 10**n for value, n in zip(amounts, decimals)]
+    )
+
+
+def test_normalize_amounts() -> None:
+    tokens = [b'\x01' * 20, b'\x02' * 20, b'\x03' * 20]
+    table = pl.DataFrame({'address': tokens[:2], 'decimals': [6, 18]})
+    df = pl.DataFrame(
+        {
+            'value': [10**6, 10**18, 5, 7],
+            'token': [tokens[0], tokens[1], tokens[2], tokens[0]],
+        }
+    )
+    target = [
+        decimal.Decimal(1),
+        decimal.Decimal(1),
+        None,
+        decimal.Decimal('7e-6'),
+    ]
+    output = df.evm.normalize_amounts({'value': 'token'}, table)
+    assert output.columns == ['value', 'token', 'value_normalized']
+    assert output['value_normalized'].to_list() == target
+
+    lazy_output = (
+        df.lazy()
+        .evm.normalize_amounts({'value': 'token'}, table, replace=True)
+        .collect()
+    )
+    assert lazy_output['value'].to_list() == target
+
+
+@pytest.mark.parametrize('abi_type', ['fixed128x18', 'ufixed256x10'])
+def test_decode_fixed_exact(abi_type: str) -> None:
+    scale = int(abi_type.rsplit('x', maxsplit=1)[1])
+    signed = not abi_type.startswith('u')
+    values = [0, 15 * 10**17, 10**30] + ([-25 * 10**16] if signed else [])
+    words = [(value % 2**256).to_bytes(32, 'big') for value in values]
+    df = pl.DataFrame({'binary': words}).with_columns(
+        hex=pl.col.binary.evm.binary_to_hex()
+    )
+    target = [decimal.Decimal(value).scaleb(-scale) for value in values]
+    for int_output in ['exact', 'decimal_str']:
+        decoded = df.evm.decode(
+            {'binary': abi_type, 'hex': abi_type}, int_output=int_output
+        )
+        for column in ['binary_decoded', 'hex_decoded']:
+            output = [decimal.Decimal(value) for value in decoded[column]]
+            assert output == target
+
+
+@pytest.mark.parametrize(
+    'abi_type', ['ufixed256x18', 'fixed256x80', 'fixed256x2', 'ufixed8x0']
+)
+def test_decode_fixed_decimal_str_wide(abi_type: str) -> None:
+    scale = int(abi_type.rsplit('x', maxsplit=1)[1])
+    n_bits = int(abi_type.split('fixed')[1].split('x')[0])
+    signed = not abi_type.startswith('u')
+    values = [0, 5, 2 ** (n_bits - 1) - 1]
+    if signed:
+        values += [-1, -(2 ** (n_bits - 1))]
+    words = [(value % 2**256).to_bytes(32, 'big') for value in values]
+    df = pl.DataFrame({'binary': words}).with_columns(
+        hex=pl.col.binary.evm.binary_to_hex()
+    )
+    decoded = df.evm.decode(
+        {'binary': abi_type, 'hex': abi_type}, int_output='decimal_str'
+    )
+    with decimal.localcontext() as context:
+        context.prec = 200
+        target = [
+            str(decimal.Decimal(value).scaleb(-scale)) for value in values
+        ]
+    for column in ['binary_decoded', 'hex_decoded']:
+        output = [str(decimal.Decimal(value)) for value in decoded[column]]
+        assert output == target
+
+
+def test_decode_fixed_exact_large_scale() -> None:
+    df = pl.DataFrame({'binary': [(1).to_bytes(32, 'big')]})
+    with pytest.raises(Exception, match='scales up to 38'):
+        df.evm.decode({'binary': 'ufixed128x80'}, int_output='exact')
@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import fractions
+
+import pytest
+import polars as pl
+import polars_evm  # noqa: F401
+from polars_evm._helpers.limbs import limbs_to_int
+
+
+int_values = {
+    'u64': [0, 1, 2**64 - 1],
+    'u72': [0, 1, 2**72 - 1, 2**64 + 5],
+    'u128': [0, 1, 2**127, 2**128 - 1],
+    'u160': [0, 1, 2**160 - 1],
+    'u256': [0, 1, 2**53 + 1, 2**255, 2**256 - 1],
+    'i64': [0, -1, 2**63 - 1, -(2**63)],
+    'i72': [0, -1, 2**71 - 1, -(2**71)],
+    'i128': [0, -1, 2**127 - 1, -(2**127)],
+    'i256': [0, -1, 2**255 - 1, -(2**255)],
+}
+
+
+def _to_bytes(value: int, raw_type: str) -> bytes:
+    n_bytes = int(raw_type[1:]) // 8
+    return value.to_bytes(n_bytes, 'big', signed=raw_type.startswith('i'))
+
+
+@pytest.mark.parametrize('raw_type', list(int_values.keys()))
+def test_binary_to_int(raw_type: str) -> None:
+    values = int_values[raw_type]
+    series = pl.Series([_to_bytes(value, raw_type) for value in values])
+    output = series.evm.binary_to_int(raw_type).to_list()
+    if int(raw_type[1:]) > 128:
+        signed = raw_type.startswith('i')
+        output = [int.from_bytes(item, 'big', signed=signed) for item in output]
+    assert output == values
+
+
+@pytest.mark.parametrize('raw_type', ['u128', 'i128', 'u256', 'i256'])
+def test_decode_exact_ints(raw_type: str) -> None:
+    abi_type = {'u': 'uint', 'i': 'int'}[raw_type[0]] + raw_type[1:]
+    values = int_values[raw_type]
+    words = [value.to_bytes(32, 'big', signed=value < 0) for value in values]
+    df = pl.DataFrame({'binary': words}).with_columns(
+        hex=pl.col.binary.evm.binary_to_hex()
+    )
+    decoded = df.evm.decode(
+        {'binary': abi_type, 'hex': abi_type}, int_output='exact'
+    )
+    assert (
+        decoded['binary_decoded'].to_list() == decoded['hex_decoded'].to_list()
+    )
+    if raw_type in ('u128', 'i128'):
+        assert decoded['binary_decoded'].to_list() == values
+    else:
+        assert decoded['binary_decoded'].to_list() == words
+
+
+@pytest.mark.parametrize('raw_type', ['u64', 'i64', 'u128', 'u256', 'i256'])
+def test_binary_to_float_numpy(raw_type: str) -> None:
+    values = int_values[raw_type] * 3
+    binary = [_to_bytes(value, raw_type) for value in values]
+    series = pl.Series('value', binary + [None, b'\x01'])
+    target = series.evm.binary_to_float(raw_type)
+    assert series.evm.binary_to_float(raw_type, method='numpy').equals(target)
+
+    # shuffled rows are not stored contiguously
+    shuffled = series.sample(fraction=1.0, shuffle=True, seed=0)
+    target = shuffled.evm.binary_to_float(raw_type)
+    assert shuffled.evm.binary_to_float(raw_type, method='numpy').equals(target)
+
+    lf = pl.LazyFrame({'a': series, 'b': series})
+    output = lf.evm.binary_to_float({'a': raw_type, 'b': raw_type}).collect()
+    numpy_output = lf.evm.binary_to_float(
+        {'a': raw_type, 'b': raw_type}, method='numpy'
+    ).collect()
+    assert output.equals(numpy_output)
+
+
+limb_values = [0, 1, 5, 2**64, 2**128 + 7, 2**255 - 1, 2**255, 2**256 - 1]
+
+
+def _limbs_frame(values: list[int | None]) -> pl.DataFrame:
+    words = [None if v is None else v.to_bytes(32, 'big') for v in values]
+    return pl.DataFrame({'a': words}).select(pl.col.a.evm.binary_to_limbs())
+
+
+def _limbs_output(series: pl.Series, signed: bool = False) -> list[int | None]:
+    return [
+        None if item is None else limbs_to_int(item, signed=signed)
+        for item in series.to_list()
+    ]
+
+
+@pytest.mark.parametrize('other', [0, 1, 2**64 - 1, 2**200, 2**256 - 1])
+def test_limbs_arithmetic(other: int) -> None:
+    df = _limbs_frame(limb_values + [None])
+    output = df.select(
+        add=pl.col.a.evm.limbs_add(other),
+        sub=pl.col.a.evm.limbs_sub(other),
+        neg=pl.col.a.evm.limbs_neg(),
+        gt=pl.col.a.evm.limbs_gt(other),
+        le=pl.col.a.evm.limbs_le(other),
+        eq=pl.col.a.evm.limbs_eq(other),
+    )
+    m = 2**256
+    assert _limbs_output(output['add']) == [
+        (v + other) % m for v in limb_values
+    ] + [None]
+    assert _limbs_output(output['sub']) == [
+        (v - other) % m for v in limb_values
+    ] + [None]
+    assert _limbs_output(output['neg']) == [-v % m for v in limb_values] + [
+        None
+    ]
+    assert output['gt'].to_list() == [v > other for v in limb_values] + [None]
+    assert output['le'].to_list() == [v <= other for v in limb_values] + [None]
+    assert output['eq'].to_list() == [v == other for v in limb_values] + [None]
+
+
+@pytest.mark.parametrize('scalar', [1, 3, -3, 2**64 - 1])
+def test_limbs_mul_div(scalar: int) -> None:
+    df = _limbs_frame(limb_values)
+    output = df.select(
+        mul=pl.col.a.evm.limbs_mul(scalar),
+        div=pl.col.a.evm.limbs_div(scalar, signed=True),
+    )
+    m = 2**256
+    signed_values = [v - m if v >= 2**255 else v for v in limb_values]
+    assert _limbs_output(output['mul']) == [
+        (v * scalar) % m for v in limb_values
+    ]
+    assert _limbs_output(output['div'], signed=True) == [
+        abs(v) // abs(scalar) * (1 if (v < 0) == (scalar < 0) else -1)
+        for v in signed_values
+    ]
+
+
+def test_limbs_div_signed_expr() -> None:
+    values = [-(2**255), -7, -7, 7, None]
+    df = _limbs_frame([None if v is None else v % 2**256 for v in values])
+    df = df.with_columns(d=pl.Series([1, 0, 2, 2, 2], dtype=pl.UInt64))
+    output = df.select(pl.col.a.evm.limbs_div(pl.col.d, signed=True))
+    assert _limbs_output(output['a'], signed=True) == [
+        -(2**255),
+        None,
+        -3,
+        3,
+        None,
+    ]
+
+
+@pytest.mark.parametrize('signed', [False, True])
+def test_limbs_sort_and_roundtrip(signed: bool) -> None:
+    df = _limbs_frame(limb_values[::-1] + [None])
+    output = df.sort(pl.col.a.evm.limbs_sort_key(signed=signed))
+    target = [v - 2**256 if signed and v >= 2**255 else v for v in limb_values]
+    assert _limbs_output(output['a'], signed=signed) == [None] + sorted(target)
+
+    binary = df['a'].evm.limbs_to_binary()
+    assert binary.evm.binary_to_limbs().equals(df['a'])
+
+
+@pytest.mark.parametrize('signed', [False, True])
+def test_u256_aggregations(signed: bool) -> None:
+    if signed:
+        values = [2**255 - 1, -5, -(2**255), 2**200, -(2**200), 3, 2**255 - 1]
+    else:
+        values = [2**256 - 1, 5, 2**255, 2**200, 1, 3, 2**64 - 1]
+    groups = [0, 0, 1, 1, 1, 2, 2]
+    words = [value.to_bytes(32, 'big', signed=signed) for value in values]
+    df = pl.DataFrame({'group': groups, 'value': words})
+
+    def _fits(value: int) -> int | None:
+        if signed:
+            return value if -(2**255) <= value < 2**255 else None
+        else:
+            return value if 0 <= value < 2**256 else None
+
+    def _to_int(word: bytes | None) -> int | None:
+        if word is None:
+            return None
+        return int.from_bytes(word, 'big', signed=signed)
+
+    value = pl.col.value
+    output = df.group_by('group', maintain_order=True).agg(
+        sum=value.evm.u256_sum(signed=signed),
+        wrapped=value.evm.u256_sum(signed=signed, overflow='wrap'),
+    )
+    over = df.select(
+        cum_sum=value.evm.u256_cum_sum(signed=signed).over('group'),
+        diff=value.evm.u256_diff(signed=signed).over('group'),
+    )
+    for group in range(3):
+        group_values = [v for g, v in zip(groups, values) if g == group]
+        total = sum(group_values)
+        assert _to_int(output['sum'][group]) == _fits(total)
+        wrapped = _to_int(output['wrapped'][group])
+        assert wrapped is not None and (wrapped - total) % 2**256 == 0
+
+    cum_sums = []
+    diffs = []
+    for i, (group, v) in enumerate(zip(groups, values)):
+        previous = [pv for g, pv in zip(groups[:i], values[:i]) if g == group]
+        cum_sums.append(_fits(sum(previous) + v))
+        diffs.append(_fits(v - previous[-1]) if previous else None)
+    assert [_to_int(item) for item in over['cum_sum']] == cum_sums
+    assert [_to_int(item) for item in over['diff']] == diffs
+
+    # limb columns give the same results
+    limbs = df.with_columns(value.evm.binary_to_limbs())
+    limbs_output = limbs.group_by('group', maintain_order=True).agg(
+        sum=value.evm.limbs_sum(signed=signed)
+    )
+    assert limbs_output['sum'].evm.limbs_to_binary().equals(output['sum'])
+
+
+decimal_values = [0, 1, 10**19, 2**128 - 1, 2**128, 10**57, 2**255, 2**256 - 1]
+
+
+@pytest.mark.parametrize('signed', [False, True])
+def test_binary_to_decimal_str(signed: bool) -> None:
+    words = [value.to_bytes(32, 'big') for value in decimal_values]
+    series = pl.Series('value', words + [None, b'\x01'])
+    target = [str(int.from_bytes(word, 'big', signed=signed)) for word in words]
+    output = series.evm.binary_to_decimal_str(signed=signed)
+    assert output.to_list() == target + [None, None]
+
+    df = pl.DataFrame({'value': series})
+    output = df.select(pl.col.value.evm.binary_to_decimal_str(signed=signed))
+    assert output['value'].to_list() == target + [None, None]
+
+
+@pytest.mark.parametrize('raw_type', ['u64', 'u128', 'i128', 'u256', 'i256'])
+def test_decode_decimal_str(raw_type: str) -> None:
+    abi_type = {'u': 'uint', 'i': 'int'}[raw_type[0]] + raw_type[1:]
+    values = int_values[raw_type]
+    words = [value.to_bytes(32, 'big', signed=value < 0) for value in values]
+    df = pl.DataFrame({'binary': words}).with_columns(
+        hex=pl.col.binary.evm.binary_to_hex()
+    )
+    decoded = df.evm.decode(
+        {'binary': abi_type, 'hex': abi_type}, int_output='decimal_str'
+    )
+    if raw_type == 'u64':
+        assert decoded['binary_decoded'].to_list() == values
+    else:
+        target = [str(value) for value in values]
+        assert decoded['binary_decoded'].to_list() == target
+        assert decoded['hex_decoded'].to_list() == target
+
+
+def _word_target(
+    values: list[int], n_bits: int, signed: bool
+) -> list[bytes | None]:
+    lower = -(2 ** (n_bits - 1)) if signed else 0
+    upper = 2 ** (n_bits - 1) if signed else 2**n_bits
+    return [
+        (value % 2**256).to_bytes(32, 'big') if lower <= value < upper else None
+        for value in values
+    ]
+
+
+@pytest.mark.parametrize('n_bits', [8, 64, 128, 160, 256])
+@pytest.mark.parametrize('signed', [False, True])
+def test_values_to_word(n_bits: int, signed: bool) -> None:
+    bounds = [2 ** (n_bits - 1), 2**n_bits]
+    values = decimal_values + [-1, -(2**127), -(2**255)]
+    values += [bound + delta for bound in bounds for delta in (-1, 0)]
+    values += [-bound for bound in bounds]
+
+    strings = pl.Series([str(value) for value in values] + ['0x1', None])
+    output = strings.evm.decimal_str_to_word(n_bits, signed)
+    assert output.to_list() == _word_target(values, n_bits, signed) + [
+        None,
+        None,
+    ]
+
+    ints = [value for value in values if -(2**127) <= value < 2**127]
+    df = pl.DataFrame({'value': ints}, schema={'value': pl.Int128})
+    output = df.select(pl.col.value.evm.int_to_word(n_bits, signed))
+    assert output['value'].to_list() == _word_target(ints, n_bits, signed)
+
+    floats = [float(value) for value in values]
+    output = pl.Series(floats + [0.5, -1.5, float('nan')]).evm.float_to_word(
+        n_bits, signed, hex_output=True
+    )
+    target = _word_target([int(value) for value in floats], n_bits, signed)
+    target += _word_target([0, -1], n_bits, signed) + [None]
+    assert output.to_list() == [
+        None if word is None else '0x' + word.hex() for word in target
+    ]
+
+
+q_values = [0, 1, 2**96, 3 * 2**95 + 1, 2**159 + 12345, 2**160 - 1]
+
+
+@pytest.mark.parametrize('squared', [False, True])
+@pytest.mark.parametrize('padded', [False, True])
+def test_q_to_float(squared: bool, padded: bool) -> None:
+    n_bytes = 32 if padded else 20
+    words = [value.to_bytes(n_bytes, 'big') for value in q_values]
+    df = pl.DataFrame({'price': words + [None, b'\x01']})
+    output = df.select(
+        pl.col.price.evm.q_to_float(64, 96, squared=squared),
+        fraction=pl.col.price.evm.q_to_fraction(64, 96, squared=squared),
+    )
+
+    power = 2 if squared else 1
+    targets = [
+        fractions.Fraction(value**power, 2 ** (96 * power))
+        for value in q_values
+    ]
+    assert output['price'].to_list() == [
+        float(target) for target in targets
+    ] + [None, None]
+    fraction_output = [
+        None
+        if row is None
+        else fractions.Fraction(
+            int.from_bytes(row['numerator'], 'big'),
+            2 ** row['denominator_bits'],
+        )
+        for row in output['fraction'].to_list()
+    ]
+    assert fraction_output == targets + [None, None]
+
+
+@pytest.mark.parametrize('value', [-1, -(2**127), 2**127 - 1, -12345])
+def test_q_to_float_signed(value: int) -> None:
+    series = pl.Series([(value % 2**256).to_bytes(32, 'big')])
+    target = fractions.Fraction(value, 2**128)
+    output = series.evm.q_to_float(128, 128, signed=True)
+    assert output.to_list() == [float(target)]
+    row = series.evm.q_to_fraction(128, 128, signed=True).to_list()[0]
+    numerator = int.from_bytes(row['numerator'], 'big', signed=True)
+    assert fractions.Fraction(numerator, 2**128) == target
+
+
+quantities = [0, 1, 0x1A4, 2**63, 2**64 - 1, 2**64, 2**128 - 1, 2**256 - 1]
+
+
+@pytest.mark.parametrize('dtype', [pl.UInt32, pl.Int64, pl.UInt64, pl.UInt128])
+def test_hex_quantity_to_int(dtype: type[pl.DataType]) -> None:
+    maximum = {pl.UInt32: 2**32, pl.Int64: 2**63, pl.UInt64: 2**64}.get(
+        dtype, 2**128
+    )
+    invalid = ['0x', '0xzz', '0x-1', '0x+1', '1a4', '0x 1']
+    series = pl.Series([hex(value) for value in quantities] + invalid)
+    output = series.evm.hex_quantity_to_int(dtype)
+    assert output.dtype == dtype
+    target = [value if value < maximum else None for value in quantities]
+    assert output.to_list() == target + [None] * len(invalid)
+
+
+def test_hex_quantity_to_word() -> None:
+    invalid = ['0x1' + '0' * 64, '0x', '0x-1', '0x+1', '1a4']
+    hexes = [hex(value) for value in quantities] + invalid
+    df = pl.DataFrame({'quantity': hexes})
+    output = df.select(pl.col.quantity.evm.hex_quantity_to_word())
+    target = [value.to_bytes(32, 'big') for value in quantities]
+    assert output['quantity'].to_list() == target + [None] * len(invalid)
+
+
+@pytest.mark.parametrize('width', [20, 32])
+def test_to_fixed_roundtrip(width: int) -> None:
+    values = [bytes(range(width)), b'\xff' * width, b'\x01' * (width - 1), None]
+    series = pl.Series('value', values)
+    fixed = series.evm.to_fixed(width)
+    assert fixed.dtype == pl.Array(pl.UInt8, width)
+    assert fixed.to_numpy()[:2].tolist() == [list(v) for v in values[:2]]
+    target = values[:2] + [None, None]
+    assert fixed.evm.from_fixed().to_list() == target
+
+
+@pytest.mark.parametrize('abi_type', ['address', 'bytes32', 'bytes4'])
+def test_decode_fixed_output(abi_type: str) -> None:
+    n_bytes = 20 if abi_type == 'address' else int(abi_type[5:])
+    values = [bytes(range(n_bytes)), b'\xab' * n_bytes]
+    if abi_type == 'address':
+        words = [b'\x00' * (32 - n_bytes) + value for value in values]
+    else:
+        words = [value + b'\x00' * (32 - n_bytes) for value in values]
+    df = pl.DataFrame({'binary': words}).with_columns(
+        hex=pl.col.binary.evm.binary_to_hex()
+    )
+    decoded = df.evm.decode(
+        {'binary': abi_type, 'hex': abi_type}, fixed_output=True
+    )
+    for column in ['binary_decoded', 'hex_decoded']:
+        assert decoded[column].dtype == pl.Array(pl.UInt8, n_bytes)
+        assert decoded[column].evm.from_fixed().to_list() == values
+
+
+@pytest.mark.parametrize('width', [4, 20, 32])
+def test_numpy_words_roundtrip(width: int) -> None:
+    import numpy as np
+
+    words = np.arange(100 * width, dtype=np.uint64).reshape(-1, width)
+    words = (words * 7 % 256).astype(np.uint8)
+    series = pl.Series.evm.from_numpy_words(words, name='value')
+    assert series.dtype == pl.Binary
+    assert series.to_list() == [bytes(row) for row in words]
+
+    # round trip through hex and from a filtered series
+    hexes = series.evm.binary_to_hex().evm.hex_to_binary()
+    assert (hexes.evm.to_numpy_words(width) == words).all()
+    filtered = series.filter(pl.Series(np.arange(100) % 3 == 0))
+    assert (filtered.evm.to_numpy_words(width) == words[::3]).all()
+
+    with pytest.raises(Exception, match='null or not'):
+        series.evm.to_numpy_words(width + 1)
+    with pytest.raises(Exception, match='1 values are null'):
+        series.scatter(0, None).evm.to_numpy_words(width)
+
+
+checksum_addresses = [
+    '0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed',
+    '0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359',
+    '0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB',
+    '0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb',
+    '0x52908400098527886E0F7030069857D2E4169EE7',
+    '0xde709f2102306220921060314715629080e2fb77',
+]
+
+
+@pytest.mark.parametrize('prefix', [True, False])
+def test_binary_to_hex_checksum(prefix: bool) -> None:
+    values = [bytes.fromhex(address[2:]) for address in checksum_addresses]
+    series = pl.Series('address', values + [None, b'\xab' * 32])
+    target = checksum_addresses + [None, '0x' + 'ab' * 32]
+    if not prefix:
+        target = [value and value[2:] for value in target]
+
+    output = series.evm.binary_to_hex(prefix=prefix, checksum=True)
+    assert output.to_list() == target
+    df = (
+        series.to_frame().lazy().evm.binary_to_hex(prefix=prefix, checksum=True)
+    )
+    assert df.collect()['address'].to_list() == target
+
+
+def test_decode_checksum() -> None:
+    words = [
+        bytes(12) + bytes.fromhex(address[2:]) for address in checksum_addresses
+    ]
+    df = pl.DataFrame({'binary': words}).with_columns(
+        hex=pl.col.binary.evm.binary_to_hex()
+    )
+    decoded = df.evm.decode(
+        {'binary': 'address', 'hex': 'address'}, hex_output=True, checksum=True
+    )
+    assert decoded['binary_decoded'].to_list() == checksum_addresses
+    assert decoded['hex_decoded'].to_list() == checksum_addresses
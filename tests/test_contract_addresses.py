@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import pytest
+import polars as pl
+import polars_evm  # noqa: F401
+from polars_evm._helpers import keccak
+
+
+deployer = bytes.fromhex('6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0')
+
+
+def rlp_nonce(nonce: int) -> bytes:
+    if nonce == 0:
+        return b'\x80'
+    elif nonce < 0x80:
+        return bytes([nonce])
+    else:
+        raw = nonce.to_bytes((nonce.bit_length() + 7) // 8, 'big')
+        return bytes([0x80 + len(raw)]) + raw
+
+
+def create_address(sender: bytes, nonce: int) -> bytes:
+    payload = b'\x94' + sender + rlp_nonce(nonce)
+    preimage = bytes([0xC0 + len(payload)]) + payload
+    return keccak(preimage, output='binary')[12:]
+
+
+def test_create_address() -> None:
+    nonces = [0, 1, 127, 128, 255, 256, 2**32, 2**64 - 1]
+    target = [create_address(deployer, nonce) for nonce in nonces]
+    assert target[0].hex() == 'cd234a471b72ba2f1ccf0a70fcaba648a5eecd8d'
+
+    df = pl.DataFrame(
+        {
+            'deployer': [deployer] * len(nonces) + [deployer, b'\x01'],
+            'nonce': pl.Series(nonces + [None, 1], dtype=pl.UInt64),
+        }
+    )
+    output = df.select(pl.col.deployer.evm.create_address(pl.col.nonce))
+    assert output['deployer'].to_list() == target + [None, None]
+
+    series = df['deployer'].evm.create_address(5)
+    assert series[0] == create_address(deployer, 5)
+
+
+@pytest.mark.parametrize(
+    'deployer,salt,init_code,target',
+    [
+        # examples from EIP-1014
+        (
+            '00' * 20,
+            '00' * 32,
+            '00',
+            '4d1a2e2bb4f88f0250f26ffff098b0b30b26bf38',
+        ),
+        (
+            'deadbeef00000000000000000000000000000000',
+            '00' * 32,
+            '00',
+            'b928f69bb1d91cd65274e3c79d8986362984fda3',
+        ),
+        (
+            '00000000000000000000000000000000deadbeef',
+            '00000000000000000000000000000000000000000000000000000000cafebabe',
+            'deadbeef',
+            '60f3f640a8508fc6a86d45df051962668e1e8ac7',
+        ),
+    ],
+)
+def test_create2_address(
+    deployer: str, salt: str, init_code: str, target: str
+) -> None:
+    init_code_hash = keccak(bytes.fromhex(init_code), output='binary')
+    series = pl.Series('deployer', [bytes.fromhex(deployer)])
+    output = series.evm.create2_address('0x' + salt, init_code_hash)
+    assert output.to_list() == [bytes.fromhex(target)]
+
+    df = series.to_frame().with_columns(salt=pl.lit(bytes.fromhex(salt)))
+    output = df.select(
+        pl.col.deployer.evm.create2_address(pl.col.salt, init_code_hash)
+    )
+    assert output['deployer'].to_list() == [bytes.fromhex(target)]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import typing
+
+import pytest
+import polars as pl
+import polars_evm  # noqa: F401
+from polars_evm._helpers import keccak
+
+
+def hash_bytes(data: bytes) -> bytes:
+    return typing.cast(bytes, keccak(data, output='binary'))
+
+
+# example from EIP-712
+mail_types = {
+    'Person': [
+        {'name': 'name', 'type': 'string'},
+        {'name': 'wallet', 'type': 'address'},
+    ],
+    'Mail': [
+        {'name': 'from', 'type': 'Person'},
+        {'name': 'to', 'type': 'Person'},
+        {'name': 'contents', 'type': 'string'},
+    ],
+}
+domain = {
+    'name': 'Ether Mail',
+    'version': '1',
+    'chainId': 1,
+    'verifyingContract': '0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC',
+}
+mail = {
+    'from': {
+        'name': 'Cow',
+        'wallet': '0xCD2a3d9F938E13CD947Ec05AbC7FE734Df8DD826',
+    },
+    'to': {
+        'name': 'Bob',
+        'wallet': '0xbBbBBBBbbBBBbbbBbbBbbbbBBbBbbbbBbBbbBBbB',
+    },
+    'contents': 'Hello, Bob!',
+}
+
+
+@pytest.mark.parametrize(
+    'use_domain,target',
+    [
+        (
+            False,
+            'c52c0ee5d84264471806290a3f2c4cecfc5490626bf912d01f240d7a274b371e',
+        ),
+        (
+            True,
+            'be609aee343fb3c4b28e1df9e632fca64fcfaede20f02e86244efddf30957bd2',
+        ),
+    ],
+)
+def test_eip712_hash(use_domain: bool, target: str) -> None:
+    series = pl.Series('mail', [mail, None, mail])
+    hash_domain = domain if use_domain else None
+    output = series.evm.eip712_hash(mail_types, hash_domain)
+    digest = bytes.fromhex(target)
+    assert output.to_list() == [digest, None, digest]
+
+    df = series.to_frame().lazy()
+    output = df.select(pl.col.mail.evm.eip712_hash(mail_types, hash_domain))
+    assert output.collect()['mail'][0] == digest
+
+
+def test_eip712_arrays() -> None:
+    types = {
+        'Order': [
+            {'name': 'maker', 'type': 'address'},
+            {'name': 'amounts', 'type': 'uint256[]'},
+            {'name': 'tags', 'type': 'string[2]'},
+            {'name': 'data', 'type': 'bytes'},
+            {'name': 'flag', 'type': 'bool'},
+        ],
+    }
+    maker = bytes(range(20))
+    rows = [
+        {
+            'maker': maker,
+            'amounts': [1, 2**40],
+            'tags': ['a', 'b'],
+            'data': b'\x01\x02',
+            'flag': True,
+        },
+        {
+            'maker': maker,
+            'amounts': [],
+            'tags': ['', 'c'],
+            'data': b'',
+            'flag': False,
+        },
+    ]
+
+    def word(value: int) -> bytes:
+        return value.to_bytes(32, 'big')
+
+    type_hash = hash_bytes(
+        b'Order(address maker,uint256[] amounts,string[2] tags,bytes data,'
+        b'bool flag)'
+    )
+    target = [
+        hash_bytes(
+            type_hash
+            + bytes(12)
+            + row['maker']
+            + hash_bytes(b''.join(word(value) for value in row['amounts']))
+            + hash_bytes(
+                b''.join(hash_bytes(tag.encode()) for tag in row['tags'])
+            )
+            + hash_bytes(row['data'])
+            + word(int(row['flag']))
+        )
+        for row in rows
+    ]
+    series = pl.Series('order', rows)
+    assert series.evm.eip712_hash(types).to_list() == target
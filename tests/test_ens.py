@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import polars as pl
+import polars_evm  # noqa: F401
+from polars_evm._helpers import keccak
+
+
+def namehash(name: str) -> bytes:
+    node = bytes(32)
+    if name != '':
+        for label in reversed(name.split('.')):
+            label_hash = keccak(label, output='binary', text=True)
+            node = keccak(node + label_hash, output='binary')
+    return node
+
+
+names = [
+    '',
+    'eth',
+    'foo.eth',
+    'vitalik.eth',
+    'a.b.c.d.eth',
+    'ünï.eth',
+    'foo.eth',
+]
+
+
+def test_namehash() -> None:
+    target = [namehash(name) for name in names]
+    assert target[2].hex() == (
+        'de9b09fd7c5f901e23a3f19fecc54828e9c848539801e86591bd9801b019f84f'
+    )
+    series = pl.Series('name', names + [None])
+    assert series.evm.namehash().to_list() == target + [None]
+
+    df = pl.LazyFrame({'name': names}).select(pl.col.name.evm.namehash())
+    assert df.collect()['name'].to_list() == target
+
+
+def test_labelhash() -> None:
+    labels = ['eth', 'vitalik', '']
+    target = [keccak(label, output='binary', text=True) for label in labels]
+    series = pl.Series('label', labels)
+    assert series.evm.labelhash().to_list() == target
+    df = series.to_frame().select(pl.col.label.evm.labelhash())
+    assert df['label'].to_list() == target
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import typing
+
+import polars as pl
+import pytest
+
+from polars_evm._helpers import keccak
+from polars_evm._helpers.address_dictionary import AddressDictionary
+from polars_evm._helpers.decoding import decoding_events
+
+
+transfer_abi: dict[str, typing.Any] = {
+    'type': 'event',
+    'name': 'Transfer',
+    'inputs': [
+        {'name': 'from', 'type': 'address', 'indexed': True},
+        {'name': 'to', 'type': 'address', 'indexed': True},
+        {'name': 'value', 'type': 'uint256', 'indexed': False},
+    ],
+}
+transfer_hash = keccak('Transfer(address,address,uint256)', text=True)
+sender = b'\x11' * 20
+receiver = b'\x22' * 20
+
+
+@pytest.fixture
+def events(monkeypatch: pytest.MonkeyPatch) -> pl.DataFrame:
+    monkeypatch.setattr(
+        decoding_events, '_get_event_hash', lambda _: transfer_hash
+    )
+    return pl.DataFrame(
+        {
+            'topic0': [bytes.fromhex(transfer_hash[2:])] * 2,
+            'topic1': [b'\x00' * 12 + sender] * 2,
+            'topic2': [b'\x00' * 12 + receiver] * 2,
+            'topic3': pl.Series([None, None], dtype=pl.Binary),
+            'data': [(5).to_bytes(32, 'big'), (7).to_bytes(32, 'big')],
+        }
+    )
+
+
+def test_decode_events_reuses_plan(events: pl.DataFrame) -> None:
+    decoding_events._get_event_plan.cache_clear()
+    for _ in range(3):
+        decoded = decoding_events.decode_events(events, transfer_abi)
+        assert decoded.to_dict(as_series=False) == {
+            'from': [sender] * 2,
+            'to': [receiver] * 2,
+            'value': [5.0, 7.0],
+        }
+    cache_info = decoding_events._get_event_plan.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
+def test_decode_events_cached_address_ids(events: pl.DataFrame) -> None:
+    dictionary = AddressDictionary()
+    decoded = decoding_events.decode_events(
+        events, transfer_abi, address_dictionary=dictionary
+    )
+    assert decoded['from'].to_list() == [None, None]
+
+    # ids of addresses added after the plan was cached are still used
+    dictionary.extend(pl.Series([sender, receiver]))
+    decoded = decoding_events.decode_events(
+        events, transfer_abi, address_dictionary=dictionary
+    )
+    assert decoded['from'].to_list() == [0, 0]
+    assert decoded['to'].to_list() == [1, 1]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import pytest
+import polars as pl
+import polars_evm  # noqa: F401
+
+
+values = [0, 1, 10**24, 2**128, 2**255 - 1, 2**255, 2**256 - 10**24, 2**256 - 1]
+bounds = [0, 10**24, 2**255 - 1, 2**255, 2**256 - 1, -1, -(10**24), -(2**255)]
+
+
+def _as_signed(value: int) -> int:
+    return value - 2**256 if value >= 2**255 else value
+
+
+@pytest.mark.parametrize('bound', bounds)
+@pytest.mark.parametrize('signed', [False, True])
+def test_u256_comparisons(bound: int, signed: bool) -> None:
+    if (signed and bound >= 2**255) or (not signed and bound < 0):
+        return
+    ints = [_as_signed(value) if signed else value for value in values]
+    df = pl.DataFrame(
+        {'value': [value.to_bytes(32, 'big') for value in values]}
+    )
+    value = pl.col.value
+    output = df.select(
+        gt=value.evm.u256_gt(bound, signed=signed),
+        ge=value.evm.u256_ge(bound, signed=signed),
+        lt=value.evm.u256_lt(bound, signed=signed),
+        le=value.evm.u256_le(bound, signed=signed),
+    )
+    assert output['gt'].to_list() == [item > bound for item in ints]
+    assert output['ge'].to_list() == [item >= bound for item in ints]
+    assert output['lt'].to_list() == [item < bound for item in ints]
+    assert output['le'].to_list() == [item <= bound for item in ints]
+
+
+@pytest.mark.parametrize('signed', [False, True])
+def test_filter_binary_word_range(signed: bool) -> None:
+    ints = [_as_signed(value) if signed else value for value in values]
+    lower = -(10**24) if signed else 1
+    upper = 2**200
+    df = pl.DataFrame(
+        {'value': [value.to_bytes(32, 'big') for value in values]}
+    )
+    df = df.with_columns(hex=pl.col.value.evm.binary_to_hex())
+    target = [item for item in ints if lower < item <= upper]
+
+    between = df.filter(
+        pl.col.value.evm.u256_between(
+            lower, upper, signed=signed, closed='right'
+        )
+    )
+    binary = df.evm.filter_binary(
+        value={'gt': lower, 'le': upper, 'signed': signed}
+    )
+    hex = (
+        df.lazy()
+        .evm.filter_binary(hex={'gt': lower, 'le': upper, 'signed': signed})
+        .collect()
+    )
+    for output in [between, binary, hex]:
+        words = output['value'].to_list()
+        assert [
+            int.from_bytes(word, 'big', signed=signed) for word in words
+        ] == target
+
+
+@pytest.mark.parametrize('signed', [False, True])
+def test_filter_hex_word_range_unnormalized(signed: bool) -> None:
+    ints = [_as_signed(value) if signed else value for value in values]
+    lower = -(10**24) if signed else 1
+    upper = 2**200
+    hexes = [value.to_bytes(32, 'big').hex() for value in values]
+    variants = {
+        'upper': ['0x' + item.upper() for item in hexes],
+        'mixed': ['0X' + item[:32] + item[32:].upper() for item in hexes],
+        'unprefixed': hexes,
+        'unpadded': [hex(value) for value in values],
+    }
+    target = [item for item in ints if lower < item <= upper]
+    for column in variants.values():
+        df = pl.DataFrame({'hex': column})
+        output = df.evm.filter_binary(
+            hex={'gt': lower, 'le': upper, 'signed': signed}
+        )
+        assert [
+            _as_signed(int(item, 16)) if signed else int(item, 16)
+            for item in output['hex']
+        ] == target
+
+
+def test_word_comparisons_require_32_bytes() -> None:
+    word = (5).to_bytes(32, 'big')
+    others = [b'\x00' * 20, word[:31], word + b'\x00', b'', None]
+    df = pl.DataFrame({'value': [word] + others})
+    df = df.with_columns(hex=pl.col.value.evm.binary_to_hex())
+    output = df.select(
+        gt=pl.col.value.evm.u256_gt(1),
+        le=pl.col.value.evm.u256_le(10, signed=True),
+        between=pl.col.value.evm.u256_between(1, 10),
+    )
+    for column in output.columns:
+        assert output[column].to_list() == [True] + [None] * len(others)
+
+    for column in ['value', 'hex']:
+        filtered = df.evm.filter_binary(**{column: {'gt': 1, 'le': 10}})
+        assert filtered['value'].to_list() == [word]
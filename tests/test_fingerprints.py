@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+import polars as pl
+import polars_evm  # noqa: F401
+
+
+hashes = [bytes([i]) * 8 + bytes([255 - i]) * 24 for i in range(4)]
+
+
+@pytest.mark.parametrize('offset', [0, 8, 24])
+def test_fingerprint64(offset: int) -> None:
+    series = pl.Series('hash', hashes + [None, b'\x01'])
+    output = series.evm.fingerprint64(offset=offset)
+    assert output.dtype == pl.UInt64
+    target = [
+        int.from_bytes(value[offset : offset + 8], 'little') for value in hashes
+    ]
+    assert output.to_list() == target + [None, None]
+
+    df = series.to_frame().select(pl.col.hash.evm.fingerprint64(offset=offset))
+    assert df['hash'].to_list() == target + [None, None]
+
+
+def test_fingerprint64_collisions() -> None:
+    colliding = pl.Series([hashes[0], hashes[0][:8] + bytes(24), hashes[0]])
+    colliding.evm.fingerprint64(offset=8, check_collisions=True)
+    with pytest.raises(Exception, match='share 64 bit fingerprints'):
+        colliding.evm.fingerprint64(check_collisions=True)
+    with pytest.raises(Exception, match='share 64 bit fingerprints'):
+        colliding.to_frame('hash').select(
+            pl.col.hash.evm.fingerprint64(check_collisions=True)
+        )
+
+
+@pytest.mark.parametrize('how', ['inner', 'left'])
+def test_join_on_hash(how: str) -> None:
+    collision = hashes[1][:8] + bytes(24)
+    logs = pl.DataFrame(
+        {
+            'transaction_hash': [hashes[1], hashes[0], None, collision],
+            'log_index': [0, 1, 2, 3],
+        }
+    )
+    for right_hashes in [hashes[:3], hashes[:3] + [collision]]:
+        transactions = pl.DataFrame(
+            {
+                'transaction_hash': right_hashes,
+                'value': list(range(len(right_hashes))),
+            }
+        )
+        target = logs.join(
+            transactions, on='transaction_hash', how=how, maintain_order='left'
+        )
+        output = logs.evm.join_on_hash(
+            transactions, on='transaction_hash', how=how
+        )
+        assert output.sort('log_index').equals(target.sort('log_index'))
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import pytest
+import polars as pl
+import polars_evm
+from polars_evm._helpers import keccak
+
+
+# lengths around the 136 byte block size
+lengths = [0, 1, 20, 32, 64, 135, 136, 137, 271, 272, 1000]
+values = [bytes((i * 7 + n) % 256 for i in range(n)) for n in lengths]
+
+
+@pytest.mark.parametrize('output', ['hex', 'binary', 'prefix_hex', 'raw_hex'])
+def test_keccak_series(output: str) -> None:
+    series = pl.Series('data', values + [None])
+    target = [keccak(value, output=output) for value in values]
+    assert series.evm.keccak(output=output).to_list() == target + [None]
+
+    hexes = series.evm.binary_to_hex()
+    assert hexes.evm.keccak(output=output).to_list() == target + [None]
+
+
+def test_keccak_text() -> None:
+    texts = ['Transfer(address,address,uint256)', '', 'ünïcödé']
+    target = [keccak(text, text=True) for text in texts]
+    df = pl.LazyFrame({'text': texts}).select(pl.col.text.evm.keccak(text=True))
+    assert df.collect_schema()['text'] == pl.String
+    assert df.collect()['text'].to_list() == target
+
+
+@pytest.mark.parametrize('max_size', [0, 2, 100])
+def test_keccak_cache(max_size: int) -> None:
+    polars_evm.set_keccak_cache_size(max_size)
+    polars_evm.clear_keccak_cache()
+    try:
+        repeated = values[:4] * 3 + [None]
+        target = [keccak(value) for value in values[:4]] * 3 + [None]
+        series = pl.Series('data', repeated)
+        assert series.evm.keccak().to_list() == target
+        assert series.evm.keccak().to_list() == target
+
+        info = polars_evm.keccak_cache_info()
+        assert info['size'] == min(max_size, 4)
+        assert info['max_size'] == max_size
+        if max_size == 0:
+            assert info['hits'] == 0 and info['misses'] == 0
+        else:
+            assert info['hits'] + info['misses'] == 8
+            assert info['hits'] == min(max_size, 4)
+    finally:
+        polars_evm.set_keccak_cache_size(2**20)
+        polars_evm.clear_keccak_cache()
+
+
+def test_keccak_cache_derived_hashes() -> None:
+    polars_evm.clear_keccak_cache()
+    try:
+        holder = bytes.fromhex('c36442b4a4522e871399cd717abdd847ab11fe88')
+        keys = pl.Series('holder', [holder] * 5 + [b'\x01' * 20])
+        first = keys.evm.mapping_slot(slot=3)
+        assert keys.evm.mapping_slot(slot=3).to_list() == first.to_list()
+
+        # each distinct key is hashed once and then served from the cache
+        info = polars_evm.keccak_cache_info()
+        assert info['misses'] == 2
+        assert info['hits'] == 2
+    finally:
+        polars_evm.clear_keccak_cache()
+
+
+def test_keccak_cache_threads() -> None:
+    import concurrent.futures
+
+    polars_evm.clear_keccak_cache()
+    try:
+        data = [i.to_bytes(8, 'big') for i in range(20_000)]
+        series = pl.Series('data', data)
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            futures = [executor.submit(series.evm.keccak) for _ in range(8)]
+            outputs = [future.result() for future in futures]
+        assert polars_evm.keccak_cache_info()['size'] == len(data)
+        target = series.evm.keccak()
+        assert len(target) == len(data)
+        assert target.to_list()[:3] == [keccak(value) for value in data[:3]]
+        for output in outputs:
+            assert output.equals(target)
+    finally:
+        polars_evm.clear_keccak_cache()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+import polars as pl
+import polars_evm  # noqa: F401
+from polars_evm._helpers import keccak
+
+
+def hash_pair(a: bytes, b: bytes, sorted_pairs: bool) -> bytes:
+    if sorted_pairs and b < a:
+        a, b = b, a
+    return keccak(a + b, output='binary')
+
+
+def merkle_levels(leaves: list[bytes], sorted_pairs: bool) -> list[list[bytes]]:
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        levels.append(
+            [
+                hash_pair(level[i], level[i + 1], sorted_pairs)
+                if i + 1 < len(level)
+                else level[i]
+                for i in range(0, len(level), 2)
+            ]
+        )
+    return levels
+
+
+def merkle_proof(
+    leaves: list[bytes], index: int, sorted_pairs: bool
+) -> list[bytes]:
+    proof = []
+    for level in merkle_levels(leaves, sorted_pairs)[:-1]:
+        if index ^ 1 < len(level):
+            proof.append(level[index ^ 1])
+        index //= 2
+    return proof
+
+
+group_sizes = {'b': 7, 'a': 1, 'c': 16, 'd': 5}
+rows = [
+    (group, keccak(group + str(i), output='binary', text=True))
+    for i in range(16)
+    for group, size in group_sizes.items()
+    if i < size
+]
+df = pl.DataFrame(rows, schema=['distribution', 'leaf'], orient='row')
+
+
+@pytest.mark.parametrize('sorted_pairs', [True, False])
+def test_merkle_root(sorted_pairs: bool) -> None:
+    output = df.evm.merkle_root(
+        'leaf', group_by='distribution', sorted_pairs=sorted_pairs
+    )
+    assert output['distribution'].to_list() == ['a', 'b', 'c', 'd']
+    for group, root in output.iter_rows():
+        leaves = [leaf for name, leaf in rows if name == group]
+        assert root == merkle_levels(leaves, sorted_pairs)[-1][0]
+
+    ungrouped = df.evm.merkle_root('leaf', sorted_pairs=sorted_pairs)
+    leaves = [leaf for _, leaf in rows]
+    assert ungrouped.to_series().to_list() == [
+        merkle_levels(leaves, sorted_pairs)[-1][0]
+    ]
+
+
+@pytest.mark.parametrize('sorted_pairs', [True, False])
+def test_merkle_proofs(sorted_pairs: bool) -> None:
+    output = df.evm.merkle_proofs(
+        'leaf', group_by='distribution', sorted_pairs=sorted_pairs
+    )
+    assert output.columns == ['distribution', 'leaf', 'merkle_proof']
+    for group, leaf, proof in output.iter_rows():
+        leaves = [leaf for name, leaf in rows if name == group]
+        index = leaves.index(leaf)
+        assert proof == merkle_proof(leaves, index, sorted_pairs)
+
+    with pytest.raises(Exception, match='must be non-null 32 byte'):
+        df.with_columns(leaf=pl.lit(b'\x01')).evm.merkle_proofs('leaf')
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+import polars as pl
+import polars_evm  # noqa: F401
+from polars_evm._helpers import keccak
+
+
+addresses = [bytes([i]) * 20 for i in range(1, 4)]
+
+
+def word(value: int) -> bytes:
+    return (value % 2**256).to_bytes(32, 'big')
+
+
+def hash_words(*parts: bytes) -> bytes:
+    return keccak(b''.join(parts), output='binary')
+
+
+@pytest.mark.parametrize(
+    'key_type,keys,encoded',
+    [
+        ('address', addresses, [bytes(12) + value for value in addresses]),
+        ('uint256', [0, 1, 2**62], [word(0), word(1), word(2**62)]),
+        ('int32', [-1, 5, -(2**31)], [word(-1), word(5), word(-(2**31))]),
+        ('bool', [True, False], [word(1), word(0)]),
+        ('bytes4', [b'\xaa\xbb\xcc\xdd'], [b'\xaa\xbb\xcc\xdd' + bytes(28)]),
+        ('string', ['hello', ''], [b'hello', b'']),
+    ],
+)
+def test_mapping_slot(
+    key_type: str, keys: list[object], encoded: list[bytes]
+) -> None:
+    target = [hash_words(key, word(3)) for key in encoded]
+    series = pl.Series('key', keys + [None])
+    output = series.evm.mapping_slot(3, key_type)
+    assert output.to_list() == target + [None]
+
+    df = series.to_frame().select(pl.col.key.evm.mapping_slot(3, key_type))
+    assert df['key'].to_list() == target + [None]
+
+
+def test_nested_mapping_slot() -> None:
+    df = pl.DataFrame({'owner': addresses, 'spender': addresses[::-1]})
+    target = [
+        hash_words(bytes(12) + spender, hash_words(bytes(12) + owner, word(1)))
+        for owner, spender in zip(addresses, addresses[::-1])
+    ]
+    output = df.lazy().select(
+        pl.col.owner.evm.nested_mapping_slot([pl.col.spender], slot=1)
+    )
+    assert output.collect()['owner'].to_list() == target
+    series = df['owner'].evm.nested_mapping_slot([df['spender']], slot=1)
+    assert series.to_list() == target
+
+
+@pytest.mark.parametrize('element_words', [1, 3, 2**64 - 1])
+def test_array_element_slot(element_words: int) -> None:
+    indices = [0, 1, 2**64 - 1, None]
+    base = int.from_bytes(hash_words(word(7)), 'big')
+    target = [word(base + index * element_words) for index in indices[:-1]]
+    series = pl.Series('index', indices, dtype=pl.UInt64)
+    output = series.evm.array_element_slot(7, element_words)
+    assert output.to_list() == target + [None]
+
+    # arrays stored in mappings use the mapping slot as their slot
+    mapping_slot = hash_words(bytes(12) + addresses[0], word(2))
+    base = int.from_bytes(hash_words(mapping_slot), 'big')
+    target = [word(base + index * element_words) for index in indices[:-1]]
+    df = series.to_frame().select(
+        pl.col.index.evm.array_element_slot(
+            pl.lit(addresses[0]).evm.mapping_slot(2), element_words
+        )
+    )
+    assert df['index'].to_list() == target + [None]